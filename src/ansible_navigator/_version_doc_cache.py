@@ -12,4 +12,4 @@
    not a bad idea to minimize the amount of stale docs in the user's cache
 """
 
-__version_collection_doc_cache__ = "1.0"
+__version_collection_doc_cache__ = "1.1"
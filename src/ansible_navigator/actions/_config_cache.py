@@ -0,0 +1,81 @@
+"""A cache of the merged ``ansible-config list`` and ``dump`` output."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+
+from pathlib import Path
+from typing import Any
+
+from ansible_navigator.utils.key_value_store import KeyValueStore
+
+
+CACHE_FILE_NAME = "ansible_config_cache.db"
+"""The name of the configuration cache in the cache path"""
+
+CACHE_ENTRIES = 10
+"""The number of configurations kept, the most recently written are kept"""
+
+
+def config_cache_key(runtime: str, config_text: bytes, environment: dict[str, Any]) -> str:
+    """Create the key for a configuration.
+
+    :param runtime: The identity of the ansible installation, for example the image id
+    :param config_text: The content of the ansible configuration file
+    :param environment: The environment variables, settings and paths affecting the
+        configuration
+    :returns: The key for the configuration
+    """
+    digest = hashlib.sha256(runtime.encode())
+    digest.update(hashlib.sha256(config_text).digest())
+    digest.update(json.dumps(environment, sort_keys=True, default=str).encode())
+    return digest.hexdigest()
+
+
+class ConfigCache:
+    """A cache of the merged ansible configuration."""
+
+    def __init__(self, cache_path: str | Path):
+        """Initialize the configuration cache.
+
+        :param cache_path: The path to the ansible-navigator cache directory
+        """
+        self._logger = logging.getLogger(__name__)
+        self._path = Path(cache_path) / CACHE_FILE_NAME
+
+    def get(self, key: str) -> list[dict[str, Any]] | None:
+        """Get a cached configuration.
+
+        :param key: The key for the configuration
+        :returns: The configuration or None if it has not been cached
+        """
+        store = KeyValueStore(self._path)
+        try:
+            cached = store.get(key)
+        finally:
+            store.close()
+        if cached is None:
+            self._logger.debug("No cached ansible configuration for %s", key)
+            return None
+        self._logger.debug("Using cached ansible configuration for %s", key)
+        return json.loads(cached)
+
+    def set(self, key: str, config: list[dict[str, Any]]) -> None:
+        """Cache a configuration, removing those written least recently.
+
+        Using a cached configuration does not keep it, the configurations written most
+        recently are kept.
+
+        :param key: The key for the configuration
+        :param config: The merged configuration
+        """
+        store = KeyValueStore(self._path)
+        try:
+            with store.transaction():
+                store[key] = json.dumps(config, default=str)
+                store.prune(keep=CACHE_ENTRIES)
+        finally:
+            store.close()
+        self._logger.debug("Cached ansible configuration for %s", key)
@@ -0,0 +1,172 @@
+"""An index of the groups and hosts of an inventory, for browsing large inventories.
+
+The output of ``ansible-inventory --list`` is indexed once, when collected. The hosts and
+children of each group are sorted, the parents of each group recorded and the menu rows for
+a group built only on the first visit. A host's menu row references the host's variables
+rather than copying them.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from collections.abc import MutableMapping
+from typing import Any
+
+
+class HostRow(MutableMapping):
+    """A menu row for a host, a view of the host's variables.
+
+    The row's name is the host name and the keys common to the rows of a menu, for
+    example the type, are shared between them. Values set on the row, for example a
+    progress bar, are kept with the row, leaving the host's variables unchanged.
+    """
+
+    __slots__ = ("_host_vars", "_own", "_shared")
+
+    def __init__(self, host_vars: dict[str, Any], shared: dict[str, Any]) -> None:
+        """Initialize the host row.
+
+        :param host_vars: The host's variables, including ``inventory_hostname``
+        :param shared: The keys and values common to each row in the menu
+        """
+        self._host_vars = host_vars
+        self._shared = shared
+        self._own: dict[str, Any] | None = None
+
+    @property
+    def host_vars(self) -> dict[str, Any]:
+        """Return the host's variables.
+
+        :returns: The host's variables
+        """
+        return self._host_vars
+
+    def __getitem__(self, key: str) -> Any:
+        """Get a value from the row.
+
+        :param key: The key
+        :returns: The value
+        """
+        if self._own is not None and key in self._own:
+            return self._own[key]
+        if key in self._shared:
+            return self._shared[key]
+        if key == "__name":
+            return self._host_vars["inventory_hostname"]
+        return self._host_vars[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        """Set a value in the row.
+
+        :param key: The key
+        :param value: The value
+        """
+        if self._own is None:
+            self._own = {}
+        self._own[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        """Remove a value set in the row.
+
+        :param key: The key
+        :raises KeyError: If the value was not set in the row
+        """
+        if self._own is None:
+            raise KeyError(key)
+        del self._own[key]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the keys of the row.
+
+        :yields: Each key
+        """
+        yield from self._host_vars
+        extra = {"__name": None, **self._shared, **(self._own or {})}
+        yield from (key for key in extra if key not in self._host_vars)
+
+    def __len__(self) -> int:
+        """Count the keys of the row.
+
+        :returns: The number of keys
+        """
+        return sum(1 for _key in self)
+
+    def __repr__(self) -> str:
+        """Represent the row.
+
+        :returns: The row as a dictionary
+        """
+        return repr(dict(self))
+
+
+class InventoryIndex:
+    """An index of the groups and hosts of an inventory."""
+
+    def __init__(self, inventory: dict[str, Any]) -> None:
+        """Initialize the inventory index.
+
+        :param inventory: The output of ``ansible-inventory --list``
+        """
+        meta_host_vars = inventory.get("_meta", {}).get("hostvars", {})
+        self.host_vars: dict[str, dict[str, Any]] = {
+            host: {**host_vars, "inventory_hostname": host}
+            for host, host_vars in meta_host_vars.items()
+        }
+        self.hosts: dict[str, tuple[str, ...]] = {}
+        self.children: dict[str, tuple[str, ...]] = {}
+        self.parents: dict[str, tuple[str, ...]] = {}
+        parents: dict[str, list[str]] = {}
+        for group, details in inventory.items():
+            if group == "_meta":
+                continue
+            hosts = details.get("hosts", [])
+            for host in hosts:
+                if host not in self.host_vars:
+                    self.host_vars[host] = {"inventory_hostname": host}
+            self.hosts[group] = tuple(sorted(hosts))
+            self.children[group] = tuple(sorted(details.get("children", [])))
+            for child in self.children[group]:
+                parents.setdefault(child, []).append(group)
+        self.parents = {group: tuple(sorted(groups)) for group, groups in parents.items()}
+        self._group_rows: dict[tuple[str, str, tuple[str, ...]], list[Any]] = {}
+        self._host_rows: list[HostRow] | None = None
+
+    def __contains__(self, group: str) -> bool:
+        """Determine if a group is in the inventory.
+
+        :param group: The name of the group
+        :returns: An indication of the group being in the inventory
+        """
+        return group in self.hosts
+
+    def group_rows(self, group: str, taxonomy: str, columns: list[str]) -> list[Any]:
+        """Get the menu rows for a group, its hosts then its children.
+
+        :param group: The name of the group
+        :param taxonomy: The path of groups to this group
+        :param columns: The host variables shown as columns
+        :returns: The menu rows, built on the first request
+        """
+        key = (group, taxonomy, tuple(columns))
+        rows = self._group_rows.get(key)
+        if rows is None:
+            hosts = self.hosts[group]
+            shared = {"__taxonomy": taxonomy, "__type": "host"}
+            rows = [HostRow(self.host_vars[host], shared) for host in hosts]
+            for child in self.children[group]:
+                row = {"__name": child, "__taxonomy": taxonomy, "__type": "group"}
+                if hosts:
+                    row.update({column: "" for column in columns})
+                rows.append(row)
+            self._group_rows[key] = rows
+        return rows
+
+    def host_rows(self) -> list[HostRow]:
+        """Get the menu rows for every host.
+
+        :returns: The menu rows, built on the first request
+        """
+        if self._host_rows is None:
+            shared = {"__type": "host"}
+            self._host_rows = [HostRow(host_vars, shared) for host_vars in self.host_vars.values()]
+        return self._host_rows
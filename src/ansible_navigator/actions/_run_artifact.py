@@ -0,0 +1,655 @@
+"""Playbook artifact helpers for the ``run`` action.
+
+When streaming is enabled, each runner message is appended to a JSON lines
+journal as it is handled, so the playbook's events are on disk even if
+the run is interrupted. When the playbook completes, the artifact is
+written in the usual layout and the journal removed.
+
+The artifact is not compacted from the journal. It is written from the plays
+and stdout held in memory, which the user interface needs during the run,
+with each play, task and stdout line serialized and written on its own to a
+temporary file renamed once complete. Writing the artifact at exit still
+takes time in proportion to the run, and streaming adds the serialization of
+each message to the journal.
+
+Each line of the journal is one record:
+
+- ``{"record": "header", "version": ..., "settings_entries": ..., "settings_sources": ...}``
+- ``{"record": "message", "message": ...}``, one per runner message
+- ``{"record": "status", "status": ..., "status_color": ...}``, once the run has finished
+
+For each artifact an index is written to the ``artifact_index`` directory
+of the cache path, holding the plays without their tasks and the byte offsets
+of each play's task list and of the stdout within the artifact. Replay uses
+the index to show the plays without loading the artifact, reading tasks and
+stdout when needed. When an artifact has no index, or the index is out of
+date, for example because the artifact was copied from elsewhere, the index
+is built by scanning the artifact once, without parsing the task lists or the
+stdout. The most recently written ``INDEXES_KEPT`` indexes are kept.
+
+Artifacts saved with a compression file extension, for example
+``.json.gz``, are compressed and written without an index.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import re
+
+from collections.abc import Callable
+from collections.abc import Iterator
+from pathlib import Path
+from typing import IO
+from typing import Any
+
+from ansible_navigator.content_defs import ContentView
+from ansible_navigator.content_defs import SerializationFormat
+from ansible_navigator.utils.serialize import COMPRESSION_OPENERS
+from ansible_navigator.utils.serialize import JsonParams
+from ansible_navigator.utils.serialize import is_compressed
+from ansible_navigator.utils.serialize import open_file
+from ansible_navigator.utils.serialize import serialize_write_file
+
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_VERSION = "2.0.0"
+"""The version of the playbook artifact layout"""
+
+INDEX_VERSION = "1.0.0"
+"""The version of the playbook artifact index layout"""
+
+INDENT = " " * JsonParams().indent
+"""One level of indentation in the playbook artifact"""
+
+INDEX_DIRECTORY = "artifact_index"
+"""The directory within the cache path where the artifact indexes are written"""
+
+INDEXES_KEPT = 100
+"""The number of artifact indexes kept, the least recently written are removed"""
+
+INDEX_KEYS = ("version", "status", "status_color")
+"""The top level keys of the playbook artifact held in the index"""
+
+_WHITESPACE = re.compile(rb"[ \t\n\r]*")
+_STRING = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+_NESTED = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|[{}\[\]]', re.DOTALL)
+_SCALAR = re.compile(rb"[^,}\] \t\n\r]+")
+
+
+def _base_name(artifact_file: str) -> str:
+    """Remove the ``.json`` and any compression extension from an artifact file path.
+
+    :param artifact_file: The playbook artifact file path
+    :returns: The artifact file path without the extensions
+    """
+    suffix = Path(artifact_file).suffix
+    if suffix in COMPRESSION_OPENERS:
+        artifact_file = artifact_file[: -len(suffix)]
+    return artifact_file[: -len(".json")] if artifact_file.endswith(".json") else artifact_file
+
+
+def journal_path(artifact_file: str) -> Path:
+    """Determine the journal file path for a playbook artifact.
+
+    :param artifact_file: The playbook artifact file path
+    :returns: The journal file path, the artifact path with a ``.jsonl`` extension
+    """
+    return Path(f"{_base_name(artifact_file)}.jsonl")
+
+
+def index_path(artifact_file: str, cache_path: Path) -> Path:
+    """Determine the index file path for a playbook artifact.
+
+    :param artifact_file: The playbook artifact file path
+    :param cache_path: The cache path of the application
+    :returns: The index file path, named for the real path of the artifact
+    """
+    key = hashlib.sha256(os.path.realpath(artifact_file).encode("utf-8")).hexdigest()
+    return cache_path / INDEX_DIRECTORY / f"{key}.json"
+
+
+def _prune_indexes(index_directory: Path) -> None:
+    """Remove the least recently written artifact indexes, beyond ``INDEXES_KEPT``.
+
+    :param index_directory: The directory of the artifact indexes
+    """
+    indexes = []
+    for path in index_directory.glob("*.json"):
+        try:
+            indexes.append((path.stat().st_mtime_ns, path))
+        except OSError:
+            continue
+    for _mtime, path in sorted(indexes, reverse=True)[INDEXES_KEPT:]:
+        path.unlink(missing_ok=True)
+
+
+def is_journal(file_name: str) -> bool:
+    """Determine if a file is a playbook artifact journal.
+
+    :param file_name: The file to check
+    :returns: True if the first line of the file is a journal header
+    """
+    with open_file(file_name) as fh:
+        first_line = fh.readline()
+    try:
+        record = json.loads(first_line)
+    except json.JSONDecodeError:
+        return False
+    return isinstance(record, dict) and record.get("record") == "header"
+
+
+def read_journal(file_name: str) -> Iterator[dict[str, Any]]:
+    """Read the records of a playbook artifact journal.
+
+    A partially written last line, from an interrupted run, is ignored.
+
+    :param file_name: The journal file
+    :yields: The journal records
+    """
+    with open(file_name, encoding="utf-8") as fh:
+        for line in fh:
+            if not line.endswith("\n"):
+                logger.warning("Ignoring incomplete last record in journal '%s'", file_name)
+                return
+            yield json.loads(line)
+
+
+class ArtifactJournal:
+    """Append the runner messages of a playbook run to a journal file."""
+
+    def __init__(
+        self,
+        path: Path,
+        settings_entries: dict[str, Any],
+        settings_sources: dict[str, str],
+    ) -> None:
+        """Initialize the journal and write the header record.
+
+        :param path: The journal file path
+        :param settings_entries: The effective settings for the run
+        :param settings_sources: The sources of the settings for the run
+        """
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fh: IO | None = self.path.open(mode="w", encoding="utf-8")
+        self._write(
+            {
+                "record": "header",
+                "version": ARTIFACT_VERSION,
+                "settings_entries": settings_entries,
+                "settings_sources": settings_sources,
+            },
+        )
+        self.flush()
+
+    def append(self, message: dict[str, Any]) -> None:
+        """Append a runner message to the journal.
+
+        :param message: The message from runner
+        """
+        self._write({"record": "message", "message": message})
+
+    def flush(self) -> None:
+        """Flush the appended records to disk."""
+        if self._fh is not None:
+            self._fh.flush()
+
+    def close(self, status: str, status_color: int) -> None:
+        """Write the final status record and close the journal.
+
+        :param status: The status of the run
+        :param status_color: The color of the status
+        """
+        if self._fh is None:
+            return
+        self._write({"record": "status", "status": status, "status_color": status_color})
+        self._fh.close()
+        self._fh = None
+
+    def remove(self) -> None:
+        """Remove the journal, once the artifact has been written from it."""
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+        self.path.unlink(missing_ok=True)
+
+    def _write(self, record: dict[str, Any]) -> None:
+        """Write one record to the journal.
+
+        :param record: The record to write
+        """
+        if self._fh is None:
+            return
+        self._fh.write(json.dumps(record, ensure_ascii=False, default=str))
+        self._fh.write("\n")
+
+
+def write_indexed_artifact(content: dict[str, Any], file: Path, cache_path: Path) -> None:
+    """Write a playbook artifact and its index.
+
+    The artifact is identical to one written with ``serialize_write_file``,
+    but is written in parts so the offsets of each play's task list and the
+    stdout can be recorded. A compressed artifact can not be read from an
+    offset, so it is written with ``serialize_write_file`` and without an index.
+
+    The artifact is written to a temporary file, renamed once complete, so an
+    existing artifact is not replaced by a partially written one.
+
+    :param content: The playbook artifact content
+    :param file: The file to write the artifact to
+    :param cache_path: The cache path of the application, for the index
+    :raises TypeError: If the content can not be serialized
+    :raises ValueError: If the content can not be serialized
+    """
+    index_file = index_path(str(file), cache_path)
+    partial = file.with_name(f".partial-{file.name}")
+    try:
+        if is_compressed(file):
+            serialize_write_file(
+                content=content,
+                content_view=ContentView.NORMAL,
+                file_mode="w",
+                file=partial,
+                serialization_format=SerializationFormat.JSON,
+            )
+            index = None
+        else:
+            index = _write_artifact(content=content, file=partial)
+        os.replace(partial, file)
+    except (OSError, TypeError, ValueError):
+        partial.unlink(missing_ok=True)
+        raise
+
+    if index is None:
+        index_file.unlink(missing_ok=True)
+        return
+    _save_index(index=index, artifact_file=str(file), stat=file.stat(), index_file=index_file)
+
+
+def _save_index(
+    index: dict[str, Any],
+    artifact_file: str,
+    stat: os.stat_result,
+    index_file: Path,
+) -> None:
+    """Save the index of a playbook artifact, noting the artifact it is current for.
+
+    :param index: The index of the artifact
+    :param artifact_file: The playbook artifact file path
+    :param stat: The status of the artifact file the index was made from
+    :param index_file: The file to write the index to
+    """
+    index.update(
+        {
+            "artifact_file": os.path.realpath(artifact_file),
+            "artifact_size": stat.st_size,
+            "artifact_mtime_ns": stat.st_mtime_ns,
+        },
+    )
+    try:
+        index_file.parent.mkdir(parents=True, exist_ok=True)
+        with index_file.open(mode="w", encoding="utf-8") as fh:
+            json.dump(index, fh, ensure_ascii=False)
+        _prune_indexes(index_file.parent)
+    except OSError as exc:
+        logger.warning("Writing the index for artifact %s failed: %s", artifact_file, exc)
+
+
+def _write_artifact(content: dict[str, Any], file: Path) -> dict[str, Any]:
+    """Write a playbook artifact, recording the offsets of the task lists and stdout.
+
+    Each play, task and stdout line is serialized and written on its own, so the JSON of
+    a whole task list or of the stdout is never held in memory.
+
+    :param content: The playbook artifact content
+    :param file: The file to write the artifact to
+    :returns: The index of the artifact
+    """
+    index: dict[str, Any] = {
+        "version": INDEX_VERSION,
+        "artifact_version": content["version"],
+        "status": content["status"],
+        "status_color": content["status_color"],
+        "plays": [],
+        "stdout": None,
+    }
+    offset = 0
+
+    with file.open(mode="wb") as fh:
+
+        def write(text: str) -> None:
+            nonlocal offset
+            data = text.encode("utf-8")
+            fh.write(data)
+            offset += len(data)
+
+        def write_value(value: Any, level: int) -> tuple[int, int]:
+            start = offset
+            write(json.dumps(value, **JsonParams()._asdict()).replace("\n", "\n" + INDENT * level))
+            return start, offset - start
+
+        def write_list(values: list[Any], level: int) -> tuple[int, int]:
+            start = offset
+            if not values:
+                write("[]")
+                return start, offset - start
+            write("[")
+            for number, value in enumerate(values):
+                write(f"{',' if number else ''}\n{INDENT * (level + 1)}")
+                write_value(value, level + 1)
+            write(f"\n{INDENT * level}]")
+            return start, offset - start
+
+        def write_key(key: str, number: int, level: int) -> None:
+            separator = "," if number else ""
+            key_json = json.dumps(key, ensure_ascii=False)
+            write(f"{separator}\n{INDENT * level}{key_json}: ")
+
+        write("{")
+        for number, key in enumerate(sorted(content)):
+            write_key(key, number, 1)
+            if key == "plays" and content["plays"] and all(content["plays"]):
+                write("[")
+                for play_number, play in enumerate(content["plays"]):
+                    write(f"{',' if play_number else ''}\n{INDENT * 2}{{")
+                    entry: dict[str, Any] = {"play": {}, "tasks": None}
+                    for key_number, play_key in enumerate(sorted(play)):
+                        write_key(play_key, key_number, 3)
+                        if play_key == "tasks" and isinstance(play["tasks"], list):
+                            entry["tasks"] = write_list(play["tasks"], 3)
+                        else:
+                            location = write_value(play[play_key], 3)
+                            if play_key == "tasks":
+                                entry["tasks"] = location
+                            else:
+                                entry["play"][play_key] = play[play_key]
+                    write(f"\n{INDENT * 2}}}")
+                    index["plays"].append(entry)
+                write(f"\n{INDENT}]")
+            elif key == "stdout" and isinstance(content["stdout"], list):
+                index["stdout"] = write_list(content["stdout"], 1)
+            else:
+                write_value(content[key], 1)
+        write("\n}\n")
+    return index
+
+
+def _skip_whitespace(data: mmap.mmap, position: int) -> int:
+    """Skip any whitespace in a JSON document.
+
+    :param data: The JSON document
+    :param position: The byte offset to start from
+    :returns: The byte offset of the next character other than whitespace
+    """
+    match = _WHITESPACE.match(data, position)
+    return position if match is None else match.end()
+
+
+def _expect(data: mmap.mmap, position: int, token: bytes) -> int:
+    """Skip a structural character in a JSON document, after any whitespace.
+
+    :param data: The JSON document
+    :param position: The byte offset to start from
+    :param token: The structural character expected
+    :returns: The byte offset after the character
+    :raises ValueError: If the character is not found
+    """
+    position = _skip_whitespace(data, position)
+    if data[position : position + 1] != token:
+        msg = f"Expected {token!r} at offset {position}"
+        raise ValueError(msg)
+    return position + 1
+
+
+def _skip_value(data: mmap.mmap, position: int) -> int:
+    """Skip one value in a JSON document without parsing it.
+
+    :param data: The JSON document
+    :param position: The byte offset of the value
+    :returns: The byte offset after the value
+    :raises ValueError: If the value is incomplete
+    """
+    first = data[position : position + 1]
+    if first in (b"{", b"["):
+        depth = 0
+        for match in _NESTED.finditer(data, position):
+            token = match.group()
+            if token in (b"{", b"["):
+                depth += 1
+            elif token in (b"}", b"]"):
+                depth -= 1
+                if depth == 0:
+                    return match.end()
+    else:
+        match = (_STRING if first == b'"' else _SCALAR).match(data, position)
+        if match is not None:
+            return match.end()
+    msg = f"Incomplete value at offset {position}"
+    raise ValueError(msg)
+
+
+def _scan_object(data: mmap.mmap, position: int, scan_value: Callable[[str, int], int]) -> int:
+    """Scan the members of a JSON object.
+
+    :param data: The JSON document
+    :param position: The byte offset of the object
+    :param scan_value: Called with each key and the byte offset of its value, returning the
+        byte offset after the value
+    :returns: The byte offset after the object
+    :raises ValueError: If the object is malformed
+    """
+    position = _skip_whitespace(data, _expect(data, position, b"{"))
+    if data[position : position + 1] == b"}":
+        return position + 1
+    while True:
+        start = _skip_whitespace(data, position)
+        if data[start : start + 1] != b'"':
+            msg = f"Expected a key at offset {start}"
+            raise ValueError(msg)
+        end = _skip_value(data, start)
+        key = json.loads(data[start:end])
+        position = _skip_whitespace(data, _expect(data, end, b":"))
+        position = _skip_whitespace(data, scan_value(key, position))
+        if data[position : position + 1] == b"}":
+            return position + 1
+        position = _expect(data, position, b",")
+
+
+def _scan_array(data: mmap.mmap, position: int, scan_item: Callable[[int], int]) -> int:
+    """Scan the items of a JSON array.
+
+    :param data: The JSON document
+    :param position: The byte offset of the array
+    :param scan_item: Called with the byte offset of each item, returning the byte offset
+        after the item
+    :returns: The byte offset after the array
+    """
+    position = _skip_whitespace(data, _expect(data, position, b"["))
+    if data[position : position + 1] == b"]":
+        return position + 1
+    while True:
+        position = _skip_whitespace(data, scan_item(_skip_whitespace(data, position)))
+        if data[position : position + 1] == b"]":
+            return position + 1
+        position = _expect(data, position, b",")
+
+
+def _scan_artifact(artifact_file: str) -> dict[str, Any]:
+    """Build the index of a playbook artifact by scanning it once.
+
+    The task lists and the stdout are skipped over, recording their byte offsets, only
+    the other keys of each play and the keys in ``INDEX_KEYS`` are parsed.
+
+    :param artifact_file: The playbook artifact file path
+    :returns: The index of the artifact
+    :raises ValueError: If the artifact is malformed or not a playbook artifact
+    """
+    index: dict[str, Any] = {"version": INDEX_VERSION, "plays": [], "stdout": None}
+    found: dict[str, Any] = {}
+
+    with open(artifact_file, mode="rb") as fh, mmap.mmap(
+        fh.fileno(),
+        0,
+        access=mmap.ACCESS_READ,
+    ) as data:
+
+        def scan_play(position: int) -> int:
+            entry: dict[str, Any] = {"play": {}, "tasks": None}
+
+            def scan_play_value(key: str, start: int) -> int:
+                end = _skip_value(data, start)
+                if key == "tasks":
+                    entry["tasks"] = (start, end - start)
+                else:
+                    entry["play"][key] = json.loads(data[start:end])
+                return end
+
+            end = _scan_object(data, position, scan_play_value)
+            index["plays"].append(entry)
+            return end
+
+        def scan_value(key: str, start: int) -> int:
+            if key == "plays":
+                end = _scan_array(data, start, scan_play)
+            else:
+                end = _skip_value(data, start)
+            if key == "stdout":
+                index["stdout"] = (start, end - start)
+            if key in INDEX_KEYS:
+                found[key] = json.loads(data[start:end])
+            found.setdefault(key, None)
+            return end
+
+        end = _scan_object(data, 0, scan_value)
+        if _skip_whitespace(data, end) != len(data):
+            msg = f"Unexpected content at offset {end}"
+            raise ValueError(msg)
+
+    missing = {*INDEX_KEYS, "plays", "stdout"} - found.keys()
+    if missing:
+        msg = f"Not a playbook artifact, missing {', '.join(sorted(missing))}"
+        raise ValueError(msg)
+    index.update(
+        {
+            "artifact_version": found["version"],
+            "status": found["status"],
+            "status_color": found["status_color"],
+        },
+    )
+    return index
+
+
+class IndexedArtifact:
+    """A playbook artifact read when needed using its index."""
+
+    def __init__(self, artifact_file: str, index: dict[str, Any]) -> None:
+        """Initialize the indexed artifact.
+
+        :param artifact_file: The playbook artifact file path
+        :param index: The content of the index for the artifact
+        """
+        self._artifact_file = artifact_file
+        self._index = index
+        self._tasks = {
+            entry["play"].get("uuid"): entry["tasks"]
+            for entry in index["plays"]
+            if entry["tasks"] is not None
+        }
+
+    @classmethod
+    def open(cls, artifact_file: str, cache_path: Path) -> IndexedArtifact | None:
+        """Open a playbook artifact using its index.
+
+        If there is no index, or it is out of date, the index is built by scanning the
+        artifact and saved for the next replay.
+
+        :param artifact_file: The playbook artifact file path
+        :param cache_path: The cache path of the application, for the index
+        :returns: The indexed artifact, or None if the artifact is compressed or can not be
+            indexed
+        """
+        index_file = index_path(artifact_file, cache_path)
+        try:
+            stat = os.stat(artifact_file)
+        except OSError:
+            return None
+        try:
+            with index_file.open(encoding="utf-8") as fh:
+                index = json.load(fh)
+        except (OSError, json.JSONDecodeError):
+            index = {}
+        current = (
+            index.get("version") == INDEX_VERSION
+            and index.get("artifact_size") == stat.st_size
+            and index.get("artifact_mtime_ns") == stat.st_mtime_ns
+        )
+        if current:
+            logger.debug("Using index for artifact %s", artifact_file)
+            return cls(artifact_file=artifact_file, index=index)
+        if is_compressed(artifact_file):
+            return None
+
+        logger.debug("Building the index for artifact %s", artifact_file)
+        try:
+            index = _scan_artifact(artifact_file)
+        except (OSError, ValueError) as exc:
+            logger.debug("Indexing artifact %s failed: %s", artifact_file, exc)
+            return None
+        _save_index(index=index, artifact_file=artifact_file, stat=stat, index_file=index_file)
+        return cls(artifact_file=artifact_file, index=index)
+
+    def content(self) -> dict[str, Any]:
+        """Get the artifact content available from the index.
+
+        :returns: The artifact content, the plays are without their tasks and there is no stdout
+        """
+        return {
+            "version": self._index["artifact_version"],
+            "plays": [entry["play"] for entry in self._index["plays"]],
+            "status": self._index["status"],
+            "status_color": self._index["status_color"],
+        }
+
+    def tasks(self, play: dict[str, Any]) -> list[dict[str, Any]]:
+        """Read the tasks of a play from the artifact.
+
+        :param play: The play, from the artifact content
+        :returns: The tasks of the play
+        """
+        location = self._tasks.get(play.get("uuid"))
+        if location is None:
+            return []
+        return self._read(*location)
+
+    def stdout(self) -> list[str]:
+        """Read the stdout from the artifact.
+
+        :returns: The stdout lines
+        """
+        if self._index["stdout"] is None:
+            return []
+        return self._read(*self._index["stdout"])
+
+    def plays(self) -> list[dict[str, Any]]:
+        """Read all the plays, with their tasks, from the artifact.
+
+        :returns: The plays
+        """
+        plays = self.content()["plays"]
+        return [{**play, "tasks": self.tasks(play)} for play in plays]
+
+    def _read(self, offset: int, length: int) -> Any:
+        """Read and parse one value from the artifact.
+
+        :param offset: The byte offset of the value
+        :param length: The length of the value in bytes
+        :returns: The parsed value
+        """
+        with open(self._artifact_file, mode="rb") as fh:
+            fh.seek(offset)
+            return json.loads(fh.read(length))
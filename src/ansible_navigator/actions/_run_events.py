@@ -0,0 +1,132 @@
+"""Event ingestion helpers for the ``run`` action."""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+TaskKey = tuple[str, str]
+"""The key used to identify a task within a play, the task uuid and host"""
+
+RESULT_COUNTERS = ("__ok", "__skipped", "__failed", "__unreachable", "__ignored", "__in progress")
+"""The play counters for each task result"""
+
+
+class PlayIndex:
+    """Index the plays and tasks of a playbook run.
+
+    The plays and their tasks are stored in the list of plays shown in the
+    play menu, this keeps lookup tables alongside that list so the parent play
+    and the task for each runner event can be found without a linear scan.
+
+    The result, changed and task counters of each play are kept up to date as
+    tasks are added and updated, plays with changed counters are tracked so
+    only those need to be refreshed.
+    """
+
+    def __init__(self, plays: list[dict[str, Any]] | None = None) -> None:
+        """Initialize the play index.
+
+        :param plays: Plays, with their tasks, to index
+        """
+        self._plays: dict[str, dict[str, Any]] = {}
+        self._tasks: dict[str, dict[TaskKey, dict[str, Any]]] = {}
+        self._updated: dict[str, dict[str, Any]] = {}
+        self.rebuild(plays or [])
+
+    def rebuild(self, plays: list[dict[str, Any]]) -> None:
+        """Discard the current index and index the plays provided.
+
+        :param plays: Plays, with their tasks, to index
+        """
+        self._plays.clear()
+        self._tasks.clear()
+        self._updated.clear()
+        for play in plays:
+            self.add_play(play)
+            for task in play.get("tasks", []):
+                self.add_task(play, task)
+
+    def add_play(self, play: dict[str, Any]) -> None:
+        """Add a play to the index and reset its counters.
+
+        :param play: The play, from the ``playbook_on_play_start`` event data
+        """
+        if play["uuid"] in self._plays:
+            return
+        self._plays[play["uuid"]] = play
+        self._tasks[play["uuid"]] = {}
+        play.update({counter: 0 for counter in RESULT_COUNTERS})
+        play.update({"__changed": 0, "__task_count": 0})
+        self._updated[play["uuid"]] = play
+
+    def add_task(self, play: dict[str, Any], task: dict[str, Any]) -> None:
+        """Add a task to the index for a play.
+
+        The first task seen for a task uuid and host is kept, matching the
+        first match behavior of a scan over the play's tasks.
+
+        :param play: The parent play of the task
+        :param task: The task, from the ``runner_on_start`` event data
+        """
+        tasks = self._tasks.setdefault(play["uuid"], {})
+        tasks.setdefault((task["task_uuid"], task["host"]), task)
+        play["__task_count"] += 1
+        self._count(play, task, 1)
+
+    def update_task(
+        self,
+        play: dict[str, Any],
+        task: dict[str, Any],
+        data: dict[str, Any],
+    ) -> None:
+        """Update a task and the counters of its play.
+
+        :param play: The parent play of the task
+        :param task: The task to update
+        :param data: The new task data, from the runner event data
+        """
+        self._count(play, task, -1)
+        task.update(data)
+        self._count(play, task, 1)
+
+    def pop_updated(self) -> list[dict[str, Any]]:
+        """Get the plays with counters changed since the last call.
+
+        :returns: The updated plays
+        """
+        updated = list(self._updated.values())
+        self._updated.clear()
+        return updated
+
+    def play(self, play_uuid: str) -> dict[str, Any] | None:
+        """Find a play by uuid.
+
+        :param play_uuid: The play uuid
+        :returns: The play if found, otherwise None
+        """
+        return self._plays.get(play_uuid)
+
+    def task(self, play_uuid: str, task_uuid: str, host: str) -> dict[str, Any] | None:
+        """Find a task by its play uuid, task uuid and host.
+
+        :param play_uuid: The uuid of the parent play
+        :param task_uuid: The task uuid
+        :param host: The host the task is running against
+        :returns: The task if found, otherwise None
+        """
+        return self._tasks.get(play_uuid, {}).get((task_uuid, host))
+
+    def _count(self, play: dict[str, Any], task: dict[str, Any], amount: int) -> None:
+        """Add the task's result and changed state to the counters of its play.
+
+        :param play: The parent play of the task
+        :param task: The task
+        :param amount: The amount to add to each counter, -1 removes the task
+        """
+        counter = f"__{task['__result'].lower()}"
+        if counter in RESULT_COUNTERS:
+            play[counter] += amount
+        if task["__changed"] is True:
+            play["__changed"] += amount
+        self._updated[play["uuid"]] = play
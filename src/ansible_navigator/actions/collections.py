@@ -36,6 +36,10 @@ from . import _actions as actions
 from . import run_action
 
 
+SUMMARY_KEY_PREFIX = "summary_v2:"
+"""The prefix of the collection cache keys for plugin summaries, as in catalog_collections.py"""
+
+
 def color_menu(colno: int, colname: str, entry: dict[str, Any]) -> tuple[int, int]:
     """Provide a color for a collections menu entry in one column.
 
@@ -296,12 +300,16 @@ class Action(ActionBase):
         selected_collection = self._collections[self.steps.current.index]
         collection_name = f"__{selected_collection['known_as']}"
         collection_contents = []
+        plugin_docs, summarized = self._get_plugin_docs(selected_collection)
         for plugin_checksum, details in selected_collection["plugin_checksums"].items():
             try:
-                plugin_json = self._collection_cache[plugin_checksum]
+                plugin_json = plugin_docs[plugin_checksum]
                 loaded = json.loads(plugin_json)
 
                 plugin = loaded["plugin"]
+                if plugin_checksum in summarized:
+                    # The full documentation is loaded when the plugin is shown
+                    plugin["__checksum"] = plugin_checksum
                 if plugin["doc"] is not None:
                     if "name" in plugin["doc"]:
                         short_name = plugin["doc"]["name"]
@@ -367,8 +375,51 @@ class Action(ActionBase):
             step_type="content",
             value=self.steps.current.value,
             index=self.steps.current.index,
+            show_func=self._load_plugin_doc,
         )
 
+    def _get_plugin_docs(self, selected_collection: dict) -> tuple[dict[str, str], set[str]]:
+        """Get the plugin summaries for a collection from the collection doc cache.
+
+        The full documentation is used for plugins cached without a summary.
+
+        :param selected_collection: The selected collection
+        :returns: The summary or documentation for each plugin checksum, and the checksums of
+            those summarized
+        """
+        checksums = list(selected_collection["plugin_checksums"])
+        summaries = self._collection_cache.get_many(
+            f"{SUMMARY_KEY_PREFIX}{checksum}" for checksum in checksums
+        )
+        plugin_docs = {
+            checksum: summaries[f"{SUMMARY_KEY_PREFIX}{checksum}"]
+            for checksum in checksums
+            if f"{SUMMARY_KEY_PREFIX}{checksum}" in summaries
+        }
+        summarized = set(plugin_docs)
+        plugin_docs.update(
+            self._collection_cache.get_many(
+                checksum for checksum in checksums if checksum not in summarized
+            ),
+        )
+        return plugin_docs, summarized
+
+    def _load_plugin_doc(self) -> None:
+        """Replace the summary of the plugin being shown with its full documentation."""
+        plugin = self.steps.current.selected
+        if not isinstance(plugin, dict) or "__checksum" not in plugin:
+            return
+        self._collection_cache.open_()
+        try:
+            loaded = json.loads(self._collection_cache[plugin["__checksum"]])
+            plugin.update(loaded["plugin"])
+            del plugin["__checksum"]
+        except (KeyError, JSONDecodeError) as exc:
+            self._logger.error("error loading plugin doc %s", plugin["__checksum"])
+            self._logger.debug("error was %s", str(exc))
+        finally:
+            self._collection_cache.close()
+
     def _run_runner(self) -> None:
         # pylint: disable=too-many-locals
         """Use the runner subsystem to catalog collections."""
@@ -401,6 +452,7 @@ class Action(ActionBase):
 
         kwargs = {
             "container_engine": self._args.container_engine,
+            "container_session": self._args.execution_environment_session,
             "execution_environment_image": self._args.execution_environment_image,
             "execution_environment": self._args.execution_environment,
             "navigator_mode": "interactive",
@@ -470,6 +522,8 @@ class Action(ActionBase):
             ):
                 mount_doc_cache = False
 
+            # Mounted alone, the doc cache does not use write-ahead logging, as the log
+            # files beside it would not be shared with the host
             if mount_doc_cache:
                 container_volume_mounts.append(
                     f"{self._args.collection_doc_cache_path}:"
@@ -603,13 +657,14 @@ class Action(ActionBase):
         :returns: The plugin details like full-name, type and short description.
         """
         plugins_details: dict = {}
+        cached_docs, _summarized = self._get_plugin_docs(selected_collection)
 
         for plugin_checksum, plugin_info in selected_collection["plugin_checksums"].items():
             plugin_type = plugin_info.get("type")
             if plugin_type not in plugins_details:
                 plugins_details[plugin_type] = []
 
-            plugin_json = self._collection_cache[plugin_checksum]
+            plugin_json = cached_docs[plugin_checksum]
             loaded = json.loads(plugin_json)
 
             plugin = loaded.get("plugin")
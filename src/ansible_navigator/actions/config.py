@@ -7,13 +7,17 @@ import os
 import re
 import shlex
 import shutil
+import threading
 
+from pathlib import Path
+from queue import Queue
 from typing import Any
 
 from ansible_navigator.action_base import ActionBase
 from ansible_navigator.action_defs import RunStdoutReturn
 from ansible_navigator.app_public import AppPublic
 from ansible_navigator.configuration_subsystem.definitions import ApplicationConfiguration
+from ansible_navigator.image_manager import inspect_image_id
 from ansible_navigator.runner import AnsibleConfig
 from ansible_navigator.runner import Command
 from ansible_navigator.steps import Step
@@ -28,6 +32,8 @@ from ansible_navigator.utils.serialize import yaml
 
 from . import _actions as actions
 from . import run_action
+from ._config_cache import ConfigCache
+from ._config_cache import config_cache_key
 
 
 def color_menu(colno: int, colname: str, entry: dict[str, Any]) -> tuple[int, int]:
@@ -227,6 +233,7 @@ class Action(ActionBase):
 
         kwargs = {
             "container_engine": self._args.container_engine,
+            "container_session": self._args.execution_environment_session,
             "host_cwd": os.getcwd(),
             "execution_environment_image": self._args.execution_environment_image,
             "execution_environment": self._args.execution_environment,
@@ -247,12 +254,17 @@ class Action(ActionBase):
             kwargs.update({"container_options": self._args.container_options})
 
         if self._args.mode == "interactive":
-            self._runner = AnsibleConfig(**kwargs)
-            kwargs = {}
-            if isinstance(self._args.config, str):
-                kwargs["config_file"] = self._args.config
-            list_output, list_output_err = self._runner.fetch_ansible_config("list", **kwargs)
-            dump_output, dump_output_err = self._runner.fetch_ansible_config("dump", **kwargs)
+            config_file = self._args.config if isinstance(self._args.config, str) else None
+            cache = ConfigCache(cache_path=self._args.internals.cache_path)
+            cache_key = self._cache_key(config_file=config_file, set_env_vars=set_env_vars)
+            if cache_key is not None:
+                self._config = cache.get(cache_key)
+                if self._config is not None:
+                    return (None, None, None)
+
+            outputs, errors, parsed = self._fetch_config(config_file, kwargs)
+            list_output, dump_output = outputs["list"], outputs["dump"]
+            list_output_err, dump_output_err = errors["list"], errors["dump"]
             if list_output_err:
                 msg = f"Error occurred while fetching ansible config (list): '{list_output_err}'"
                 self._logger.error(msg)
@@ -269,8 +281,10 @@ class Action(ActionBase):
                     warn_msg.append("The configuration could not be gathered.")
                 warning = warning_notification(warn_msg)
                 self._interaction.ui.show_form(warning)
-            else:
-                self._parse_and_merge(list_output, dump_output)
+            elif parsed is not None:
+                self._merge(parsed, dump_output)
+                if self._config is not None and cache_key is not None:
+                    cache.set(cache_key, self._config)
         else:
             if self._args.execution_environment:
                 ansible_config_path = "ansible-config"
@@ -300,21 +314,116 @@ class Action(ActionBase):
             return stdout_return
         return (None, None, None)
 
-    def _parse_and_merge(self, list_output, dump_output) -> None:
-        """Parse the list and dump output. Merge dump into list.
+    def _cache_key(self, config_file: str | None, set_env_vars: dict[str, str]) -> str | None:
+        """Create the key for the configuration in the cache.
+
+        The key reflects the ansible installation, the ansible configuration file and the
+        environment in which ``ansible-config`` runs.
+
+        :param config_file: The ansible configuration file to use
+        :param set_env_vars: The environment variables set for ``ansible-config``
+        :returns: The key, or None if the ansible installation could not be identified
+        """
+        if self._args.execution_environment:
+            runtime = inspect_image_id(
+                container_engine=self._args.container_engine,
+                image=self._args.execution_environment_image,
+            )
+        else:
+            exec_path = shutil.which("ansible-config")
+            runtime = None
+            if exec_path is not None:
+                exec_path = os.path.realpath(exec_path)
+                runtime = f"{exec_path}:{os.stat(exec_path).st_mtime_ns}"
+        if runtime is None:
+            return None
+
+        config_path = config_file or self._args.internals.ansible_configuration.path
+        try:
+            config_text = Path(config_path).read_bytes()  # type: ignore[arg-type]
+        except (OSError, TypeError):
+            config_text = b""
+
+        pass_env_vars = self._args.pass_environment_variable
+        environment = {
+            "ansible": {k: v for k, v in os.environ.items() if k.startswith("ANSIBLE_")},
+            "config_path": config_path,
+            "container_options": self._args.container_options,
+            "cwd": os.getcwd(),
+            "pass": {
+                name: os.environ.get(name)
+                for name in (pass_env_vars if isinstance(pass_env_vars, list) else [])
+            },
+            "set": set_env_vars,
+            "volume_mounts": self._args.execution_environment_volume_mounts,
+        }
+        return config_cache_key(runtime, config_text, environment)
+
+    def _fetch_config(
+        self,
+        config_file: str | None,
+        runner_kwargs: dict[str, Any],
+    ) -> tuple[dict[str, str], dict[str, str], dict[str, Any] | None]:
+        """Fetch the list and dump output concurrently.
+
+        The list output is parsed as soon as it is available, while the dump is
+        still being fetched. Each is fetched with its own runner, as a runner holds
+        the state of the command it runs.
+
+        :param config_file: The ansible configuration file to use
+        :param runner_kwargs: The arguments for each runner
+        :returns: The output and errors of each, keyed by ``list`` and ``dump``, and the
+            parsed list output
+        """
+        kwargs = {} if config_file is None else {"config_file": config_file}
+        results: Queue[tuple[str, str, str]] = Queue()
+
+        def fetch(action: str) -> None:
+            """Fetch the output of one ``ansible-config`` action.
+
+            :param action: The action
+            """
+            try:
+                runner = AnsibleConfig(**runner_kwargs)
+                output, error = runner.fetch_ansible_config(action, **kwargs)
+            except Exception as exc:  # noqa: BLE001
+                output, error = "", str(exc)
+            results.put((action, output, error))
+
+        for action in ("list", "dump"):
+            threading.Thread(target=fetch, args=(action,), daemon=True).start()
+
+        outputs: dict[str, str] = {}
+        errors: dict[str, str] = {}
+        parsed = None
+        while len(outputs) < 2:
+            action, outputs[action], errors[action] = results.get()
+            if action == "list" and outputs[action]:
+                parsed = self._parse_list(outputs[action])
+        return outputs, errors, parsed
+
+    def _parse_list(self, list_output: str) -> dict[str, Any] | None:
+        """Parse the list output.
 
         :param list_output: The output from config list
-        :param dump_output: The output from config dump
-        :returns: Nothing
+        :returns: The configuration options, or None if the output could not be parsed
         """
-        # pylint: disable=too-many-locals
         try:
             parsed = yaml.load(list_output, Loader=Loader)
             self._logger.debug("yaml loading list output succeeded")
         except yaml.YAMLError as exc:
             self._logger.debug("error yaml loading list output: '%s'", str(exc))
             return None
+        return parsed
 
+    def _merge(self, parsed: dict[str, Any], dump_output: str) -> None:
+        """Merge the dump output into the parsed list output.
+
+        :param parsed: The parsed output from config list
+        :param dump_output: The output from config dump
+        :returns: Nothing
+        """
+        # pylint: disable=too-many-locals
         regex = re.compile(r"^(?P<variable>\S+)\((?P<source>.*)\)\s=\s(?P<current>.*)$")
         for line in dump_output.splitlines():
             extracted = regex.match(line)
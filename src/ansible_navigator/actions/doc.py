@@ -152,6 +152,7 @@ class Action(ActionBase):
 
         kwargs = {
             "container_engine": self._args.container_engine,
+            "container_session": self._args.execution_environment_session,
             "execution_environment_image": self._args.execution_environment_image,
             "execution_environment": self._args.execution_environment,
             "navigator_mode": self._args.mode,
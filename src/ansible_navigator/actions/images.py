@@ -16,7 +16,9 @@ from ansible_navigator.app_public import AppPublic
 from ansible_navigator.configuration_subsystem import Constants
 from ansible_navigator.configuration_subsystem.definitions import ApplicationConfiguration
 from ansible_navigator.content_defs import ContentFormat
+from ansible_navigator.image_manager import IntrospectionCache
 from ansible_navigator.image_manager import inspect_all
+from ansible_navigator.image_manager import inspect_image_id
 from ansible_navigator.runner import Command
 from ansible_navigator.steps import Step
 from ansible_navigator.ui_framework import CursesLine
@@ -133,6 +135,12 @@ class Action(ActionBase):
         self._logger.debug("images requested in stdout mode")
 
         details_source = self._args.entry("images_details").value.source
+        if self._args.images_clear_cache:
+            count = self._clear_cache()
+            if details_source is Constants.DEFAULT_CFG:
+                message = f"Removed {count} cached image introspections."
+                return RunStdoutReturn(message=message, return_code=0)
+
         if details_source is not Constants.DEFAULT_CFG:
             return self.run_stdout_details()
 
@@ -160,12 +168,12 @@ class Action(ActionBase):
         :returns: A message and return code
         """
         image_name = self._args.execution_environment_image
+        image_id = inspect_image_id(container_engine=self._args.container_engine, image=image_name)
 
-        output, error, return_code = self._run_runner(image_name=image_name)
+        details, error, return_code = self._introspect(image_name=image_name, image_id=image_id)
         if error or return_code:
             return RunStdoutReturn(message=error, return_code=return_code)
 
-        details = self._parse(output)
         if details is None:
             message = "Image introspection failed, please check the logs and log an issue."
             return RunStdoutReturn(message=message, return_code=1)
@@ -199,13 +207,18 @@ class Action(ActionBase):
         self._logger.debug("images requested")
         self._prepare_to_run(app, interaction)
 
-        args_updated = self._update_args(
-            [self._name] + shlex.split(self._interaction.action.match.groupdict()["params"] or ""),
-        )
+        params = shlex.split(self._interaction.action.match.groupdict()["params"] or "")
+        args_updated = self._update_args([self._name] + params)
         if not args_updated:
             self._prepare_to_exit(interaction)
             return None
 
+        # The cache was cleared at start up for the settings the application started
+        # with, only clear it again when this request asks to
+        clear_cache = self._args.entry("images_clear_cache").value
+        if clear_cache.current is True and clear_cache.source is Constants.USER_CLI:
+            self._clear_cache()
+
         notification = nonblocking_notification(
             messages=["Collecting available images, this may take a minute..."],
         )
@@ -477,8 +490,13 @@ class Action(ActionBase):
 
         self._images.selected["__introspected"] = True
 
-        output, error, _return_code = self._run_runner(
+        try:
+            image_id = self._images.selected["inspect"]["details"]["id"]
+        except (KeyError, TypeError):
+            image_id = self._images.selected["image_id"]
+        parsed, error, _return_code = self._introspect(
             image_name=self._images.selected["__full_name"],
+            image_id=image_id,
         )
 
         if error:
@@ -488,7 +506,6 @@ class Action(ActionBase):
             )
             self.notify_failed()
             return False
-        parsed = self._parse(output)
         if parsed is None:
             self.notify_failed()
             return False
@@ -509,13 +526,42 @@ class Action(ActionBase):
             self._images.selected["system"] = parsed["system_packages"]
         except KeyError:
             self._logger.exception(
-                "Image introspection failed (keys), the return value was: %s",
-                output[0:1000],
+                "Image introspection failed (keys), the keys were: %s",
+                ", ".join(parsed),
             )
             self.notify_failed()
             return False
         return True
 
+    def _clear_cache(self) -> int:
+        """Remove all cached image introspections.
+
+        :returns: The number of introspections removed
+        """
+        return IntrospectionCache(cache_path=self._args.internals.cache_path).clear()
+
+    def _introspect(self, image_name: str, image_id: str | None) -> tuple[dict | None, str, int]:
+        """Introspect an image, using the cached introspection if there is one.
+
+        :param image_name: The full image name
+        :param image_id: The image id, or None if not known
+        :returns: The introspection, or None if it could not be parsed, errors and the return code
+        """
+        cache = IntrospectionCache(cache_path=self._args.internals.cache_path)
+        if image_id:
+            cached = cache.get(image_id)
+            if cached is not None:
+                return cached, "", 0
+
+        output, error, return_code = self._run_runner(image_name=image_name)
+        if error:
+            return None, error, return_code
+
+        parsed = self._parse(output)
+        if parsed is not None and image_id and not return_code:
+            cache.set(image_id, parsed)
+        return parsed, error, return_code
+
     def _parse(self, output) -> dict | None:
         """Load and process the ``json`` output from the image introspection process.
 
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import glob
 import json
 import os
 import shlex
@@ -26,9 +25,12 @@ from ansible_navigator.ui_framework import CursesLines
 from ansible_navigator.ui_framework import Decoration
 from ansible_navigator.ui_framework import Interaction
 from ansible_navigator.ui_framework import warning_notification
+from ansible_navigator.utils.file_watcher import FileWatcher
+from ansible_navigator.utils.file_watcher import watch_paths
 
 from . import _actions as actions
 from . import run_action
+from ._inventory_index import InventoryIndex
 
 
 def color_menu(colno: int, colname: str, entry: dict[str, Any]) -> tuple[int, int]:
@@ -94,10 +96,6 @@ class MenuEntry(dict):
     """A menu entry."""
 
 
-class Menu(list):
-    """A menu."""
-
-
 @actions.register
 class Action(ActionBase):
     """Inventory subcommand implementation."""
@@ -114,9 +112,9 @@ class Action(ActionBase):
         super().__init__(args=args, logger_name=__name__, name="inventory")
 
         self.__inventory: dict[Any, Any] = {}
-        self._host_vars: dict[str, dict[Any, Any]]
-        self._inventories_mtime: float | None
+        self._index = InventoryIndex({})
         self._inventories: list[str] = []
+        self._inventories_watcher: FileWatcher
         self._inventory_error: str = ""
         self._runner: Command | AnsibleInventory
 
@@ -130,20 +128,12 @@ class Action(ActionBase):
 
     @_inventory.setter
     def _inventory(self, value: dict) -> None:
-        """Set the inventory and hostvars.
+        """Set the inventory and index it.
 
         :param value: The inventory data
         """
         self.__inventory = value
-        self._host_vars = {
-            k: {**v, "inventory_hostname": k}
-            for k, v in value.get("_meta", {}).get("hostvars", {}).items()
-        }
-        for group in self._inventory:
-            for host in self._inventory[group].get("hosts", []):
-                if host in self._host_vars:
-                    continue
-                self._host_vars[host] = {"inventory_hostname": host}
+        self._index = InventoryIndex(value)
 
     @property
     def _show_columns(self) -> list:
@@ -155,24 +145,6 @@ class Action(ActionBase):
             return self._args.inventory_column
         return []
 
-    def _set_inventories_mtime(self) -> None:
-        """Record the inventory modification time."""
-        modification_times = []
-        for inventory in self._inventories:
-            if os.path.isdir(inventory):
-                modification_times.append(
-                    max(
-                        os.path.getmtime(e)
-                        for e in glob.glob(os.path.join(inventory, "**"), recursive=True)
-                    ),
-                )
-            elif os.path.isfile(inventory):
-                modification_times.append(os.path.getmtime(inventory))
-        if modification_times:
-            self._inventories_mtime = max(modification_times)
-        else:
-            self._inventories_mtime = None
-
     def update(self):
         """Request calling app update, inventory update checked in ``run()``."""
         self._calling_app.update()
@@ -197,8 +169,19 @@ class Action(ActionBase):
 
         self.stdout = self._calling_app.stdout
         self._inventories = self._args.inventory
-        self._set_inventories_mtime()
+        self._inventories_watcher = watch_paths(self._inventories)
+        try:
+            return self._run_watched(interaction)
+        finally:
+            self._inventories_watcher.close()
 
+    def _run_watched(self, interaction: Interaction) -> Interaction | None:
+        """Show the inventory, collecting it again when the watched inventories change.
+
+        :param interaction: The interaction from the user
+        :returns: The pending :class:`~ansible_navigator.ui_framework.ui.Interaction` or
+            :data:`None`
+        """
         self._collect_inventory_details()
         if not self._inventory:
             self._prepare_to_exit(interaction)
@@ -223,13 +206,9 @@ class Action(ActionBase):
             if not self.steps:
                 break
 
-            current_mtime = self._inventories_mtime
-            self._set_inventories_mtime()
-            if current_mtime != self._inventories_mtime:
+            if self._inventories_watcher.changed():
                 self._logger.debug("inventory changed")
 
-                self._set_inventories_mtime()
-
                 self._collect_inventory_details()
                 if not self._inventory:
                     break
@@ -333,54 +312,31 @@ class Action(ActionBase):
         if key is None:
             key = self.steps.current.selected["__name"]
 
-        try:
-            menu = Menu()
-            taxonomy = "\u25B8".join(
-                ["all"]
-                + [step.selected["__name"] for step in self.steps if step.name == "group_menu"],
-            )
-
-            columns = ["__name", "__taxonomy", "__type"]
-
-            hosts = self._inventory[key].get("hosts", None)
-            if hosts:
-                columns.extend(self._show_columns)
-                for host in sorted(hosts):
-                    menu_entry = MenuEntry(**self._host_vars[host])
-                    menu_entry["__name"] = menu_entry["inventory_hostname"]
-                    menu_entry["__taxonomy"] = taxonomy
-                    menu_entry["__type"] = "host"
-                    menu.append(menu_entry)
-
-            children = self._inventory[key].get("children", None)
-            if children:
-                for child in sorted(children):
-                    menu_entry = MenuEntry()
-                    menu_entry["__name"] = child
-                    menu_entry["__taxonomy"] = taxonomy
-                    menu_entry["__type"] = "group"
-                    if hosts:
-                        menu_entry.update({c: "" for c in self._show_columns})
-                    menu.append(menu_entry)
-
-            return Step(
-                name="group_menu",
-                step_type="menu",
-                value=menu,
-                columns=columns,
-                select_func=self._host_or_group_step,
-                show_func=self._refresh,
-            )
-        except KeyError:
+        if key not in self._index:
             # selected group was removed from inventory
             return self.steps.back_one()
 
+        taxonomy = "\u25B8".join(
+            ["all"] + [step.selected["__name"] for step in self.steps if step.name == "group_menu"],
+        )
+        columns = ["__name", "__taxonomy", "__type"]
+        if self._index.hosts[key]:
+            columns.extend(self._show_columns)
+        return Step(
+            name="group_menu",
+            step_type="menu",
+            value=self._index.group_rows(key, taxonomy, self._show_columns),
+            columns=columns,
+            select_func=self._host_or_group_step,
+            show_func=self._refresh,
+        )
+
     def _build_host_content(self) -> Step:
         """Build the inventory content for one host.
 
         :returns: The inventory content for the host
         """
-        host_vars = self._host_vars
+        host_vars = self._index.host_vars
         try:
             values = [
                 host_vars[m_entry.get("__name", m_entry.get("inventory_hostname"))]
@@ -410,16 +366,12 @@ class Action(ActionBase):
 
         :returns: The hosts menu definition
         """
-        menu = Menu()
-        for host in self._host_vars.values():
-            host["__type"] = "host"
-            menu.append(MenuEntry(host))
         columns = ["inventory_hostname"] + self._show_columns
         return Step(
             columns=columns,
             name="host_menu",
             step_type="menu",
-            value=menu,
+            value=self._index.host_rows(),
             select_func=self._build_host_content,
             show_func=self._refresh,
         )
@@ -540,6 +492,7 @@ class Action(ActionBase):
 
         kwargs = {
             "container_engine": self._args.container_engine,
+            "container_session": self._args.execution_environment_session,
             "host_cwd": os.getcwd(),
             "execution_environment_image": self._args.execution_environment_image,
             "execution_environment": self._args.execution_environment,
@@ -4,7 +4,9 @@ from ansible_navigator.action_base import ActionBase
 from ansible_navigator.app_public import AppPublic
 from ansible_navigator.configuration_subsystem.definitions import ApplicationConfiguration
 from ansible_navigator.content_defs import ContentFormat
+from ansible_navigator.ui_framework import Content
 from ansible_navigator.ui_framework import Interaction
+from ansible_navigator.utils.file_lines import FileLines
 
 from . import _actions as actions
 
@@ -25,6 +27,10 @@ class Action(ActionBase):
     def run(self, interaction: Interaction, app: AppPublic) -> Interaction:
         """Execute the ``:log`` request for mode interactive.
 
+        Only the lines appended to the log file since the last refresh are read, and only
+        the lines on the screen are read and colored. If the log file is rotated or
+        truncated, it is read again from the start.
+
         :param interaction: The interaction from the user
         :param app: The app instance
         :returns: The pending :class:`~ansible_navigator.ui_framework.ui.Interaction`
@@ -33,16 +39,20 @@ class Action(ActionBase):
         self._prepare_to_run(app, interaction)
 
         auto_scroll = True
+        lines = FileLines(self._args.log_file)
         while True:
             self._calling_app.update()
-            with open(self._args.log_file, encoding="utf-8") as fh:
-                log_contents = fh.read()
+            if not lines.refresh():
+                self._logger.debug("log file replaced or truncated, reading from the start")
+                lines.close()
+                lines = FileLines(self._args.log_file)
+                lines.refresh()
 
-            new_scroll = len(log_contents.splitlines())
+            new_scroll = len(lines)
             if auto_scroll:
                 interaction.ui.scroll(new_scroll)
 
-            interaction = interaction.ui.show(obj=log_contents, content_format=ContentFormat.LOG)
+            interaction = interaction.ui.show(obj=lines, content_format=ContentFormat.LOG)
             if interaction.name != "refresh":
                 break
 
@@ -53,5 +63,10 @@ class Action(ActionBase):
                 self._logger.debug("auto_scroll enabled")
                 auto_scroll = True
 
+        if interaction.content is not None and interaction.name not in ("back", "quit"):
+            # Provide the text for the next action, for example ``:write``
+            interaction = interaction._replace(content=Content(showing=str(lines)))
+        lines.close()
+
         self._prepare_to_exit(interaction)
         return interaction
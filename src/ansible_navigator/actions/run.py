@@ -13,8 +13,8 @@ import time
 import uuid
 
 from math import floor
-from operator import itemgetter
 from pathlib import Path
+from queue import Empty
 from queue import Queue
 from typing import Any
 from typing import Callable
@@ -25,8 +25,6 @@ from ansible_navigator.app_public import AppPublic
 from ansible_navigator.configuration_subsystem import to_effective
 from ansible_navigator.configuration_subsystem import to_sources
 from ansible_navigator.configuration_subsystem.definitions import ApplicationConfiguration
-from ansible_navigator.content_defs import ContentView
-from ansible_navigator.content_defs import SerializationFormat
 from ansible_navigator.runner import CommandAsync
 from ansible_navigator.steps import Step
 from ansible_navigator.ui_framework import CursesLine
@@ -44,10 +42,18 @@ from ansible_navigator.utils.functions import is_jinja
 from ansible_navigator.utils.functions import now_iso
 from ansible_navigator.utils.functions import remove_ansi
 from ansible_navigator.utils.functions import round_half_up
-from ansible_navigator.utils.serialize import serialize_write_file
+from ansible_navigator.utils.serialize import open_file
 
 from . import _actions as actions
 from . import run_action
+from ._run_artifact import ARTIFACT_VERSION
+from ._run_artifact import ArtifactJournal
+from ._run_artifact import IndexedArtifact
+from ._run_artifact import is_journal
+from ._run_artifact import journal_path
+from ._run_artifact import read_journal
+from ._run_artifact import write_indexed_artifact
+from ._run_events import PlayIndex
 from .stdout import Action as stdout_action
 
 
@@ -187,6 +193,18 @@ TASK_LIST_COLUMNS = [
     "__duration",
 ]
 
+DRAIN_MINIMUM_EVENTS = 500
+"""The minimum number of events handled per drain of the runner queue"""
+
+DRAIN_DEPTH_DIVISOR = 4
+"""The fraction of a deeper runner queue handled per drain"""
+
+DRAIN_TIME_BUDGET = 0.05
+"""The time in seconds after which a drain of the runner queue stops"""
+
+STDOUT_QUEUE_WAIT = 0.1
+"""The time in seconds to wait for an event in mode stdout"""
+
 
 @actions.register
 class Action(ActionBase):
@@ -223,11 +241,36 @@ class Action(ActionBase):
             show_func=self._play_stats,
             select_func=self._task_list_for_play,
         )
+        self._play_index = PlayIndex()
         self._task_list_columns: list[str] = TASK_LIST_COLUMNS
         self._content_key_filter: Callable = filter_content_keys
         self._playbook_type: str = check_playbook_type(self._args.playbook)
         self._task_cache: dict[str, str] = {}
         """Task name storage from playbook_on_start using the task uuid as the key"""
+        self._journal: ArtifactJournal | None = None
+        """The playbook artifact journal, when streaming the artifact"""
+        self._artifact: IndexedArtifact | None = None
+        """The playbook artifact being replayed, when it has an index"""
+
+    @property
+    def stdout(self) -> list[str]:
+        """Get the playbook stdout.
+
+        When replaying an indexed artifact, the stdout is read on first use.
+
+        :returns: The stdout lines
+        """
+        if self._artifact is not None and self._stdout is None:
+            self._stdout = self._artifact.stdout()
+        return self._stdout
+
+    @stdout.setter
+    def stdout(self, value: list[str] | None) -> None:
+        """Set the playbook stdout.
+
+        :param value: The stdout lines, None to read them from the replayed artifact
+        """
+        self._stdout = value
 
     @property
     def mode(self):
@@ -264,15 +307,14 @@ class Action(ActionBase):
         self._logger = logging.getLogger(f"{__name__}_{self._subaction_type}")
         self._run_runner()
         while True:
-            self._dequeue()
-            if self.runner.finished:
+            # Wait for events rather than spin, in mode stdout the delay introduced
+            # by the curses key read is not present
+            self._dequeue(wait=STDOUT_QUEUE_WAIT)
+            if self.runner.finished and self._queue.empty():
                 if self._args.playbook_artifact_enable:
                     self.write_artifact()
                 self._logger.debug("runner finished")
                 break
-            # Sleep briefly to prevent 100% CPU utilization
-            # in mode stdout, the delay introduced by the curses key read is not present
-            time.sleep(0.01)
         return_code = self.runner.ansible_runner_instance.rc
         if return_code != 0:
             return RunStdoutReturn(
@@ -416,10 +458,16 @@ class Action(ActionBase):
                 return False
             artifact_file = populated_form["fields"]["artifact_file"]["value"]
 
+        self._artifact = IndexedArtifact.open(artifact_file, self._args.internals.cache_path)
         try:
-            with open(artifact_file, encoding="utf-8") as fh:
-                data = json.load(fh)
-        except json.JSONDecodeError as exc:
+            if self._artifact is not None:
+                data = self._artifact.content()
+            elif is_journal(artifact_file):
+                data = self._load_journal(artifact_file)
+            else:
+                with open_file(artifact_file) as fh:
+                    data = json.load(fh)
+        except (json.JSONDecodeError, EOFError) as exc:
             self._logger.debug("json decode error: %s", str(exc))
             self._logger.error("Unable to parse artifact file")
             return False
@@ -427,13 +475,16 @@ class Action(ActionBase):
         version = data.get("version", "")
         if version.startswith("1.") or version.startswith("2."):
             try:
-                stdout = data["stdout"]
                 if self.mode == "interactive":
+                    # The tasks and stdout of an indexed artifact are read when first used
+                    self.stdout = None if self._artifact else data["stdout"]
                     self._plays.value = data["plays"]
+                    if self._artifact is None:
+                        self._play_index.rebuild(self._plays.value)
                     self._interaction.ui.update_status(data["status"], data["status_color"])
-                    self.stdout = stdout
                 else:
-                    for line in data["stdout"]:
+                    stdout = self._artifact.stdout() if self._artifact else data["stdout"]
+                    for line in stdout:
                         if self._args.display_color is True:
                             print(line)
                         else:
@@ -453,6 +504,27 @@ class Action(ActionBase):
         self._logger.debug("Completed replay artifact request with mode %s", self.mode)
         return True
 
+    def _load_journal(self, artifact_file: str) -> dict[str, Any]:
+        """Rebuild the content of a playbook artifact from its journal.
+
+        The runner messages in the journal are handled as they were during the run.
+
+        :param artifact_file: The journal file
+        :returns: The playbook artifact content
+        """
+        self._logger.debug("Loading playbook artifact journal %s", artifact_file)
+        data: dict[str, Any] = {"status": "incomplete", "status_color": 13}
+        for record in read_journal(artifact_file):
+            if record["record"] == "message":
+                self._handle_message(record["message"])
+            elif record["record"] == "header":
+                data["version"] = record["version"]
+            elif record["record"] == "status":
+                data["status"] = record["status"]
+                data["status_color"] = record["status_color"]
+        data.update({"plays": self._plays.value, "stdout": self.stdout})
+        return data
+
     def _prompt_for_artifact(self, artifact_file: str) -> dict[Any, Any]:
         """Prompt for a valid artifact file.
 
@@ -625,17 +697,68 @@ class Action(ActionBase):
         self._runner_finished = False
         self._logger.debug("runner requested to start")
 
-    def _dequeue(self) -> None:
-        """Drain the runner queue."""
+        if self._args.playbook_artifact_enable is True and self._args.playbook_artifact_stream:
+            self._start_journal()
+
+    def _start_journal(self) -> None:
+        """Start the playbook artifact journal for the run."""
+        path = journal_path(self._artifact_filename(filename=None, status="running"))
+        try:
+            self._journal = ArtifactJournal(
+                path=path,
+                settings_entries=to_effective(self._args),
+                settings_sources=to_sources(self._args),
+            )
+        except OSError as exc:
+            self._logger.error("Starting the artifact journal failed: %s", str(exc))
+            self._journal = None
+            return
+        self._logger.debug("Streaming playbook events to artifact journal %s", path)
+
+    def _dequeue(self, wait: float = 0) -> int:
+        """Drain a batch of events from the runner queue.
+
+        The batch is bounded so a burst of events does not starve the screen
+        refresh. The bound grows with the depth of the queue so a backlog is
+        worked down over the next few drains, but a drain always stops once the
+        time budget is spent.
+
+        :param wait: Seconds to wait for an event if the queue is empty
+        :returns: The number of events handled
+        """
+        depth = self._queue.qsize()
+        limit = max(DRAIN_MINIMUM_EVENTS, depth // DRAIN_DEPTH_DIVISOR)
         drain_count = 0
-        while not self._queue.empty():
+        started = 0.0
+        while drain_count < limit:
+            try:
+                if drain_count or not wait:
+                    message = self._queue.get_nowait()
+                else:
+                    message = self._queue.get(timeout=wait)
+            except Empty:
+                break
+            if not drain_count:
+                started = time.monotonic()
             if not self._first_message_received:
                 self._first_message_received = True
-            message = self._queue.get()
+            if self._journal is not None:
+                self._journal.append(message)
             self._handle_message(message)
             drain_count += 1
+            if time.monotonic() - started > DRAIN_TIME_BUDGET:
+                break
         if drain_count:
-            self._logger.debug("Drained %s events", drain_count)
+            if self._journal is not None:
+                self._journal.flush()
+            self._logger.debug(
+                "Drained %s events in %.1fms, queue depth was %s, now %s",
+                drain_count,
+                (time.monotonic() - started) * 1000,
+                depth,
+                self._queue.qsize(),
+            )
+        return drain_count
 
     def _handle_message(self, message: dict) -> None:
         # pylint: disable=too-many-locals
@@ -663,7 +786,7 @@ class Action(ActionBase):
         if event in ["verbose", "error"]:
             if "ERROR!" in message["stdout"]:
                 self._msg_from_plays = ("ERROR", 9)
-                if self.mode == "interactive":
+                if self.mode == "interactive" and self._subaction_type == "run":
                     self._notify_error(message["stdout"])
             elif "WARNING" in message["stdout"]:
                 self._msg_from_plays = ("WARNINGS", 13)
@@ -673,6 +796,7 @@ class Action(ActionBase):
             event_data["__play_name"] = event_data["name"]
             event_data["tasks"] = []
             self._plays.value.append(event_data)
+            self._play_index.add_play(event_data)
             return
 
         if event == "playbook_on_task_start":
@@ -688,9 +812,8 @@ class Action(ActionBase):
             return
 
         # Find the parent play of the task
-        try:
-            play = next(p for p in self._plays.value if p["uuid"] == event_data["play_uuid"])
-        except StopIteration:
+        play = self._play_index.play(event_data["play_uuid"])
+        if play is None:
             self._logger.warning("Playbook event without parent play")
             return
 
@@ -714,15 +837,16 @@ class Action(ActionBase):
                 },
             )
             play["tasks"].append(event_data)
+            self._play_index.add_task(play, event_data)
             return
 
         # The runner event indicates a task has finished, find the task in the play
-        match = ("task_uuid", "host")
-        try:
-            task = next(
-                t for t in play["tasks"] if itemgetter(*match)(t) == itemgetter(*match)(event_data)
-            )
-        except StopIteration:
+        task = self._play_index.task(
+            play_uuid=play["uuid"],
+            task_uuid=event_data["task_uuid"],
+            host=event_data["host"],
+        )
+        if task is None:
             self._logger.warning("Task event without parent task")
             return
 
@@ -755,31 +879,24 @@ class Action(ActionBase):
         if no_longer_templated or changed_and_not_templated:
             event_data["__task"] = event_data["task"]
 
-        task.update(event_data)
+        self._play_index.update_task(play, task, event_data)
 
     def _play_stats(self) -> None:
-        """Calculate the play's stats based on it's tasks."""
-        for idx, play in enumerate(self._plays.value):
-            total = ["__ok", "__skipped", "__failed", "__unreachable", "__ignored", "__in progress"]
-            self._plays.value[idx].update(
-                {
-                    tot: len([t for t in play["tasks"] if t["__result"].lower() == tot[2:]])
-                    for tot in total
-                },
-            )
-            self._plays.value[idx]["__changed"] = len(
-                [t for t in play["tasks"] if t["__changed"] is True],
-            )
-            task_count = len(play["tasks"])
-            self._plays.value[idx]["__task_count"] = task_count
-            completed = task_count - self._plays.value[idx]["__in progress"]
+        """Calculate the progress of the plays with tasks updated since the last refresh.
+
+        The result counters of each play are kept current by the play index as
+        messages are handled.
+        """
+        for play in self._play_index.pop_updated():
+            task_count = play["__task_count"]
+            completed = task_count - play["__in progress"]
             if completed:
                 new = floor(completed / task_count * 100)
-                current = self._plays.value[idx].get("__percent_complete", 0)
-                self._plays.value[idx]["__percent_complete"] = max(new, current)
-                self._plays.value[idx]["__progress"] = str(max(new, current)) + "%"
+                current = play.get("__percent_complete", 0)
+                play["__percent_complete"] = max(new, current)
+                play["__progress"] = str(max(new, current)) + "%"
             else:
-                self._plays.value[idx]["__progress"] = "0%"
+                play["__progress"] = "0%"
 
     def _prepare_to_quit(self, interaction: Interaction) -> bool:
         """Pre-quit tasks.
@@ -794,6 +911,8 @@ class Action(ActionBase):
                 self.runner.cancelled = True
                 while not self.runner.finished:
                     pass
+                while not self._queue.empty():
+                    self._dequeue()
                 self.write_artifact()
                 return True
             self._logger.warning("Quit requested but playbook running, try q! or quit!")
@@ -806,7 +925,14 @@ class Action(ActionBase):
 
         :returns: The menu step
         """
-        value = self.steps.current.selected["tasks"]
+        play = self.steps.current.selected
+        if "tasks" in play:
+            value = play["tasks"]
+        elif self._artifact is not None:
+            # Not kept with the play, so only the tasks being viewed are in memory
+            value = self._artifact.tasks(play)
+        else:
+            value = []
         step = Step(
             name="task_list",
             step_type="menu",
@@ -832,10 +958,13 @@ class Action(ActionBase):
         self._calling_app.update()
 
         if hasattr(self, "runner"):
-            self._dequeue()
+            if self._dequeue():
+                # The play and task menu entries were changed in place
+                self._interaction.ui.menu_changed()
             self._set_status()
 
-            if self.runner.finished and not self._runner_finished:
+            # Events may remain after the runner finishes, wait until all have been handled
+            if self.runner.finished and self._queue.empty() and not self._runner_finished:
                 self._logger.debug("runner finished")
                 self._logger.info("Playbook complete")
                 self.write_artifact()
@@ -870,53 +999,78 @@ class Action(ActionBase):
         status, status_color = self._get_status()
         self._interaction.ui.update_status(status, status_color)
 
+    def _artifact_filename(self, filename: str | None, status: str) -> str:
+        """Determine the file name for the artifact.
+
+        :param filename: The file to write to, if not the one from the settings
+        :param status: The playbook status
+        :returns: The resolved artifact file name
+        """
+        playbook = self._args.playbook
+        if self._playbook_type == "fqcn" and len(self._plays.value) > 0:
+            playbook = next(k["playbook"] for k in self._plays.value)
+        filename = filename or self._args.playbook_artifact_save_as
+        filename = filename.format(
+            playbook_dir=os.path.dirname(playbook),
+            playbook_name=os.path.splitext(os.path.basename(playbook))[0],
+            playbook_status=status,
+            time_stamp=now_iso(self._args.time_zone),
+        )
+        self._logger.debug("Formatted artifact file name set to %s", filename)
+        filename = abs_user_path(filename)
+        self._logger.debug("Resolved artifact file name set to %s", filename)
+        return filename
+
     def write_artifact(self, filename: str | None = None) -> None:
         """Write the artifact.
 
+        The artifact is written from the plays and stdout held in memory, not
+        compacted from the journal. When writing the artifact for a completed run
+        with a journal, the journal is removed once the artifact has been saved.
+
         :param filename: The file to write to
         :type filename: str
         """
         if filename or self._args.playbook_artifact_enable is True:
             status, status_color = self._get_status()
-            playbook = self._args.playbook
-            if self._playbook_type == "fqcn" and len(self._plays.value) > 0:
-                playbook = next(k["playbook"] for k in self._plays.value)
-            filename = filename or self._args.playbook_artifact_save_as
-            filename = filename.format(
-                playbook_dir=os.path.dirname(playbook),
-                playbook_name=os.path.splitext(os.path.basename(playbook))[0],
-                playbook_status=status,
-                time_stamp=now_iso(self._args.time_zone),
-            )
-            self._logger.debug("Formatted artifact file name set to %s", filename)
-            filename = abs_user_path(filename)
-            self._logger.debug("Resolved artifact file name set to %s", filename)
+            journal = None if filename else self._journal
+            filename = self._artifact_filename(filename=filename, status=status)
+
+            if journal is not None:
+                journal.close(status=status, status_color=status_color)
 
             try:
                 os.makedirs(os.path.dirname(filename), exist_ok=True)
+                plays = self._plays.value
+                if self._artifact is not None:
+                    plays = self._artifact.plays()
                 artifact = {
-                    "version": "2.0.0",
-                    "plays": self._plays.value,
+                    "version": ARTIFACT_VERSION,
+                    "plays": plays,
                     "stdout": self.stdout,
                     "status": status,
                     "status_color": status_color,
                     "settings_entries": to_effective(self._args),
                     "settings_sources": to_sources(self._args),
                 }
-                serialize_write_file(
+                write_indexed_artifact(
                     content=artifact,
-                    content_view=ContentView.NORMAL,
-                    file_mode="w",
                     file=Path(filename),
-                    serialization_format=SerializationFormat.JSON,
+                    cache_path=self._args.internals.cache_path,
                 )
                 self._logger.info("Saved artifact as %s", filename)
 
-            except OSError as exc:
+            except (OSError, TypeError, ValueError) as exc:
                 error = (
                     f"Saving the artifact file failed, resulted in the following error: f{exc!s}"
                 )
                 self._logger.error(error)
+                return
+
+            if journal is not None:
+                journal.remove()
+                self._journal = None
+                self._logger.debug("Removed artifact journal %s", journal.path)
 
     def rerun(self) -> None:
         """Rerun the current playbook.
@@ -928,6 +1082,7 @@ class Action(ActionBase):
             if self.runner.finished:
                 self._plays.value = []
                 self._plays.index = None
+                self._play_index.rebuild(self._plays.value)
                 self._msg_from_plays = (None, None)
                 self._queue.queue.clear()
                 self.stdout = []
@@ -0,0 +1,290 @@
+"""Search subcommand implementation."""
+
+from __future__ import annotations
+
+import curses
+import json
+import shlex
+import sqlite3
+
+from json.decoder import JSONDecodeError
+from typing import Any
+
+from ansible_navigator.action_base import ActionBase
+from ansible_navigator.action_defs import RunStdoutReturn
+from ansible_navigator.app_public import AppPublic
+from ansible_navigator.configuration_subsystem.definitions import ApplicationConfiguration
+from ansible_navigator.content_defs import ContentFormat
+from ansible_navigator.steps import Step
+from ansible_navigator.ui_framework import CursesLine
+from ansible_navigator.ui_framework import CursesLinePart
+from ansible_navigator.ui_framework import CursesLines
+from ansible_navigator.ui_framework import Interaction
+from ansible_navigator.ui_framework import warning_notification
+from ansible_navigator.utils.key_value_store import KeyValueStore
+from ansible_navigator.utils.print import print_to_stdout
+from ansible_navigator.utils.search_index import SearchResult
+from ansible_navigator.utils.search_index import search
+from ansible_navigator.utils.search_index import search_index_exists
+
+from . import _actions as actions
+from . import run_action
+
+
+MISSING_INDEX = (
+    "The search index was not found in the collection doc cache.",
+    "It is created when collections are cataloged, try ':collections' or"
+    " 'ansible-navigator collections' first.",
+)
+"""The messages shown when the search index does not exist"""
+
+
+def color_menu(colno: int, colname: str, entry: dict[str, Any]) -> tuple[int, int]:
+    """Provide a color for a search results menu entry in one column.
+
+    :param colno: The column number
+    :param colname: The column name
+    :param entry: The menu entry
+    :returns: The color and decoration
+    """
+    if entry["__kind"] == "option":
+        return 6, 0
+    if entry["__kind"] == "role":
+        return 4, 0
+    return 2, 0
+
+
+def content_heading(obj: Any, screen_w: int) -> CursesLines | None:
+    """Create a heading for a search result.
+
+    :param obj: The content going to be shown
+    :param screen_w: The current screen width
+    :returns: The heading
+    """
+    heading = f"{obj['__name']} ({obj['__kind']})"
+    if obj["__of"]:
+        heading += f" of {obj['__of']}"
+    padding = " " * (screen_w - len(heading) + 1)
+    line_part = CursesLinePart(
+        column=0,
+        string=heading + padding,
+        color=0,
+        decoration=curses.A_UNDERLINE,
+    )
+    return CursesLines((CursesLine((line_part,)),))
+
+
+def filter_content_keys(obj: dict[Any, Any]) -> dict[Any, Any]:
+    """Filter out some keys when showing a search result.
+
+    :param obj: The object from which keys should be removed
+    :returns: The object with keys removed
+    """
+    return {k: v for k, v in obj.items() if not k.startswith("__")}
+
+
+def to_menu_entry(result: SearchResult) -> dict[str, Any]:
+    """Convert a search result to an entry in the search results menu.
+
+    :param result: The search result
+    :returns: The menu entry
+    """
+    return {
+        "__name": result.name,
+        "__kind": result.kind,
+        "__of": result.parent,
+        "__collection": result.collection,
+        "__description": result.description,
+        "__checksum": result.checksum,
+    }
+
+
+def to_stdout_entry(result: SearchResult) -> dict[str, str]:
+    """Convert a search result for mode stdout.
+
+    :param result: The search result
+    :returns: The search result, without empty values or the checksum
+    """
+    entry = result._asdict()
+    del entry["checksum"]
+    return {key: value for key, value in entry.items() if value}
+
+
+@actions.register
+class Action(ActionBase):
+    """Search subcommand implementation."""
+
+    KEGEX = r"^search(\s(?P<params>.*))?$"
+
+    def __init__(self, args: ApplicationConfiguration):
+        """Initialize the ``search`` action.
+
+        :param args: The current settings for the application
+        """
+        super().__init__(args=args, logger_name=__name__, name="search")
+        self._collection_cache: KeyValueStore
+
+    def run(self, interaction: Interaction, app: AppPublic) -> Interaction | None:
+        """Execute the ``search`` request for mode interactive.
+
+        :param interaction: The interaction from the user
+        :param app: The app instance
+        :returns: The pending :class:`~ansible_navigator.ui_framework.ui.Interaction` or
+            :data:`None`
+        """
+        self._logger.debug("search requested")
+        self._prepare_to_run(app, interaction)
+
+        params = [self._name] + shlex.split(
+            self._interaction.action.match.groupdict()["params"] or "",
+        )
+        args_updated = self._update_args(params=params, attach_cdc=True)
+        if not args_updated:
+            self._prepare_to_exit(interaction)
+            return None
+
+        if not isinstance(self._args.internals.collection_doc_cache, KeyValueStore):
+            notification = warning_notification(
+                messages=[
+                    "Something has gone really wrong, the collection document cache is not",
+                    "available.  This should not have happened. Please log an issue, and",
+                    "include the contents of the log file.",
+                ],
+            )
+            interaction.ui.show_form(notification)
+            self._prepare_to_exit(interaction)
+            return None
+
+        results = self._search()
+        if results is None:
+            warning = warning_notification(messages=list(MISSING_INDEX))
+            interaction.ui.show_form(warning)
+            self._prepare_to_exit(interaction)
+            return None
+
+        self.steps.append(
+            Step(
+                name="search_results",
+                columns=["__name", "__kind", "__of", "__collection", "__description"],
+                select_func=self._build_result_content,
+                step_type="menu",
+                value=[to_menu_entry(result) for result in results],
+            ),
+        )
+
+        while True:
+            self._calling_app.update()
+            self._take_step()
+
+            if not self.steps:
+                break
+
+            if self.steps.current.name == "quit":
+                return self.steps.current
+
+        self._prepare_to_exit(interaction)
+        return None
+
+    def run_stdout(self) -> RunStdoutReturn:
+        """Execute the ``search`` request for mode stdout.
+
+        :returns: The return code, 0 if there are results, otherwise 1 with a message
+        """
+        self._logger.debug("search requested in stdout mode")
+
+        args_updated = self._update_args(params=[], attach_cdc=True)
+        if not args_updated or not isinstance(
+            self._args.internals.collection_doc_cache,
+            KeyValueStore,
+        ):
+            msg = (
+                "Failed to open the collection doc cache, "
+                "Please review the ansible-navigator log file for errors."
+            )
+            return RunStdoutReturn(message=msg, return_code=1)
+
+        results = self._search()
+        if results is None:
+            return RunStdoutReturn(message=" ".join(MISSING_INDEX), return_code=1)
+        if not results:
+            return RunStdoutReturn(message="No results found.", return_code=1)
+
+        print_to_stdout(
+            content=[to_stdout_entry(result) for result in results],
+            content_format=getattr(ContentFormat, self._args.format.upper()),
+            use_color=self._args.display_color,
+        )
+        return RunStdoutReturn(message="", return_code=0)
+
+    def _search(self) -> list[SearchResult] | None:
+        """Search the index in the collection doc cache.
+
+        :returns: The search results, or None if the index does not exist
+        """
+        self._collection_cache = self._args.internals.collection_doc_cache
+        terms = " ".join(self._args.search_terms)
+        self._collection_cache.open_()
+        try:
+            if not search_index_exists(self._collection_cache):
+                self._logger.error("The search index does not exist")
+                return None
+            results = search(self._collection_cache, terms)
+        except sqlite3.OperationalError as exc:
+            self._logger.error("Failed to search the index: %s", str(exc))
+            return None
+        finally:
+            self._collection_cache.close()
+        self._logger.debug("Found %s results for '%s'", len(results), terms)
+        return results
+
+    def _take_step(self) -> None:
+        """Take a step based on the current step or step back."""
+        result = None
+        if isinstance(self.steps.current, Interaction):
+            result = run_action(self.steps.current.name, self.app, self.steps.current)
+        elif isinstance(self.steps.current, Step):
+            if self.steps.current.type == "menu":
+                result = self._interaction.ui.show(
+                    obj=self.steps.current.value,
+                    columns=self.steps.current.columns,
+                    color_menu_item=color_menu,
+                )
+            elif self.steps.current.type == "content":
+                result = self._interaction.ui.show(
+                    obj=self.steps.current.value,
+                    index=self.steps.current.index,
+                    content_heading=content_heading,
+                    filter_content_keys=filter_content_keys,
+                )
+
+        if result is None:
+            self.steps.back_one()
+        else:
+            self.steps.append(result)
+
+    def _build_result_content(self) -> Step:
+        """Build the content for the selected search result.
+
+        Plugins and their options are shown with the plugin's full documentation from
+        the collection doc cache, roles and role arguments with their description.
+
+        :returns: The search result content definition
+        """
+        selected = self.steps.current.value[self.steps.current.index]
+        entry: dict[str, Any] = {"description": selected["__description"]}
+        if selected["__checksum"]:
+            self._collection_cache.open_()
+            try:
+                entry = json.loads(self._collection_cache[selected["__checksum"]])["plugin"]
+            except (KeyError, JSONDecodeError) as exc:
+                self._logger.error("error loading plugin doc %s", selected["__name"])
+                self._logger.debug("error was %s", str(exc))
+            finally:
+                self._collection_cache.close()
+        entry.update({key: value for key, value in selected.items() if key.startswith("__")})
+        return Step(
+            name="search_result_content",
+            step_type="content",
+            value=[entry],
+            index=0,
+        )
@@ -4,6 +4,8 @@ from ansible_navigator.action_base import ActionBase
 from ansible_navigator.app_public import AppPublic
 from ansible_navigator.configuration_subsystem.definitions import ApplicationConfiguration
 from ansible_navigator.content_defs import ContentFormat
+from ansible_navigator.ui_framework import AnsiLines
+from ansible_navigator.ui_framework import Content
 from ansible_navigator.ui_framework import Interaction
 
 from . import _actions as actions
@@ -25,6 +27,9 @@ class Action(ActionBase):
     def run(self, interaction: Interaction, app: AppPublic) -> Interaction:
         """Execute the ``:stdout`` request for mode interactive.
 
+        Each line is converted for the screen once, when first shown, rather than on
+        each refresh.
+
         :param interaction: The interaction from the user
         :param app: The app instance
         :returns: The pending :class:`~ansible_navigator.ui_framework.ui.Interaction`
@@ -33,15 +38,15 @@ class Action(ActionBase):
         self._prepare_to_run(app, interaction)
 
         auto_scroll = True
+        lines = AnsiLines(app.stdout)
         while True:
             self._calling_app.update()
 
             new_scroll = len(self._calling_app.stdout)
             if auto_scroll:
                 interaction.ui.scroll(new_scroll)
-            obj = "\n".join(app.stdout)
             next_interaction: Interaction = interaction.ui.show(
-                obj=obj,
+                obj=lines,
                 content_format=ContentFormat.ANSI,
             )
             if next_interaction.name != "refresh":
@@ -54,5 +59,9 @@ class Action(ActionBase):
                 self._logger.debug("auto_scroll enabled")
                 auto_scroll = True
 
+        if next_interaction.content is not None:
+            # Provide the text for the next action, for example ``:write``
+            next_interaction = next_interaction._replace(content=Content(showing=str(lines)))
+
         self._prepare_to_exit(interaction)
         return next_interaction
@@ -25,9 +25,13 @@ from .configuration_subsystem import Constants
 from .configuration_subsystem import NavigatorConfiguration
 from .configuration_subsystem.definitions import ApplicationConfiguration
 from .image_manager import ImagePuller
+from .image_manager import IntrospectionCache
 from .initialization import error_and_exit_early
 from .initialization import parse_and_update
+from .logger import QueueListener
 from .logger import setup_logger
+from .runner.container_session import stop_sessions
+from .runner.container_session import stop_sessions_on_signals
 from .utils.compatibility import importlib_metadata
 from .utils.definitions import ExitMessage
 from .utils.definitions import ExitPrefix
@@ -115,10 +119,22 @@ def pull_image(args):
         image_puller.pull_stdout()
 
 
-def run(args: ApplicationConfiguration) -> ActionReturn:
+def dirty_exit(log_listener: QueueListener) -> None:
+    """Remove the session containers, write the waiting log records and terminate the process.
+
+    :param log_listener: The listener writing the log records
+    """
+    logger.warning("Dirty exit, killing the pid")
+    stop_sessions()
+    log_listener.stop()
+    os.kill(os.getpid(), signal.SIGTERM)
+
+
+def run(args: ApplicationConfiguration, log_listener: QueueListener) -> ActionReturn:
     """Run the appropriate subcommand.
 
     :param args: The current application settings
+    :param log_listener: The listener writing the log records
     :returns: A message to display and a return code
     """
     if args.mode == "stdout":
@@ -126,17 +142,20 @@ def run(args: ApplicationConfiguration) -> ActionReturn:
             result = run_action_stdout(args.app.replace("-", "_"), args)
             return result
         except KeyboardInterrupt:
-            logger.warning("Dirty exit, killing the pid")
-            os.kill(os.getpid(), signal.SIGTERM)
+            dirty_exit(log_listener)
             return RunStdoutReturn(message="", return_code=1)
     elif args.mode == "interactive":
+        # Requests clear the cache only when asked to, so clear it once for the
+        # settings the application started with
+        if args.images_clear_cache:
+            IntrospectionCache(cache_path=args.internals.cache_path).clear()
         try:
             clear_screen()
+            stop_sessions_on_signals()
             wrapper(ActionRunner(args=args).run)
             return RunInteractiveReturn(message="", return_code=0)
         except KeyboardInterrupt:
-            logger.warning("Dirty exit, killing the pid")
-            os.kill(os.getpid(), signal.SIGTERM)
+            dirty_exit(log_listener)
             return RunInteractiveReturn(message="", return_code=1)
     return RunReturn(message="", return_code=0)
 
@@ -173,7 +192,7 @@ def main():
 
     try:
         Path(args.log_file).touch()
-        setup_logger(args)
+        log_listener = setup_logger(args)
     except Exception as exc:  # noqa: BLE001
         exit_msg = "The log file path or logging engine could not be setup."
         exit_msg += " No log file will be available, please check the log file"
@@ -181,29 +200,33 @@ def main():
         exit_messages.append(ExitMessage(message=exit_msg))
         error_and_exit_early(exit_messages=exit_messages)
 
-    for entry in messages:
-        logger.log(level=entry.level, msg=entry.message)
-
-    if exit_messages:
-        for exit_msg in exit_messages:
-            logger.log(level=exit_msg.level, msg=exit_msg.message)
-        error_and_exit_early(exit_messages=exit_messages)
-
-    os.environ.setdefault("ESCDELAY", "25")
-
-    if args.execution_environment:
-        pull_image(args)
-        cache_scripts()
-
-    run_return = run(args)
-    run_message = f"{run_return.message}\n"
-    if run_return.return_code != 0 and run_return.message:
-        sys.stderr.write(run_message)
-        sys.exit(run_return.return_code)
-    elif run_return.return_code != 0:
-        sys.exit(run_return.return_code)
-    elif run_return.message:
-        sys.stdout.write(run_message)
+    try:
+        for entry in messages:
+            logger.log(level=entry.level, msg=entry.message)
+
+        if exit_messages:
+            for exit_msg in exit_messages:
+                logger.log(level=exit_msg.level, msg=exit_msg.message)
+            error_and_exit_early(exit_messages=exit_messages)
+
+        os.environ.setdefault("ESCDELAY", "25")
+
+        if args.execution_environment:
+            pull_image(args)
+            cache_scripts()
+
+        run_return = run(args, log_listener)
+        run_message = f"{run_return.message}\n"
+        if run_return.return_code != 0 and run_return.message:
+            sys.stderr.write(run_message)
+            sys.exit(run_return.return_code)
+        elif run_return.return_code != 0:
+            sys.exit(run_return.return_code)
+        elif run_return.message:
+            sys.stdout.write(run_message)
+    finally:
+        # Write the log records waiting in the queue
+        log_listener.stop()
 
 
 if __name__ == "__main__":
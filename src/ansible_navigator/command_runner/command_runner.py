@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import multiprocessing
 import subprocess
+import threading
 
 from dataclasses import dataclass
 from dataclasses import field
@@ -73,7 +74,7 @@ def run_command(command: Command) -> None:
         command.stderr = str(exc.stderr)
 
 
-def worker(pending_queue: multiprocessing.Queue, completed_queue: multiprocessing.Queue) -> None:
+def worker(pending_queue: Queue, completed_queue: Queue) -> None:
     """Read pending, run, post process, and place in completed.
 
     :param pending_queue: All pending commands
@@ -131,6 +132,34 @@ class CommandRunner:
             results.append(self._completed_queue.get())
         return results
 
+    @staticmethod
+    def run_multi_thread(commands: list[Command], max_workers: int = PROCESSES) -> list[Command]:
+        """Run commands with a bounded number of threads.
+
+        Each command runs in a subprocess, so threads are sufficient to run them in
+        parallel without the cost of starting worker processes.
+
+        :param commands: All commands to be run
+        :param max_workers: The maximum number of commands to run at once
+        :returns: The results from running all commands
+        """
+        pending_queue: Queue = Queue()
+        completed_queue: Queue = Queue()
+        worker_count = min(len(commands), max_workers)
+        threads = [
+            threading.Thread(target=worker, args=(pending_queue, completed_queue))
+            for _thread in range(worker_count)
+        ]
+        for thread in threads:
+            thread.start()
+        for command in commands:
+            pending_queue.put(command)
+        for _thread in threads:
+            pending_queue.put(None)
+        for thread in threads:
+            thread.join()
+        return [completed_queue.get() for _command in commands]
+
     def start_workers(self, jobs):
         """Start the workers.
 
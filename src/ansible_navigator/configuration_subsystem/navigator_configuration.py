@@ -198,6 +198,15 @@ navigator_subcommands = [
         ),
         version_added="v1.0",
     ),
+    SubCommand(
+        name="search",
+        description="Search the documentation of the plugins and roles in all collections",
+        epilog=(
+            "Note: The documentation is searched in the collection doc cache,"
+            " which is populated by 'ansible-navigator collections'."
+        ),
+        version_added="v3.5",
+    ),
     SubCommand(
         name="settings",
         description="Review the current ansible-navigator settings",
@@ -390,6 +399,18 @@ NavigatorConfiguration = ApplicationConfiguration(
             ),
             version_added="v1.0",
         ),
+        SettingsEntry(
+            name="execution_environment_session",
+            choices=[True, False],
+            cli_parameters=CliParameters(short="--ees"),
+            settings_file_path_override="execution-environment.session",
+            short_description=(
+                "Start one execution environment container for the session and reuse it for"
+                " the ansible commands run in mode interactive"
+            ),
+            value=SettingsEntryValue(default=False),
+            version_added="v3.5",
+        ),
         SettingsEntry(
             name="execution_environment_volume_mounts",
             cli_parameters=CliParameters(action="append", nargs="+", short="--eev"),
@@ -408,7 +429,7 @@ NavigatorConfiguration = ApplicationConfiguration(
             choices=["json", "yaml"],
             cli_parameters=CliParameters(short="--fmt"),
             short_description="Specify the format for stdout output.",
-            subcommands=["collections", "images"],
+            subcommands=["collections", "images", "search"],
             value=SettingsEntryValue(default="yaml"),
             version_added="v2.3",
         ),
@@ -462,6 +483,22 @@ NavigatorConfiguration = ApplicationConfiguration(
             value=SettingsEntryValue(default=False),
             version_added="v1.0",
         ),
+        SettingsEntry(
+            name="images_clear_cache",
+            choices=[True, False],
+            cli_parameters=CliParameters(
+                action="store_true",
+                short="--icc",
+                long_override="--clear-cache",
+            ),
+            settings_file_path_override="images.clear-cache",
+            short_description=(
+                "Remove the cached introspection of all images, so they are introspected again"
+            ),
+            subcommands=["images"],
+            value=SettingsEntryValue(default=False),
+            version_added="v3.5",
+        ),
         SettingsEntry(
             name="images_details",
             choices=[
@@ -628,7 +665,8 @@ NavigatorConfiguration = ApplicationConfiguration(
             short_description=(
                 "Specify the name for artifacts created from completed playbooks."
                 " The following placeholders are available: {playbook_dir}, {playbook_name},"
-                " {playbook_status}, and {time_stamp}"
+                " {playbook_status}, and {time_stamp}. The artifact is compressed when the file"
+                " name ends with '.bz2', '.gz' or '.xz'"
             ),
             subcommands=["run"],
             value=SettingsEntryValue(
@@ -636,6 +674,20 @@ NavigatorConfiguration = ApplicationConfiguration(
             ),
             version_added="v1.0",
         ),
+        SettingsEntry(
+            name="playbook_artifact_stream",
+            choices=[True, False],
+            cli_parameters=CliParameters(short="--pasm", action="store_true"),
+            settings_file_path_override="playbook-artifact.stream",
+            short_description=(
+                "Append playbook events to a JSON lines journal next to the artifact as they"
+                " are received, so they are kept if the run is interrupted. The artifact is"
+                " still written from memory when the playbook completes"
+            ),
+            subcommands=["run"],
+            value=SettingsEntryValue(default=False),
+            version_added="v3.5",
+        ),
         SettingsEntry(
             name="plugin_name",
             cli_parameters=CliParameters(positional=True),
@@ -683,6 +735,15 @@ NavigatorConfiguration = ApplicationConfiguration(
             value=SettingsEntryValue(default="tag"),
             version_added="v1.0",
         ),
+        SettingsEntry(
+            name="search_terms",
+            cli_parameters=CliParameters(positional=True, nargs="*"),
+            settings_file_path_override="search.terms",
+            short_description="Specify the terms to search for in the collection documentation",
+            subcommands=["search"],
+            value=SettingsEntryValue(),
+            version_added="v3.5",
+        ),
         SettingsEntry(
             name="set_environment_variable",
             cli_parameters=CliParameters(action="append", nargs="+", short="--senv"),
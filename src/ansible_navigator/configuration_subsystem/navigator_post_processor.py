@@ -342,6 +342,9 @@ class NavigatorPostProcessor:
             entry.value.current = f"{entry.value.current}:latest"
         return messages, exit_messages
 
+    # Post process execution_environment_session.
+    execution_environment_session = _true_or_false
+
     @_post_processor
     def execution_environment_volume_mounts(
         self,
@@ -532,6 +535,9 @@ class NavigatorPostProcessor:
     # Post process for help_playbook
     help_playbook = _disable_pae_and_enforce_stdout
 
+    # Post process images_clear_cache.
+    images_clear_cache = _true_or_false
+
     @_post_processor
     def images_details(
         self,
@@ -1031,6 +1037,9 @@ class NavigatorPostProcessor:
         exit_messages.append(ExitMessage(message=exit_msg, prefix=ExitPrefix.HINT))
         return messages, exit_messages
 
+    # Post process playbook_artifact_stream.
+    playbook_artifact_stream = _true_or_false
+
     @staticmethod
     @_post_processor
     def pull_arguments(
@@ -1077,6 +1086,32 @@ class NavigatorPostProcessor:
             messages.append(LogMessage(level=logging.DEBUG, message=message))
         return messages, exit_messages
 
+    @staticmethod
+    @_post_processor
+    def search_terms(entry: SettingsEntry, config: ApplicationConfiguration) -> PostProcessorReturn:
+        """Post process search_terms.
+
+        :param entry: The current settings entry
+        :param config: The full application configuration
+        :returns: An instance of the standard post process return object
+        """
+        messages: list[LogMessage] = []
+        exit_messages: list[ExitMessage] = []
+        if isinstance(entry.value.current, str):
+            entry.value.current = entry.value.current.split()
+        elif isinstance(entry.value.current, list):
+            entry.value.current = [str(term) for term in flatten_list(entry.value.current)]
+
+        if config.app != "search":
+            return messages, exit_messages
+
+        if not entry.value.current or entry.value.current is C.NOT_SET:
+            exit_msg = "One or more search terms are required when using the search subcommand"
+            exit_messages.append(ExitMessage(message=exit_msg))
+            exit_msg = "Try again with 'search <terms>'"
+            exit_messages.append(ExitMessage(message=exit_msg, prefix=ExitPrefix.HINT))
+        return messages, exit_messages
+
     @staticmethod
     @_post_processor
     def set_environment_variable(
@@ -8,6 +8,7 @@ import json
 import multiprocessing
 import os
 import re
+import sqlite3
 import subprocess
 import sys
 
@@ -36,31 +37,145 @@ except ImportError:
 
 # Import from the source tree whenever possible. When running
 # in an execution environment, and therefore not type checking
-# import from the key_value_store which was injected in the path.
+# import from the key_value_store and search_index which were injected in the path.
 # The TYPE_CHECKING conditional prevents mypy from attempting the
 # import and causing an import error.
 try:
     from ansible_navigator.utils.key_value_store import KeyValueStore
+    from ansible_navigator.utils.search_index import update_search_index
 except ImportError:
     if not TYPE_CHECKING:
         from key_value_store import KeyValueStore
+        from search_index import update_search_index
 
 
 PROCESSES = (multiprocessing.cpu_count() - 1) or 1
 
+CHUNKS_PER_PROCESS = 4
+"""The number of chunks of plugins sent to each worker process, to balance the load"""
+
+CHUNK_SIZE_MAX = 100
+"""The maximum number of plugins sent to a worker process at once"""
+
+FRAGMENT_LOADER = None
+"""The ansible fragment loader, loaded once by each worker process"""
+
+INDEX_KEY_PREFIX = "catalog_index_v2:"
+"""The prefix of the collection cache keys for the catalog index, followed by the runtime
+and the path"""
+
+FINGERPRINT_FILES = ("MANIFEST.json", "FILES.json")
+"""The files of an installed collection which change when it is installed again"""
+
+SUMMARY_KEY_PREFIX = "summary_v2:"
+"""The prefix of the collection cache keys for plugin summaries, followed by the checksum"""
+
+SUMMARY_KEYS = ("deprecated", "name", "short_description", "version_added")
+"""The keys of a plugin's doc kept in its summary, with the key named for the plugin type"""
+
 
 class CollectionCatalog:
-    """A collection cataloger."""
+    """A collection cataloger.
+
+    When an index is provided, each cataloged collection is stored in it along with a
+    fingerprint, the modification time and size of the files changed when the
+    collection is installed. Collections with an unchanged fingerprint are then
+    loaded from the index rather than cataloged again. Collections without a
+    fingerprint, for example those with only a ``galaxy.yml``, are always cataloged.
 
-    def __init__(self, directories: list[Path]):
+    The index keys include the runtime, the ansible installation cataloging, so the
+    catalogs of execution environments and of the local installation sharing a cache,
+    which may find collections at the same paths, are kept apart.
+    """
+
+    def __init__(
+        self,
+        directories: list[Path],
+        index: KeyValueStore | None = None,
+        runtime: str | None = None,
+    ):
         """Initialize the collection cataloger.
 
         :param directories: A list of directories that may contain collections
+        :param index: The key value store used to persist the catalog index
+        :param runtime: The identity of the ansible installation, determined if not provided
         """
         self._directories: list[Path] = directories
+        self._index_prefix = f"{INDEX_KEY_PREFIX}{runtime or runtime_id()}:"
         self._collections: OrderedDict[str, dict] = OrderedDict()
         self._errors: list[dict[str, str]] = []
         self._messages: list[str] = []
+        self._index = index
+        self._fingerprints: dict[str, list] = {}
+        self._collection_errors: dict[str, list[dict[str, str]]] = {}
+        self.unchanged = 0
+
+    def _fingerprint(self, directory_path: Path) -> list | None:
+        """Fingerprint an installed collection.
+
+        :param directory_path: The path to the collection
+        :returns: The fingerprint, or None if the collection is not installed
+        """
+        fingerprint: list = []
+        for name in FINGERPRINT_FILES:
+            try:
+                stat = Path(directory_path, name).stat()
+            except OSError:
+                return None
+            fingerprint.append([name, stat.st_mtime_ns, stat.st_size])
+        return fingerprint
+
+    def _from_index(self, collection_path: str, fingerprint: list | None) -> bool:
+        """Load a collection from the index if it is unchanged.
+
+        :param collection_path: The path to the collection
+        :param fingerprint: The current fingerprint of the collection
+        :returns: True if the collection was loaded from the index
+        """
+        if self._index is None or fingerprint is None:
+            return False
+        self._fingerprints[collection_path] = fingerprint
+        try:
+            record = json.loads(self._index[f"{self._index_prefix}{collection_path}"])
+        except KeyError:
+            return False
+        if record["fingerprint"] != fingerprint:
+            return False
+        self._collections[collection_path] = record["collection"]
+        self._errors.extend(record["errors"])
+        self.unchanged += 1
+        return True
+
+    def _update_index(self) -> None:
+        """Store the collections cataloged, which have a fingerprint, in the index.
+
+        Entries of this runtime for collections not found in this run are removed from the
+        index, those of other runtimes are kept.
+        """
+        if self._index is None:
+            return
+        stale = [
+            key
+            for key in self._index.iterkeys()
+            if key.startswith(self._index_prefix)
+            and key[len(self._index_prefix) :] not in self._fingerprints
+        ]
+        records = []
+        for collection_path, fingerprint in self._fingerprints.items():
+            if collection_path not in self._collection_errors:
+                # Loaded from the index, or not cataloged as its metadata could not be loaded
+                continue
+            record = {
+                "collection": self._collections[collection_path],
+                "errors": self._collection_errors[collection_path],
+                "fingerprint": fingerprint,
+            }
+            key = f"{self._index_prefix}{collection_path}"
+            records.append((key, json.dumps(record, default=str)))
+        with self._index.transaction():
+            for key in stale:
+                del self._index[key]
+            self._index.update_many(records)
 
     def _catalog_plugins(self, collection: dict) -> None:
         """Catalog the plugins within a collection.
@@ -256,6 +371,9 @@ class CollectionCatalog:
         :param directory: The path to collections directory to walk and load
         """
         for directory_path in directory.glob("*/*/"):
+            if self._from_index(str(directory_path), self._fingerprint(directory_path)):
+                continue
+            errors_start = len(self._errors)
             manifest_file = directory_path / "MANIFEST.json"
             galaxy_file = directory_path / "galaxy.yml"
             collection = None
@@ -298,6 +416,7 @@ class CollectionCatalog:
                             self._errors.append({"path": str(runtime_file), "error": str(exc)})
 
                 self._collections[collection["path"]] = collection
+                self._collection_errors[collection["path"]] = self._errors[errors_start:]
             else:
                 msg = (
                     f"collection path '{directory_path}' is ignored as it does not"
@@ -332,13 +451,23 @@ class CollectionCatalog:
                 self._one_path(collection_directory)
         self.add_pseudo_builtin()
         for collection in self._collections.values():
+            if collection["path"] not in self._collection_errors:
+                # Loaded from the index
+                continue
+            errors_start = len(self._errors)
             self._catalog_plugins(collection)
             self._catalog_roles(collection)
+            self._collection_errors[collection["path"]].extend(self._errors[errors_start:])
+        self._update_index()
         self._find_shadows()
         return self._collections, self._errors
 
     def add_pseudo_builtin(self) -> None:
-        """Add the pseudo builtin collection."""
+        """Add the pseudo builtin collection.
+
+        The fingerprint of the builtin collection is the ansible version and the modification
+        time of the modules directory, which changes when ansible is installed again.
+        """
         collection: dict[str, str | list | dict] = {}
         collection["known_as"] = "ansible.builtin"
         collection["plugin_checksums"] = {}
@@ -346,86 +475,147 @@ class CollectionCatalog:
         collection["runtime"] = {}
         collection["meta_source"] = "None"
         collection["collection_info"] = {"version": ansible_version}
-        self._collections[str(collection["path"])] = collection
+        try:
+            modules = Path(collection["path"], "modules").stat().st_mtime_ns
+            fingerprint: list | None = [["ansible", ansible_version], ["modules", modules]]
+        except OSError:
+            fingerprint = None
+        if not self._from_index(collection["path"], fingerprint):
+            self._collections[collection["path"]] = collection
+            self._collection_errors[collection["path"]] = []
         msg = f"Added ansible.builtin from: {collection['path']}"
         self._messages.append(msg)
 
 
-def worker(pending_queue: multiprocessing.Queue, completed_queue: multiprocessing.Queue) -> None:
-    """Extract the documentation from a plugin, place in completed queue.
+def runtime_id() -> str:
+    """Identify the ansible installation cataloging the collections.
 
-    :param pending_queue: A queue with plugins to process
-    :param completed_queue: The queue in which extracted documentation will be placed
+    The ansible version, python executable and the location and modification time of
+    the ansible package differ between execution environments and a local installation.
+
+    :returns: A digest identifying the ansible installation
     """
+    ansible_path = Path(plugins.__file__).parents[1]
+    try:
+        modified = ansible_path.stat().st_mtime_ns
+    except OSError:
+        modified = 0
+    identity = f"{ansible_version}:{sys.executable}:{ansible_path}:{modified}"
+    return hashlib.sha256(identity.encode()).hexdigest()[:16]
+
+
+def worker_init() -> None:
+    """Load the fragment loader once for each worker process in the pool."""
+    # pylint: disable=global-statement
     # pylint: disable=import-outside-toplevel
+    global FRAGMENT_LOADER
 
     # load the fragment_loader _after_ the path is set
     from ansible.plugins.loader import fragment_loader
 
-    while True:
-        entry = pending_queue.get()
-        if entry is None:
-            break
-        collection_name, checksum, plugin_path = entry
+    FRAGMENT_LOADER = fragment_loader
 
-        try:
-            if ansible_version.startswith("2.9"):
-                (doc, examples, returndocs, metadata) = get_docstring(
-                    filename=str(plugin_path),
-                    fragment_loader=fragment_loader,
-                )
-            else:
-                (doc, examples, returndocs, metadata) = get_docstring(
-                    filename=str(plugin_path),
-                    fragment_loader=fragment_loader,
-                    collection_name=collection_name,
-                )
 
-        except Exception as exc:  # noqa: BLE001
-            err_message = f"{type(exc).__name__} (get_docstring): {exc!s}"
-            completed_queue.put(("error", (checksum, plugin_path, err_message)))
-            continue
+def summarize(doc: dict | None, plugin_type: str) -> dict:
+    """Summarize the documentation of a plugin for the collection content menu.
 
-        try:
-            q_message = {
-                "plugin": {
-                    "doc": doc,
-                    "examples": examples,
-                    "returndocs": returndocs,
-                    "metadata": metadata,
-                },
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-            }
-            completed_queue.put(("plugin", (checksum, json.dumps(q_message, default=str))))
-        except JSONDecodeError as exc:
-            err_message = f"{type(exc).__name__} (json_decode_doc): {exc!s}"
-            completed_queue.put(("error", (checksum, plugin_path, err_message)))
+    The summary has the same layout as the full documentation, but only the keys in
+    ``SUMMARY_KEYS`` and the one named for the plugin type are kept, as strings, so the
+    menu can show them whatever the plugin's doc holds.
+
+    :param doc: The documentation of the plugin
+    :param plugin_type: The type of the plugin
+    :returns: The plugin summary
+    """
+    if doc is None:
+        return {"plugin": {"doc": None}}
+    summary = {
+        key: None if doc[key] is None else str(doc[key])
+        for key in (*SUMMARY_KEYS, plugin_type)
+        if key in doc
+    }
+    return {"plugin": {"doc": summary}}
 
 
-def identify_missing(collections: dict, collection_cache: KeyValueStore) -> tuple[set, list, int]:
+def extract_docs(entry: tuple[str, str, Path, str]) -> tuple[str, tuple]:
+    """Extract the documentation from a plugin.
+
+    :param entry: The collection name, checksum, path and type of the plugin
+    :returns: The message type and either the documentation and summary or the error
+    """
+    collection_name, checksum, plugin_path, plugin_type = entry
+
+    try:
+        if ansible_version.startswith("2.9"):
+            (doc, examples, returndocs, metadata) = get_docstring(
+                filename=str(plugin_path),
+                fragment_loader=FRAGMENT_LOADER,
+            )
+        else:
+            (doc, examples, returndocs, metadata) = get_docstring(
+                filename=str(plugin_path),
+                fragment_loader=FRAGMENT_LOADER,
+                collection_name=collection_name,
+            )
+
+    except Exception as exc:  # noqa: BLE001
+        err_message = f"{type(exc).__name__} (get_docstring): {exc!s}"
+        return "error", (checksum, plugin_path, err_message)
+
+    try:
+        q_message = {
+            "plugin": {
+                "doc": doc,
+                "examples": examples,
+                "returndocs": returndocs,
+                "metadata": metadata,
+            },
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        }
+        summary = json.dumps(summarize(doc, plugin_type), default=str)
+        return "plugin", (checksum, json.dumps(q_message, default=str), summary)
+    except JSONDecodeError as exc:
+        err_message = f"{type(exc).__name__} (json_decode_doc): {exc!s}"
+        return "error", (checksum, plugin_path, err_message)
+
+
+def worker(chunk: list[tuple[str, str, Path, str]]) -> list[tuple[str, tuple]]:
+    """Extract the documentation from a chunk of plugins.
+
+    :param chunk: The collection name, checksum, path and type of each plugin
+    :returns: The message type and either the documentation or the error for each plugin
+    """
+    return [extract_docs(entry) for entry in chunk]
+
+
+def identify_missing(
+    collections: dict,
+    collection_cache: KeyValueStore,
+) -> tuple[set, list, int, set]:
     """Identify plugins missing from the cache.
 
+    The unique plugins are collected in one pass over the collections, then checked
+    against the cache in batches rather than with one query for each plugin.
+
     :param collections: All plugins found across all collections
     :param collection_cache: The key value interface to a sqlite database
-    :returns: Handled and plugins missing from the cache, including a count of plugins
+    :returns: Handled and plugins missing from the cache, a count of plugins and those cached
     """
-    handled = set()
-    missing = []
+    unique: dict[str, tuple[str, str, Path, str]] = {}
     plugin_count = 0
     for collection in collections.values():
+        plugin_count += len(collection["plugin_checksums"])
         for checksum, details in collection["plugin_checksums"].items():
-            plugin_count += 1
-            if checksum not in handled:
-                if checksum not in collection_cache:
-                    missing.append(
-                        (
-                            collection["known_as"],
-                            checksum,
-                            Path(collection["path"], details["path"]),
-                        ),
-                    )
-                handled.add(checksum)
-    return handled, missing, plugin_count
+            if checksum not in unique:
+                unique[checksum] = (
+                    collection["known_as"],
+                    checksum,
+                    Path(collection["path"], details["path"]),
+                    details["type"],
+                )
+    cached = collection_cache.contains_many(unique)
+    missing = [entry for checksum, entry in unique.items() if checksum not in cached]
+    return set(unique), missing, plugin_count, cached
 
 
 def parse_args() -> tuple[argparse.Namespace, list[Path]]:
@@ -491,41 +681,44 @@ def retrieve_docs(
     errors: list,
     missing: list,
     stats: dict,
-) -> None:
+) -> set[str]:
     # pylint: disable=too-many-locals
     """Extract the docs from the plugins.
 
+    The plugins are split into chunks and processed by a pool of worker processes,
+    each importing the ansible plugin loader once.
+
     :param collection_cache: The key value interface to a sqlite database
     :param errors: Previous errors encountered
     :param missing: Plugins missing from the collection cache
     :param stats: Statistics related to the collection cataloging process
+    :returns: The checksums of the plugins added to the cache
     """
-    pending_queue = multiprocessing.Manager().Queue()
-    completed_queue = multiprocessing.Manager().Queue()
-    processes = []
-    for _proc in range(PROCESSES):
-        proc = multiprocessing.Process(target=worker, args=(pending_queue, completed_queue))
-        processes.append(proc)
-        proc.start()
-
-    for entry in missing:
-        pending_queue.put(entry)
-    for _proc in range(PROCESSES):
-        pending_queue.put(None)
-    for proc in processes:
-        proc.join()
-
-    while not completed_queue.empty():
-        message_type, message = completed_queue.get()
-        if message_type == "plugin":
-            checksum, plugin = message
-            collection_cache[checksum] = plugin
-            stats["cache_added_success"] += 1
-        elif message_type == "error":
-            checksum, plugin_path, error = message
-            collection_cache[checksum] = json.dumps({"error": error})
-            errors.append({"path": str(plugin_path), "error": error})
-            stats["cache_added_errors"] += 1
+    added = set()
+    chunk_size = len(missing) // (PROCESSES * CHUNKS_PER_PROCESS)
+    chunk_size = min(max(chunk_size, 1), CHUNK_SIZE_MAX)
+    chunks = [missing[idx : idx + chunk_size] for idx in range(0, len(missing), chunk_size)]
+
+    processes = min(PROCESSES, len(chunks))
+    # Results are written to the cache as each chunk completes, committed once all are written
+    with multiprocessing.Pool(processes=processes, initializer=worker_init) as pool:
+        with collection_cache.transaction():
+            for results in pool.imap_unordered(worker, chunks):
+                entries = []
+                for message_type, message in results:
+                    if message_type == "plugin":
+                        checksum, plugin, summary = message
+                        entries.append((checksum, plugin))
+                        entries.append((f"{SUMMARY_KEY_PREFIX}{checksum}", summary))
+                        stats["cache_added_success"] += 1
+                    elif message_type == "error":
+                        checksum, plugin_path, error = message
+                        entries.append((checksum, json.dumps({"error": error})))
+                        errors.append({"path": str(plugin_path), "error": error})
+                        stats["cache_added_errors"] += 1
+                    added.add(checksum)
+                collection_cache.update_many(entries)
+    return added
 
 
 def run_command(cmd: list) -> dict:
@@ -558,28 +751,37 @@ def main() -> dict:
     stats["cache_added_success"] = 0
     stats["cache_added_errors"] = 0
 
-    cc_obj = CollectionCatalog(directories=parent_directories)
+    collection_cache_path = Path(args.collection_cache_path).resolve().expanduser()
+    # The journal mode is chosen when the cache is opened by ansible-navigator, knowing if
+    # the cache is mounted alone, without a write-ahead log
+    collection_cache = KeyValueStore(collection_cache_path, journal_mode=None)
+
+    cc_obj = CollectionCatalog(directories=parent_directories, index=collection_cache)
     collections, errors = cc_obj.process_directories()
     stats["collection_count"] = len(collections)
+    stats["collection_unchanged"] = cc_obj.unchanged
 
-    collection_cache_path = Path(args.collection_cache_path).resolve().expanduser()
-    collection_cache = KeyValueStore(collection_cache_path)
-
-    handled, missing, plugin_count = identify_missing(collections, collection_cache)
+    handled, missing, plugin_count, cached = identify_missing(collections, collection_cache)
     stats["plugin_count"] = plugin_count
     stats["unique plugins"] = len(handled)
     stats["processed"] = len(missing)
 
     if missing:
-        retrieve_docs(collection_cache, errors, missing, stats)
+        cached |= retrieve_docs(collection_cache, errors, missing, stats)
 
-    cached_checksums = collection_cache.keys()
-    stats["cache_length"] = len(collection_cache.keys())
+    stats["cache_length"] = len(collection_cache)
 
     for collection in collections.values():
-        for no_doc in set(collection["plugin_checksums"].keys()) - set(cached_checksums):
+        for no_doc in collection["plugin_checksums"].keys() - cached:
             del collection["plugin_checksums"][no_doc]
 
+    try:
+        stats["search_index_updated"] = update_search_index(collection_cache, collections)
+    except sqlite3.OperationalError as exc:
+        # The sqlite library in the execution environment may not provide FTS5
+        stats["search_index_updated"] = False
+        cc_obj._messages.append(f"The search index could not be updated: {exc!s}")
+
     collection_cache.close()
     return {
         "collections": collections,
@@ -5,10 +5,12 @@ from __future__ import annotations
 import json
 import os
 import re
+import shlex
 import subprocess
 import sys
 import threading
 
+from collections.abc import Iterator
 from queue import Queue
 from types import SimpleNamespace
 from typing import Any
@@ -18,6 +20,84 @@ from typing import Union
 
 JSONTypes = Union[bool, int, str, dict, list]
 
+PIP_FREEZE_EXCLUDES = ("distribute", "pip", "setuptools", "wheel")
+"""The packages not reported by ``pip freeze``"""
+
+# Print the metadata of each python distribution as a JSON object on a line, the program
+# exits without output if the metadata is not available (python < 3.8). The environment
+# markers of requirements are evaluated as pip would if the packaging library is available.
+PYTHON_PACKAGES_PROGRAM = """
+import json
+import re
+from importlib import metadata
+try:
+    from packaging.requirements import Requirement
+except ImportError:
+    try:
+        from pip._vendor.packaging.requirements import Requirement
+    except ImportError:
+        Requirement = None
+def required(requirements):
+    for requirement in requirements or []:
+        if Requirement is None:
+            name, _semicolon, marker = requirement.partition(";")
+            if "extra" not in marker:
+                yield re.match(r"[A-Za-z0-9][A-Za-z0-9._-]*", name.strip()).group(0)
+            continue
+        parsed = Requirement(requirement)
+        if parsed.marker is None or parsed.marker.evaluate({"extra": ""}):
+            yield parsed.name
+for dist in metadata.distributions():
+    try:
+        editable = json.loads(dist.read_text("direct_url.json"))["dir_info"]["editable"]
+    except (KeyError, TypeError, ValueError):
+        editable = False
+    print(json.dumps({
+        "name": dist.metadata["Name"],
+        "version": dist.version,
+        "summary": dist.metadata["Summary"] or "",
+        "home-page": dist.metadata["Home-page"] or "",
+        "author": dist.metadata["Author"] or "",
+        "author-email": dist.metadata["Author-email"] or "",
+        "license": dist.metadata["License"] or "",
+        "location": str(dist.locate_file("")),
+        "requires": list(required(dist.requires)),
+        "editable": editable,
+    }))
+"""
+
+RPM_FIELDS = (
+    ("name", "%{NAME}"),
+    ("epoch", "%|EPOCH?{%{EPOCH}}|"),
+    ("version", "%{VERSION}"),
+    ("release", "%{RELEASE}"),
+    ("architecture", "%{ARCH}"),
+    ("install date", "%|INSTALLTIME?{%{INSTALLTIME:date}}:{(not installed)}|"),
+    ("group", "%{GROUP}"),
+    ("size", "%{LONGSIZE}"),
+    ("license", "%|LICENSE?{%{LICENSE}}|"),
+    (
+        "signature",
+        "%|RSAHEADER?{%{RSAHEADER:pgpsig}}:{%|DSAHEADER?{%{DSAHEADER:pgpsig}}:{(none)}|}|",
+    ),
+    ("source rpm", "%{SOURCERPM}"),
+    ("build date", "%{BUILDTIME:date}"),
+    ("build host", "%{BUILDHOST}"),
+    ("packager", "%|PACKAGER?{%{PACKAGER}}|"),
+    ("vendor", "%|VENDOR?{%{VENDOR}}|"),
+    ("url", "%|URL?{%{URL}}|"),
+    ("bug url", "%|BUGURL?{%{BUGURL}}|"),
+    ("summary", "%{SUMMARY}"),
+    ("description", "%{DESCRIPTION}"),
+)
+"""The fields reported by ``rpm -qi`` and the query format tag for each"""
+
+RPM_FIELD_SEPARATOR = "\x1f"
+"""The separator between the fields of a package, a description may span many lines"""
+
+RPM_RECORD_SEPARATOR = "\x1e"
+"""The separator following each package"""
+
 
 class Command(SimpleNamespace):
     """Abstraction for a details about a shell command."""
@@ -125,6 +205,15 @@ class CommandRunner:
             proc.join()
 
 
+def _canonical_name(name: str) -> str:
+    """Normalize the name of a python distribution.
+
+    :param name: The name of the distribution
+    :returns: The name in lower case, with runs of ``-``, ``_`` and ``.`` replaced by ``-``
+    """
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
 class CmdParser:
     """A base class for command parsers with common parsing functions."""
 
@@ -277,23 +366,76 @@ class PythonPackages(CmdParser):
 
     @property
     def commands(self) -> list[Command]:
-        """Define the pip command to list installed pip packages.
+        """Define the command to list the installed python packages.
 
         :returns: The defined command
         """
+        return [
+            Command(
+                id_="python_packages",
+                command=f"/usr/bin/python3 -c {shlex.quote(PYTHON_PACKAGES_PROGRAM)}",
+                parse=self.parse_metadata,
+            ),
+        ]
+
+    def parse_metadata(self, command: Command) -> None:
+        """Parse the metadata of each distribution, one per line.
+
+        Packages are reported as they would be by ``pip freeze`` and ``pip show``,
+        editable installs and the packaging tools are not included. If the metadata
+        is not available, ``pip`` is used instead.
+
+        :param command: The result of running the command
+        """
+        if not command.stdout:
+            self._parse_pip(command)
+            return
+        packages: dict[str, dict[str, Any]] = {}
+        required_by: dict[str, list[str]] = {}
+        for line in command.stdout.splitlines():
+            dist = json.loads(line)
+            if not dist["name"]:
+                continue
+            canonical = _canonical_name(dist["name"])
+            if canonical in packages:
+                # Shadowed by a distribution earlier in the path
+                continue
+            names = {_canonical_name(requirement): requirement for requirement in dist["requires"]}
+            requires = sorted(names.values(), key=str.lower)
+            for requirement in requires:
+                required_by.setdefault(_canonical_name(requirement), []).append(dist["name"])
+            dist["requires"] = requires
+            packages[canonical] = dist
+        parsed = []
+        for canonical, package in packages.items():
+            if package.pop("editable") or canonical in PIP_FREEZE_EXCLUDES:
+                continue
+            package["required-by"] = sorted(required_by.get(canonical, []), key=str.lower)
+            parsed.append(package)
+        command.details = parsed
+
+    def _parse_pip(self, command: Command) -> None:
+        """Collect the installed python packages using pip.
+
+        :param command: The command for which the details will be collected
+        """
         pre = Command(
             id_="pip_freeze", command="/usr/bin/python3 -m pip freeze", parse=self.parse_freeze
         )
         run_command(pre)
         pre.parse(pre)
         pkgs = " ".join(pkg for pkg in pre.details[0]) if pre.details else ""
-        return [
-            Command(
-                id_="python_packages",
-                command=f"/usr/bin/python3 -m pip show {pkgs}",
-                parse=self.parse,
-            ),
-        ]
+        pip_show = Command(
+            id_="python_packages",
+            command=f"/usr/bin/python3 -m pip show {pkgs}",
+            parse=self.parse,
+        )
+        run_command(pip_show)
+        self.parse(pip_show)
+        command.stdout = pip_show.stdout
+        command.stderr = pip_show.stderr
+        command.errors = pip_show.errors
+        command.details = pip_show.details
 
     def parse(self, command):
         """Parse the output of the pip command.
@@ -349,29 +491,46 @@ class SystemPackages(CmdParser):
 
         :returns: The defined command
         """
-        return [Command(id_="system_packages", command="rpm -qai", parse=self.parse)]
+        query_format = RPM_FIELD_SEPARATOR.join(tag for _field, tag in RPM_FIELDS)
+        return [
+            Command(
+                id_="system_packages",
+                command=f"rpm -qa --queryformat '{query_format}{RPM_RECORD_SEPARATOR}'",
+                parse=self.parse,
+            ),
+        ]
+
+    @staticmethod
+    def records(stdout: str) -> Iterator[list[str]]:
+        """Split the output of the rpm command into the fields of each package.
+
+        :param stdout: The output of the rpm command
+        :yields: The values of the fields of each package
+        """
+        start = 0
+        while True:
+            end = stdout.find(RPM_RECORD_SEPARATOR, start)
+            if end == -1:
+                return
+            yield stdout[start:end].split(RPM_FIELD_SEPARATOR)
+            start = end + 1
 
     def parse(self, command):
         """Parse the output of the rpm command.
 
+        Fields without a value are omitted, as they are by ``rpm -qi``.
+
         :param command: The result of running the command
         """
-        packages = []
-        package = []
-        for line in command.stdout.splitlines():
-            if re.match(r"^Name\s{2,}:", line) and package:
-                packages.append(package)
-                package = [line]
-            else:
-                package.append(line)
-        if package:
-            packages.append(package)
-
+        fields = [field for field, _tag in RPM_FIELDS]
         parsed = []
-        for package in packages:
-            result = self.splitter(package, line_split=":")
-            parsed.append(result)
-
+        for values in self.records(command.stdout):
+            if len(values) != len(fields):
+                continue
+            package = {field: value.strip() for field, value in zip(fields, values) if value}
+            description = " ".join(package.get("description", "").splitlines())
+            package["description"] = description or "No description available"
+            parsed.append(package)
         command.details = parsed
 
 
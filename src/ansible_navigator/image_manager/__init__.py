@@ -1,10 +1,14 @@
 """Image manager."""
 
 from .inspector import inspect_all
+from .inspector import inspect_image_id
+from .introspection_cache import IntrospectionCache
 from .puller import ImagePuller
 
 
 __all__ = (
     "ImagePuller",
+    "IntrospectionCache",
     "inspect_all",
+    "inspect_image_id",
 )
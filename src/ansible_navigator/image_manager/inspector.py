@@ -10,17 +10,33 @@ from ansible_navigator.command_runner import CommandRunner
 from ansible_navigator.utils.functions import pascal_to_snake
 
 
+INSPECT_BATCH_SIZE = 100
+"""The number of images inspected with each invocation of the container engine"""
+
+INSPECT_WORKERS = 8
+"""The maximum number of images inspected at once, when inspected one at a time"""
+
+# The template fields are common to docker and podman, unlike the layout of the
+# ``--format json`` output, and match the columns of the table listing the images
+IMAGES_FORMAT = (
+    '{"repository":{{json .Repository}},"tag":{{json .Tag}},"image_id":{{json .ID}},'
+    '"created":{{json .CreatedSince}},"size":{{json .Size}}}'
+)
+
+
 class ImagesInspect:
     """Functionality for inspecting container images."""
 
-    def __init__(self, container_engine, ids):
+    def __init__(self, container_engine, ids, batch_size: int = 1):
         """Initialize the container image inspector.
 
         :param container_engine: The name of the container engine to use
         :param ids: The ids of the container images to inspect
+        :param batch_size: The number of images inspected by each command
         """
         self._container_engine = container_engine
         self._image_ids = ids
+        self._batch_size = batch_size
 
     @property
     def commands(self) -> list[Command]:
@@ -28,13 +44,26 @@ class ImagesInspect:
 
         :returns: List of image inspection command objects
         """
+        if self._batch_size == 1:
+            return [
+                Command(
+                    identity=image_id,
+                    command=f"{self._container_engine} inspect {image_id}",
+                    post_process=self.parse,
+                )
+                for image_id in self._image_ids
+            ]
+        batches = [
+            self._image_ids[idx : idx + self._batch_size]
+            for idx in range(0, len(self._image_ids), self._batch_size)
+        ]
         return [
             Command(
-                identity=image_id,
-                command=f"{self._container_engine} inspect {image_id}",
-                post_process=self.parse,
+                identity=" ".join(batch),
+                command=f"{self._container_engine} inspect {' '.join(batch)}",
+                post_process=self.parse_batch,
             )
-            for image_id in self._image_ids
+            for batch in batches
         ]
 
     @staticmethod
@@ -43,20 +72,42 @@ class ImagesInspect:
 
         :param command: Image inspection command object
         """
-        obj = json.loads(command.stdout)
-        snake = pascal_to_snake(obj[0])
+        try:
+            obj = json.loads(command.stdout)
+            snake = pascal_to_snake(obj[0])
+        except (json.JSONDecodeError, IndexError):
+            command.details = {}  # type: ignore[assignment]
+            command.errors = command.stderr or f"Failed to inspect image {command.identity}"
+            return
         command.details = snake
 
+    @staticmethod
+    def parse_batch(command: Command):
+        """Parse the output of an inspection of many images.
+
+        The engine exits with an error if any of the images could not be inspected,
+        those which were are kept.
+
+        :param command: Image inspection command object
+        """
+        try:
+            objs = json.loads(command.stdout)
+        except json.JSONDecodeError:
+            objs = []
+        command.details = [pascal_to_snake(obj) for obj in objs if isinstance(obj, dict)]
+
 
 class ImagesList:
     """Functionality for listing container images."""
 
-    def __init__(self, container_engine):
+    def __init__(self, container_engine, structured: bool = True):
         """Initialize the container image lister.
 
         :param container_engine: The name of the container engine to use
+        :param structured: List the images with a JSON object on each line, not as a table
         """
         self._container_engine = container_engine
+        self._structured = structured
 
     @property
     def commands(self) -> list[Command]:
@@ -64,10 +115,13 @@ class ImagesList:
 
         :returns: List of the image lister commands
         """
+        command = f"{self._container_engine} images"
+        if self._structured:
+            command += f" --format '{IMAGES_FORMAT}'"
         return [
             Command(
                 identity="images",
-                command=f"{self._container_engine} images",
+                command=command,
                 post_process=self.parse,
             ),
         ]
@@ -80,31 +134,96 @@ class ImagesList:
         """
         if command.stdout:
             images = command.stdout.splitlines()
-            re_2omo = re.compile(r"\s{2,}")
-            headers = [key.lower().replace(" ", "_") for key in re_2omo.split(images.pop(0))]
-            local_images = [dict(zip(headers, re_2omo.split(line))) for line in images]
+            if images[0].startswith("{"):
+                local_images = [json.loads(line) for line in images if line]
+            else:
+                re_2omo = re.compile(r"\s{2,}")
+                headers = [key.lower().replace(" ", "_") for key in re_2omo.split(images.pop(0))]
+                local_images = [dict(zip(headers, re_2omo.split(line))) for line in images]
             valid_images = [image for image in local_images if image["tag"] != "<none>"]
             command.details = valid_images
 
 
+def _match_inspections(image_ids: list[str], inspections: list[dict]) -> dict[str, dict]:
+    """Match the details from a batched inspection to the image ids.
+
+    The listed ids are abbreviated, the inspected ids are not and may have
+    the digest algorithm as a prefix.
+
+    :param image_ids: The ids of the listed images
+    :param inspections: The details of each image inspected
+    :returns: The details of each image found, keyed by image id
+    """
+    lengths = {len(image_id) for image_id in image_ids}
+    by_prefix: dict[str, dict] = {}
+    for details in inspections:
+        full_id = str(details.get("id", "")).split(":")[-1]
+        for length in lengths:
+            by_prefix[full_id[:length]] = details
+    return {image_id: by_prefix[image_id] for image_id in image_ids if image_id in by_prefix}
+
+
+def inspect_image_id(container_engine: str, image: str) -> str | None:
+    """Find the id of a local image.
+
+    :param container_engine: Name of the container engine
+    :param image: The image name
+    :returns: The image id, or None if the image is not available locally
+    """
+    images_inspect_class = ImagesInspect(container_engine=container_engine, ids=[image])
+    inspect = CommandRunner.run_single_process(commands=images_inspect_class.commands)[0]
+    if inspect.errors:
+        return None
+    return inspect.details.get("id")  # type: ignore[attr-defined]
+
+
 def inspect_all(container_engine: str) -> tuple[list, str]:
     """Run inspect against all images in the list.
 
+    The images are inspected in batches, any not found in a batch, for example if
+    one image in the batch was removed since being listed, are then inspected one
+    at a time in parallel.
+
     :param container_engine: Name of the container engine
     :returns: List of all image values and stderr, if applicable
     """
     cmd_runner = CommandRunner()
     images_list_class = ImagesList(container_engine=container_engine)
-    result = cmd_runner.run_single_process(commands=images_list_class.commands)
-    images_list = result[0]
+    images_list = cmd_runner.run_single_process(commands=images_list_class.commands)[0]
+    if images_list.return_code and not images_list.stdout:
+        # An engine without support for formatting the list with a template
+        images_list_class = ImagesList(container_engine=container_engine, structured=False)
+        images_list = cmd_runner.run_single_process(commands=images_list_class.commands)[0]
     if images_list.errors:
         return [], images_list.errors
     if images_list.stderr and not images_list.details:
         return [], images_list.stderr
     images = {image["image_id"]: image for image in images_list.details}
-    image_ids = [image["image_id"] for image in images.values()]
-    images_inspect_class = ImagesInspect(container_engine=container_engine, ids=image_ids)
-    inspects = cmd_runner.run_single_process(commands=images_inspect_class.commands)
-    for inspect in inspects:
-        images[inspect.identity]["inspect"] = {"details": inspect.details, "errors": inspect.errors}
+    image_ids = list(images)
+
+    images_inspect_class = ImagesInspect(
+        container_engine=container_engine,
+        ids=image_ids,
+        batch_size=INSPECT_BATCH_SIZE,
+    )
+    inspections = [
+        details
+        for batch in cmd_runner.run_single_process(commands=images_inspect_class.commands)
+        for details in batch.details
+    ]
+    for image_id, details in _match_inspections(image_ids, inspections).items():
+        images[image_id]["inspect"] = {"details": details, "errors": ""}
+
+    remaining = [image_id for image_id in image_ids if "inspect" not in images[image_id]]
+    if remaining:
+        images_inspect_class = ImagesInspect(container_engine=container_engine, ids=remaining)
+        inspects = cmd_runner.run_multi_thread(
+            commands=images_inspect_class.commands,
+            max_workers=INSPECT_WORKERS,
+        )
+        for inspect in inspects:
+            images[inspect.identity]["inspect"] = {
+                "details": inspect.details,
+                "errors": inspect.errors,
+            }
     return list(images.values()), images_list.stderr
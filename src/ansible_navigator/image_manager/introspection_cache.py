@@ -0,0 +1,93 @@
+"""A cache of image introspection results, keyed by image id."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+
+from pathlib import Path
+from typing import Any
+
+from ansible_navigator.utils.key_value_store import KeyValueStore
+
+
+CACHE_FILE_NAME = "image_introspection_cache.db"
+"""The name of the introspection cache in the cache path"""
+
+SCRIPT_FILE_NAME = "image_introspect.py"
+"""The name of the introspection script in the cache path"""
+
+
+class IntrospectionCache:
+    """A cache of image introspection results.
+
+    An image's content can not change without its id changing, so the introspection
+    of an image is cached using its id. Each entry is also keyed by a digest of the
+    introspection script, so results from a different version of the script are not used.
+    """
+
+    def __init__(self, cache_path: str | Path):
+        """Initialize the introspection cache.
+
+        :param cache_path: The path to the ansible-navigator cache directory
+        """
+        self._logger = logging.getLogger(__name__)
+        self._path = Path(cache_path) / CACHE_FILE_NAME
+        try:
+            script = (Path(cache_path) / SCRIPT_FILE_NAME).read_bytes()
+        except OSError:
+            script = b""
+        self._script_digest = hashlib.sha256(script).hexdigest()[:12]
+
+    def _key(self, image_id: str) -> str:
+        """Create the key for an image.
+
+        :param image_id: The image id
+        :returns: The key for the image's introspection
+        """
+        return f"{self._script_digest}:{image_id}"
+
+    def get(self, image_id: str) -> dict[str, Any] | None:
+        """Get the cached introspection of an image.
+
+        :param image_id: The image id
+        :returns: The introspection or None if the image has not been introspected
+        """
+        store = KeyValueStore(self._path)
+        try:
+            cached = store.get(self._key(image_id))
+        finally:
+            store.close()
+        if cached is None:
+            self._logger.debug("No cached introspection for image %s", image_id)
+            return None
+        self._logger.debug("Using cached introspection for image %s", image_id)
+        return json.loads(cached)
+
+    def set(self, image_id: str, introspection: dict[str, Any]) -> None:
+        """Cache the introspection of an image.
+
+        :param image_id: The image id
+        :param introspection: The introspection
+        """
+        store = KeyValueStore(self._path)
+        try:
+            store[self._key(image_id)] = json.dumps(introspection)
+        finally:
+            store.close()
+        self._logger.debug("Cached introspection for image %s", image_id)
+
+    def clear(self) -> int:
+        """Remove all cached introspections.
+
+        :returns: The number of introspections removed
+        """
+        store = KeyValueStore(self._path)
+        try:
+            count = len(store)
+            store.clear()
+        finally:
+            store.close()
+        self._logger.info("Removed %s cached image introspections", count)
+        return count
@@ -9,6 +9,7 @@ import logging
 import os
 import sys
 
+from pathlib import Path
 from typing import NoReturn
 
 from ._version_doc_cache import __version_collection_doc_cache__ as VERSION_CDC
@@ -23,6 +24,7 @@ from .utils.definitions import LogMessage
 from .utils.functions import console_width
 from .utils.functions import environment_variable_is_file_path
 from .utils.functions import find_settings_file
+from .utils.functions import path_is_relative_to
 from .utils.key_value_store import KeyValueStore
 
 
@@ -88,12 +90,18 @@ def find_config() -> tuple[list[LogMessage], list[ExitMessage], str | None, C]:
 
 def get_and_check_collection_doc_cache(
     collection_doc_cache_path: str,
+    cache_path: Path,
 ) -> tuple[list[LogMessage], list[ExitMessage], KeyValueStore | None]:
     """Ensure the collection doc cache has current application version as a safeguard.
 
-    Always delete and rebuild if not.
+    Always clear and rebuild if not.
+
+    The cache directory is mounted into an execution environment, so a doc cache within
+    it uses write-ahead logging. A doc cache elsewhere may be mounted as a single file,
+    without its write-ahead log, so it uses the ``DELETE`` journal mode.
 
     :param collection_doc_cache_path: Path for collection documentation cache
+    :param cache_path: The cache directory of the application
     :returns: All messages and collection cache or None
     """
     messages: list[LogMessage] = []
@@ -123,17 +131,22 @@ def get_and_check_collection_doc_cache(
         exit_messages.append(ExitMessage(message=exit_msg, prefix=ExitPrefix.HINT))
         return messages, exit_messages, None
 
-    collection_cache: KeyValueStore = KeyValueStore(collection_doc_cache_path)
+    in_cache_path = path_is_relative_to(child=Path(collection_doc_cache_path), parent=cache_path)
+    journal_mode = "WAL" if in_cache_path else "DELETE"
+    collection_cache: KeyValueStore = KeyValueStore(
+        collection_doc_cache_path,
+        journal_mode=journal_mode,
+    )
     cache_version = collection_cache.get("version", None)
     message = f"Collection doc cache: 'current version' is '{cache_version}'"
     messages.append(LogMessage(level=logging.DEBUG, message=message))
     if cache_version is None or cache_version != VERSION_CDC:
         message = "Collection doc cache: version was empty or incorrect, rebuilding"
         messages.append(LogMessage(level=logging.INFO, message=message))
-        collection_cache.close()
-        os.remove(collection_doc_cache_path)
-        collection_cache = KeyValueStore(collection_doc_cache_path)
-        collection_cache["version"] = VERSION_CDC
+        # Cleared in place, removing the file would leave its write-ahead log behind
+        with collection_cache.transaction():
+            collection_cache.clear()
+            collection_cache["version"] = VERSION_CDC
         cache_version = collection_cache["version"]
         message = f"Collection doc cache: 'current version' is '{cache_version}'"
         messages.append(LogMessage(level=logging.INFO, message=message))
@@ -223,6 +236,7 @@ def parse_and_update(
     if mount_collection_cache and isinstance(args.collection_doc_cache_path, str):
         new_messages, new_exit_messages, cache = get_and_check_collection_doc_cache(
             args.collection_doc_cache_path,
+            args.internals.cache_path,
         )
         messages.extend(new_messages)
         exit_messages.extend(new_exit_messages)
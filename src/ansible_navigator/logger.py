@@ -1,18 +1,35 @@
-"""Logging initialization."""
+"""Logging initialization.
+
+Log records are put in a queue by the thread logging them, and formatted and written to
+the log file in batches by a background thread, so the user interface and the handling
+of ansible-runner events do not wait for the log file.
+"""
 
 from __future__ import annotations
 
 import datetime
 import logging
 import os
+import threading
 import zoneinfo
 
+from collections import deque
+
 from .configuration_subsystem import Constants
 from .configuration_subsystem.definitions import ApplicationConfiguration
 
 
 logger = logging.getLogger("ansible_navigator")
 
+QUEUE_SIZE = 10000
+"""The number of log records waiting to be written before records are dropped"""
+
+BATCH_SIZE = 500
+"""The maximum number of log records written to the log file at once"""
+
+WRITE_INTERVAL = 0.1
+"""The number of seconds between writing the log records waiting in the queue"""
+
 
 class Formatter(logging.Formatter):
     """Format a logging timestamp using a time zone."""
@@ -23,7 +40,8 @@ class Formatter(logging.Formatter):
         :param args: The arguments
         :param kwargs: The keyword arguments
         """
-        self._time_zone = kwargs.pop("time_zone")
+        time_zone = kwargs.pop("time_zone")
+        self._time_zone = None if time_zone == "local" else zoneinfo.ZoneInfo(time_zone)
         super().__init__(*args, **kwargs)
 
     def formatTime(self, record: logging.LogRecord, _datefmt: str | None = None) -> str:
@@ -33,26 +51,161 @@ class Formatter(logging.Formatter):
         :param _datefmt: The optional date format
         :returns: The timestamp
         """
-        if self._time_zone == "local":
+        if self._time_zone is None:
             return (
                 datetime.datetime.fromtimestamp(record.created, datetime.timezone.utc)
                 .astimezone()
                 .isoformat()
             )
-        return datetime.datetime.fromtimestamp(
-            record.created,
-            tz=zoneinfo.ZoneInfo(self._time_zone),
-        ).isoformat()
+        return datetime.datetime.fromtimestamp(record.created, tz=self._time_zone).isoformat()
+
+
+class QueueHandler(logging.Handler):
+    """Put log records in a queue, to be written by a :class:`QueueListener`.
+
+    The message of a record is created when logged, since the arguments may change
+    afterwards, but the record is formatted by the listener. When the queue is full,
+    records below ``WARNING`` are dropped and counted, others are always queued.
+    """
+
+    def __init__(self, maxsize: int = QUEUE_SIZE):
+        """Initialize the queue handler.
+
+        :param maxsize: The number of records waiting before records are dropped
+        """
+        super().__init__()
+        self.queue: deque[logging.LogRecord] = deque()
+        self._maxsize = maxsize
+        self._closed = False
+        self._dropped = 0
+
+    def close(self) -> None:
+        """Stop putting log records in the queue."""
+        self._closed = True
+        super().close()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Put a log record in the queue.
 
+        The handler lock is held while emitting, so the count of dropped records
+        is not updated concurrently.
 
-def setup_logger(args: ApplicationConfiguration) -> None:
+        :param record: The log record
+        """
+        if self._closed:
+            return
+        if len(self.queue) >= self._maxsize and record.levelno < logging.WARNING:
+            self._dropped += 1
+            return
+        try:
+            record.msg = record.getMessage()
+            record.args = None
+        except Exception:  # noqa: BLE001
+            self.handleError(record)
+            return
+        self.queue.append(record)
+
+    def take_dropped(self) -> int:
+        """Get the number of records dropped since last taken, and reset it.
+
+        :returns: The number of records dropped
+        """
+        with self.lock:
+            dropped, self._dropped = self._dropped, 0
+        return dropped
+
+
+class QueueListener:
+    """Format and write the log records of a :class:`QueueHandler`, in a background thread.
+
+    The records waiting in the queue are written every ``WRITE_INTERVAL`` seconds, up to
+    ``BATCH_SIZE`` at once, and the log file is flushed once for each batch.
+    """
+
+    def __init__(self, handler: QueueHandler, target: logging.StreamHandler):
+        """Initialize the queue listener.
+
+        :param handler: The handler putting the records in the queue
+        :param target: The handler providing the formatter and the log file stream
+        """
+        self._handler = handler
+        self._target = target
+        self._stopping = threading.Event()
+        self._thread = threading.Thread(target=self._monitor, name="log-writer", daemon=True)
+
+    def start(self) -> None:
+        """Start writing the records put in the queue."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Write the records remaining in the queue and stop."""
+        self._handler.close()
+        self._stopping.set()
+        if self._thread.is_alive():
+            self._thread.join()
+        else:
+            self._drain()
+        self._target.close()
+
+    def _monitor(self) -> None:
+        """Write the records in the queue, until stopped."""
+        while not self._stopping.wait(WRITE_INTERVAL):
+            self._drain()
+        self._drain()
+
+    def _drain(self) -> None:
+        """Write the records in the queue, in batches."""
+        pending = self._handler.queue
+        while pending:
+            records = []
+            while pending and len(records) < BATCH_SIZE:
+                records.append(pending.popleft())
+            self._write(records)
+
+    def _write(self, records: list[logging.LogRecord]) -> None:
+        """Format the records and write them to the log file.
+
+        A record is added first if records were dropped since the last batch.
+
+        :param records: The log records
+        """
+        dropped = self._handler.take_dropped()
+        if dropped:
+            summary = logger.makeRecord(
+                name=__name__,
+                level=logging.WARNING,
+                fn=__file__,
+                lno=0,
+                msg="%s log records were dropped, too many records were waiting to be written",
+                args=(dropped,),
+                exc_info=None,
+                func="_write",
+            )
+            records.insert(0, summary)
+        lines = []
+        for record in records:
+            try:
+                lines.append(self._target.format(record) + self._target.terminator)
+            except Exception:  # noqa: BLE001
+                self._target.handleError(record)
+        with self._target.lock:
+            try:
+                self._target.stream.write("".join(lines))
+                self._target.flush()
+            except Exception:  # noqa: BLE001
+                self._target.handleError(records[-1])
+
+
+def setup_logger(args: ApplicationConfiguration) -> QueueListener:
     """Set up the logger.
 
+    The listener writing the log records should be stopped before exiting.
+
     :param args: The CLI args
+    :returns: The listener writing the log records
     """
     if os.path.exists(args.log_file) and args.log_append is False:
         os.remove(args.log_file)
-    handler = logging.FileHandler(args.log_file)
 
     time_zone = args.entry("time_zone").value.current
     # When the configuration is rolled back, the time_zone will be C.NOT_SET
@@ -63,7 +216,11 @@ def setup_logger(args: ApplicationConfiguration) -> None:
         fmt="%(asctime)s %(levelname)s '%(name)s.%(funcName)s' %(message)s",
         time_zone=time_zone,
     )
-    handler.setFormatter(formatter)
+    file_handler = logging.FileHandler(args.log_file)
+    file_handler.setFormatter(formatter)
+    handler = QueueHandler()
+    listener = QueueListener(handler=handler, target=file_handler)
+    listener.start()
     logger.addHandler(handler)
     log_level = getattr(logging, args.log_level.upper())
     logger.setLevel(log_level)
@@ -74,3 +231,4 @@ def setup_logger(args: ApplicationConfiguration) -> None:
     runner_logger.setLevel(log_level)
     runner_logger.addHandler(handler)
     logger.info("New ansible-runner instance, logging initialized")
+    return listener
@@ -11,6 +11,8 @@ with warnings.catch_warnings():
     warnings.simplefilter("ignore")
     from ansible_runner import get_ansible_config
 
+from ansible_runner.config.ansible_cfg import AnsibleCfgConfig
+
 from .base import Base
 
 
@@ -36,6 +38,16 @@ class AnsibleConfig(Base):
             when ``action`` is set to ``dump``. Defaults to `None`.
         :returns: A tuple of response and error string (if any)
         """
+        if self._container_session:
+            config = AnsibleCfgConfig(**self._config_args)
+            config.prepare_ansible_config_command(
+                action,
+                config_file=config_file,
+                only_changed=only_changed,
+            )
+            result = self._run_in_session(config)
+            if result is not None:
+                return result[0], result[1]
         return get_ansible_config(
             action,
             config_file=config_file,
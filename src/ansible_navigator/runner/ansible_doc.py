@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import json
+
 from typing import Any
 
 from ansible_runner import get_plugin_docs
+from ansible_runner.config.doc import DocConfig
+from ansible_runner.utils import sanitize_json_response
 
 from .base import Base
 
@@ -40,6 +44,22 @@ class AnsibleDoc(Base):
         :returns: A tuple of response and error string. If the value of ``response_format`` is
             ``json`` it returns a python dictionary object.
         """
+        if self._container_session:
+            config = DocConfig(**self._config_args)
+            config.prepare_plugin_docs_command(
+                plugin_names,
+                plugin_type=plugin_type,
+                response_format=response_format,
+                snippet=snippet,
+                playbook_dir=playbook_dir,
+                module_path=module_path,
+            )
+            result = self._run_in_session(config)
+            if result is not None:
+                response: dict[Any, Any] | str = result[0]
+                if response and response_format == "json":
+                    response = json.loads(sanitize_json_response(result[0]))
+                return response, result[1]
         return get_plugin_docs(
             plugin_names,
             plugin_type=plugin_type,
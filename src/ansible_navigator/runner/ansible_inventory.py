@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import json
+
 from ansible_runner import get_inventory
+from ansible_runner.config.inventory import InventoryConfig
+from ansible_runner.utils import sanitize_json_response
 
 from .base import Base
 
@@ -36,6 +40,23 @@ class AnsibleInventory(Base):
         :param vault_password_file: The vault identity to use
         :returns: A tuple of response and error string (if any)
         """
+        if self._container_session:
+            config = InventoryConfig(**self._config_args)
+            config.prepare_inventory_command(
+                action,
+                inventories=inventories,
+                response_format=response_format,
+                host=host,
+                playbook_dir=playbook_dir,
+                vault_ids=vault_ids,
+                vault_password_file=vault_password_file,
+            )
+            result = self._run_in_session(config)
+            if result is not None:
+                response = result[0]
+                if response and response_format == "json":
+                    response = json.loads(sanitize_json_response(response))
+                return response, result[1]
         return get_inventory(
             action,
             inventories=inventories,
@@ -11,10 +11,17 @@ import shutil
 import sys
 import tempfile
 
+from typing import TYPE_CHECKING
 from typing import Any
 
 from ansible_runner import Runner
 
+from .container_session import run_in_session
+
+
+if TYPE_CHECKING:
+    from ansible_runner.config._base import BaseConfig
+
 
 class Base:
     """Base class for ansible-runner calls."""
@@ -31,6 +38,7 @@ class Base:
         container_volume_mounts: list | None = None,
         container_options: list | None = None,
         container_workdir: str | None = None,
+        container_session: bool | None = False,
         set_environment_variable: dict | None = None,
         pass_environment_variable: list | None = None,
         host_cwd: str | None = None,
@@ -52,6 +60,9 @@ class Base:
         :param container_volume_mounts: List of bind mounts in the form
             ``host_dir:/container_dir:labels``
         :param container_workdir: The working directory within the container
+        :param container_session: Run the command in a container kept running for the session
+            rather than starting a container for it, applicable only with an execution
+            environment and ``navigator_mode`` set to ``interactive``
         :param host_cwd: The current local working directory. If value of execution_environment is
             set to True this path will be volume mounted within the execution environment.
         :param set_environment_variable: Dict of user requested environment variables to set
@@ -72,6 +83,9 @@ class Base:
         self._ee = execution_environment
         self._eei = execution_environment_image
         self._navigator_mode = navigator_mode
+        self._container_session = bool(
+            container_session and self._ee and self._navigator_mode == "interactive",
+        )
         self._set_environment_variable: dict[str, Any] = (
             set_environment_variable if isinstance(set_environment_variable, dict) else {}
         )
@@ -90,7 +104,7 @@ class Base:
         # when the ce is podman, set the container user to root
         if self._ce == "podman":
             if container_options:
-                container_options.append("--user=root")
+                container_options = [*container_options, "--user=root"]
             else:
                 container_options = ["--user=root"]
 
@@ -176,6 +190,28 @@ class Base:
         self._private_data_dir = private_data_directory
         self._logger.debug("private data dir %s: %s", source, self._private_data_dir)
 
+    @property
+    def _config_args(self) -> dict[str, Any]:
+        """Provide the runner args used to create a runner configuration.
+
+        :returns: The runner args, without those for the runner itself or the command
+        """
+        excluded = ("cancel_callback", "cmdline_args", "executable_cmd", "finished_callback")
+        return {key: value for key, value in self._runner_args.items() if key not in excluded}
+
+    def _run_in_session(self, config: BaseConfig) -> tuple[str, str, int] | None:
+        """Run a command in the session container.
+
+        :param config: The runner configuration, with the command prepared
+        :returns: Output, errors and the return code, or None if the command was not run and
+            should be run by runner
+        """
+        result = run_in_session(config)
+        if result is not None:
+            self.status = "failed" if result[2] else "successful"
+            self.finished = True
+        return result
+
     def runner_cancelled_callback(self):
         """Check by runner to see if it should cancel.
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from ansible_runner import run_command
+from ansible_runner.config.command import CommandConfig
 
 from .command_base import CommandBase
 
@@ -16,5 +17,14 @@ class Command(CommandBase):
         :returns: Output, error, and error code
         """
         self.generate_run_command_args()
+        if self._container_session:
+            config = CommandConfig(**self._config_args)
+            config.prepare_run_command(
+                self._runner_args["executable_cmd"],
+                cmdline_args=self._runner_args["cmdline_args"],
+            )
+            result = self._run_in_session(config)
+            if result is not None:
+                return result
         out, err, ret_code = run_command(**self._runner_args)
         return out, err, ret_code
@@ -6,18 +6,34 @@ standard out and error from the command run and populates the
 queue with messages.
 """
 
-from copy import deepcopy
+from __future__ import annotations
+
+import logging
+
+from collections.abc import Sequence
 from queue import Queue
+from typing import Any
 
 from ansible_runner import run_command_async
 
 from .command_base import CommandBase
 
 
+EVENT_FIELDS = ("event", "event_data", "stdout")
+"""The fields of a runner event used by the ``run`` action and its playbook artifact"""
+
+
 class CommandAsync(CommandBase):
     """A wrapper for the asynchronous runner."""
 
-    def __init__(self, executable_cmd: str, queue: Queue, write_job_events: bool, **kwargs):
+    def __init__(
+        self,
+        executable_cmd: str,
+        queue: Queue,
+        write_job_events: bool,
+        event_fields: Sequence[str] | None = EVENT_FIELDS,
+        **kwargs,
+    ):
         """Initialize the arguments for the ``run_command_async`` interface of ``ansible-runner``.
 
         For common arguments refer to the documentation of the ``CommandBase`` class.
@@ -25,20 +41,37 @@ class CommandAsync(CommandBase):
         :param executable_cmd: The command to be invoked
         :param queue: The queue to post events from ``ansible-runner``
         :param write_job_events: Allows job_events to be processed by ``ansible-runner``
+        :param event_fields: The fields of each event posted to the queue, None for all
         :param kwargs: The arguments for the async runner call
         """
         self._queue = queue
         self._write_job_events = write_job_events
+        self._event_fields = event_fields
         super().__init__(executable_cmd, **kwargs)
 
-    def _event_handler(self, event):
+    def _event_handler(self, event: dict[str, Any]) -> bool:
         """Handle the event from ansible-runner.
 
+        The event posted to the queue is a projection of the event with a copy of the
+        event data, so the consumer may add to the event data while ansible-runner writes
+        the event. The values within the event data, for example a task's result, are
+        shared and not copied.
+
         :param event: The event from ansible-runner
         :returns: The value of ``self._write_job_events``, a boolean
         """
-        self._logger.debug("ansible-runner event handle: %s", event)
-        new_event = deepcopy(event)
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(
+                "ansible-runner event handle: %s %s",
+                event.get("event"),
+                event.get("uuid"),
+            )
+        if self._event_fields is None:
+            new_event = dict(event)
+        else:
+            new_event = {field: event[field] for field in self._event_fields if field in event}
+        if "event_data" in new_event:
+            new_event["event_data"] = dict(new_event["event_data"])
         self._queue.put(new_event)
         return self._write_job_events
 
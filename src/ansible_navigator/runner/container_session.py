@@ -0,0 +1,306 @@
+"""Herein lies the ability to reuse an execution environment container for many commands.
+
+Rather than starting a container for each command, a container is started once, left
+running and each command is run within it using the container engine's ``exec``. A
+container is started for each distinct set of container options, for example the volume
+mounts, and all are removed when ansible-navigator exits, or is terminated by a signal.
+
+Each container is labeled with the host and process id of the ansible-navigator which
+started it. A container left behind by an ansible-navigator which was killed is removed
+when the next ansible-navigator on the same host starts a session container.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import signal
+import socket
+import subprocess
+import threading
+import uuid
+
+from types import FrameType
+from typing import TYPE_CHECKING
+from typing import Any
+
+
+if TYPE_CHECKING:
+    from ansible_runner.config._base import BaseConfig
+
+
+SESSION_COMMAND = ("sleep", "infinity")
+"""The command keeping a session container running"""
+
+RUNNER_MOUNT_DESTINATIONS = ("/runner/", "/runner/artifacts/")
+"""The mounts of runner's private data directory, which differs for each command"""
+
+TIMEOUT_RETURN_CODE = 254
+"""The return code used by runner when a command times out"""
+
+HOST_LABEL = "ansible-navigator.session.host"
+"""The label of a session container with the host of the ansible-navigator which started it"""
+
+PID_LABEL = "ansible-navigator.session.pid"
+"""The label of a session container with the process id of the ansible-navigator"""
+
+STOP_SIGNALS = (signal.SIGHUP, signal.SIGTERM)
+"""The signals terminating ansible-navigator, for which the session containers are stopped"""
+
+_DROPPED_FLAGS = ("--interactive", "--rm", "--tty")
+_DROPPED_OPTIONS = ("--env-file", "--name")
+
+_logger = logging.getLogger(__name__)
+# Reentrant, the signal handler may stop the sessions while the lock is held by the main thread
+_lock = threading.RLock()
+_sessions: dict[tuple[str, ...], ContainerSession | None] = {}
+_previous_handlers: dict[int, Any] = {}
+
+
+class ContainerSession:
+    """A long-lived execution environment container."""
+
+    def __init__(self, container_engine: str, run_options: list[str], image: str) -> None:
+        """Initialize the container session.
+
+        :param container_engine: The container engine
+        :param run_options: The options used to run the container
+        :param image: The execution environment image
+        """
+        self._container_engine = container_engine
+        self._run_options = run_options
+        self._image = image
+        self.name = f"ansible-navigator_session_{uuid.uuid4().hex[:12]}"
+
+    def start(self) -> bool:
+        """Start the container.
+
+        :returns: An indication of the container having started
+        """
+        command = [
+            self._container_engine,
+            "run",
+            "--detach",
+            "--rm",
+            "--name",
+            self.name,
+            "--label",
+            f"{HOST_LABEL}={socket.gethostname()}",
+            "--label",
+            f"{PID_LABEL}={os.getpid()}",
+            *self._run_options,
+            self._image,
+            *SESSION_COMMAND,
+        ]
+        _logger.debug("Starting session container: %s", " ".join(command))
+        proc = subprocess.run(command, capture_output=True, check=False, text=True)
+        if proc.returncode:
+            _logger.warning(
+                "Failed to start a session container, a container will be started for each"
+                " command: %s",
+                proc.stderr.strip(),
+            )
+            return False
+        _logger.info("Started session container %s", self.name)
+        return True
+
+    def exec(
+        self,
+        command: list[str],
+        env: dict[str, str],
+        workdir: str,
+        timeout: int | None = None,
+        combine_output: bool = False,
+    ) -> tuple[str, str, int]:
+        """Run a command within the container.
+
+        The names of the environment variables are passed to the container engine and the
+        values are taken from its environment, so they do not appear in the process list.
+
+        :param command: The command and its arguments
+        :param env: The environment variables to set for the command
+        :param workdir: The working directory within the container
+        :param timeout: The number of seconds after which the command is cancelled
+        :param combine_output: Include the errors in the output, as runner does for a terminal
+        :returns: Output, errors and the return code
+        """
+        exec_command = [self._container_engine, "exec", "--workdir", workdir]
+        for name in env:
+            exec_command.extend(["--env", name])
+        exec_command.extend([self.name, *command])
+        _logger.debug("Running in session container: %s", " ".join(exec_command))
+        try:
+            proc = subprocess.run(
+                exec_command,
+                check=False,
+                env={**os.environ, **env},
+                stderr=subprocess.STDOUT if combine_output else subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                text=True,
+                timeout=timeout,
+            )
+        except subprocess.TimeoutExpired:
+            return "", f"Timed out after {timeout} seconds", TIMEOUT_RETURN_CODE
+        return proc.stdout, proc.stderr or "", proc.returncode
+
+    def stop(self) -> None:
+        """Stop and remove the container."""
+        command = [self._container_engine, "rm", "--force", self.name]
+        subprocess.run(command, capture_output=True, check=False)
+        _logger.info("Removed session container %s", self.name)
+
+
+def _running(pid: int) -> bool:
+    """Check if a process is running on this host.
+
+    :param pid: The process id
+    :returns: An indication of the process running
+    """
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def remove_stale_sessions(container_engine: str) -> None:
+    """Remove the session containers left behind by an ansible-navigator no longer running.
+
+    Only the containers started on this host are considered.
+
+    :param container_engine: The container engine
+    """
+    command = [
+        container_engine,
+        "ps",
+        "--all",
+        "--filter",
+        f"label={PID_LABEL}",
+        "--format",
+        "{{.Names}}",
+    ]
+    proc = subprocess.run(command, capture_output=True, check=False, text=True)
+    names = proc.stdout.split() if proc.returncode == 0 else []
+    if not names:
+        return
+    template = " ".join(
+        f'{{{{index .Config.Labels "{label}"}}}}' for label in (HOST_LABEL, PID_LABEL)
+    )
+    command = [container_engine, "inspect", "--format", template, *names]
+    proc = subprocess.run(command, capture_output=True, check=False, text=True)
+    if proc.returncode:
+        return
+    host = socket.gethostname()
+    stale = []
+    for name, labels in zip(names, proc.stdout.splitlines()):
+        owner_host, _, owner_pid = labels.partition(" ")
+        if owner_host == host and owner_pid.isdigit() and not _running(int(owner_pid)):
+            stale.append(name)
+    if stale:
+        _logger.info("Removing stale session containers: %s", " ".join(stale))
+        command = [container_engine, "rm", "--force", *stale]
+        subprocess.run(command, capture_output=True, check=False)
+
+
+def _run_options(options: list[str]) -> list[str]:
+    """Select the options runner would use to run a command in a container, to run a session.
+
+    The options specific to each command are removed.
+
+    :param options: The options runner would use
+    :returns: The options for the session container
+    """
+    run_options: list[str] = []
+    options = list(options)
+    while options:
+        option = options.pop(0)
+        if option in _DROPPED_FLAGS:
+            continue
+        if option in _DROPPED_OPTIONS:
+            options.pop(0)
+            continue
+        if (
+            option == "-v"
+            and ":" in options[0]
+            and options[0].split(":")[1] in RUNNER_MOUNT_DESTINATIONS
+        ):
+            options.pop(0)
+            continue
+        run_options.append(option)
+    return run_options
+
+
+def run_in_session(config: BaseConfig) -> tuple[str, str, int] | None:
+    """Run the command of a prepared runner configuration in a session container.
+
+    :param config: The runner configuration, with the command prepared
+    :returns: Output, errors and the return code, or None if a session container could not be
+        started and the command should be run by runner
+    """
+    if not config.containerized:
+        return None
+    command = config.command
+    image_index = command.index(config.container_image, command.index("--name") + 2)
+    run_options = _run_options(command[2:image_index])
+    key = (command[0], config.container_image, *run_options)
+    with _lock:
+        if key not in _sessions:
+            session = ContainerSession(
+                container_engine=command[0],
+                run_options=run_options,
+                image=config.container_image,
+            )
+            if not _sessions:
+                atexit.register(stop_sessions)
+                remove_stale_sessions(command[0])
+            _sessions[key] = session if session.start() else None
+        session = _sessions[key]
+    if session is None:
+        return None
+    # Runner's artifacts are not mounted, only needed when running a playbook
+    env = {
+        name: str(value)
+        for name, value in config.env.items()
+        if not str(value).startswith("/runner/")
+    }
+    return session.exec(
+        command=command[image_index + 1 :],
+        env=env,
+        workdir=config.cwd,
+        timeout=config.timeout,
+        combine_output=config.runner_mode == "pexpect",
+    )
+
+
+def stop_sessions() -> None:
+    """Stop all session containers."""
+    with _lock:
+        for session in _sessions.values():
+            if session is not None:
+                session.stop()
+        _sessions.clear()
+
+
+def _stop_sessions_on_signal(signum: int, _frame: FrameType | None) -> None:
+    """Stop the session containers, then handle the signal as before.
+
+    :param signum: The signal number
+    :param _frame: The current stack frame
+    """
+    stop_sessions()
+    previous = _previous_handlers.pop(signum, signal.SIG_DFL)
+    signal.signal(signum, previous if previous is not None else signal.SIG_DFL)
+    os.kill(os.getpid(), signum)
+
+
+def stop_sessions_on_signals() -> None:
+    """Stop the session containers when ansible-navigator is terminated by a signal.
+
+    The handlers can only be installed from the main thread.
+    """
+    for signum in STOP_SIGNALS:
+        if signum not in _previous_handlers:
+            _previous_handlers[signum] = signal.signal(signum, _stop_sessions_on_signal)
@@ -1,5 +1,6 @@
 """Initialization file for the ui_framework."""
 
+from .colorize import AnsiLines
 from .curses_defs import CursesLine
 from .curses_defs import CursesLinePart
 from .curses_defs import CursesLines
@@ -21,6 +22,7 @@ from .ui_constants import Decoration
 
 __all__ = (
     "Action",
+    "AnsiLines",
     "Color",
     "Content",
     "CursesLine",
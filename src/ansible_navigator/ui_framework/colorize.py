@@ -11,10 +11,14 @@ import json
 import logging
 import re
 
+from collections import OrderedDict
+from collections.abc import Sequence
 from itertools import chain
 
 from ansible_navigator.tm_tokenize.grammars import Grammars
+from ansible_navigator.tm_tokenize.compiler import Compiler
 from ansible_navigator.tm_tokenize.region import Regions
+from ansible_navigator.tm_tokenize.state import State
 from ansible_navigator.tm_tokenize.tokenize import tokenize
 from ansible_navigator.utils.compatibility import Traversable
 
@@ -39,6 +43,18 @@ CURSES_STYLES = {
     8: getattr(curses, "A_INVIS", None),
 }
 
+CHECKPOINT_INTERVAL = 200
+"""The number of lines between the saved tokenizer states of lazily rendered lines"""
+
+PREFETCH_LINES = 100
+"""The number of lines before and after those requested, rendered in advance"""
+
+RENDERED_LINES_KEPT = 5000
+"""The number of lazily rendered lines kept, those used least recently are discarded"""
+
+LINE_INDEPENDENT_SCOPES = ("text.log",)
+"""The scopes with a grammar in which no rule spans lines, each line is tokenized alone"""
+
 
 class ColorSchema:
     """A storage mechanism for the schema (theme)."""
@@ -135,19 +151,7 @@ class Colorize:
                 try:
                     state, regions = tokenize(compiler, state, line, first_line)
                 except Exception as exc:  # noqa: BLE001
-                    self._logger.critical(
-                        (
-                            "An unexpected error occurred within the tokenization"
-                            " subsystem.  Please log an issue with the following:"
-                        ),
-                    )
-                    self._logger.critical(
-                        "  Err: '%s', Scope: '%s', Line follows....",
-                        str(exc),
-                        scope,
-                    )
-                    self._logger.critical("  '%s'", line)
-                    self._logger.critical("  The current content will be rendered without color")
+                    log_tokenize_error(self._logger, exc, scope, line)
                     break
                 else:
                     lines.append((regions, line))
@@ -163,6 +167,200 @@ class Colorize:
         ]
         return res
 
+    @functools.lru_cache(maxsize=10)
+    def render_lazy(self, doc: str, scope: str) -> Sequence[list[SimpleLinePart]]:
+        """Render text lines into lines of columns and colors, as each line is requested.
+
+        Markdown is rendered in full, since removing the markdown depends on the
+        surrounding lines.
+
+        :param doc: The string to split, tokenize and color
+        :param scope: The scope, aka the format of the string
+        :returns: A sequence of lines, each a list of line parts
+        """
+        if scope == "text.html.markdown":
+            return self.render(doc=doc, scope=scope)
+        return self.render_lines(lines=doc.splitlines(), scope=scope)
+
+    def render_lines(self, lines: Sequence[str], scope: str) -> RenderedLines:
+        """Render lines into lines of columns and colors, as each line is requested.
+
+        :param lines: The lines to tokenize and color, for example those of a file being read
+        :param scope: The scope, aka the format of the lines
+        :returns: A sequence of lines, each a list of line parts
+        """
+        try:
+            compiler = self._grammars.compiler_for_scope(scope)
+        except KeyError:
+            compiler = None
+        if scope == "no_color":
+            compiler = None
+        return RenderedLines(
+            lines=lines,
+            scope=scope,
+            compiler=compiler,
+            schema=self._schema,
+            line_independent=scope in LINE_INDEPENDENT_SCOPES,
+        )
+
+
+class RenderedLines(Sequence):
+    """The lines of a document, tokenized and colored when first requested.
+
+    When a line is requested, the lines of its block are tokenized, starting from the
+    tokenizer state saved at the start of the block, and colored. The tokenizer state at
+    the start of each block is saved as the document is tokenized, so the end of a
+    document is tokenized once, and only the lines shown are colored. If no rule of the
+    grammar spans lines, each block is tokenized from the initial state instead.
+    """
+
+    def __init__(
+        self,
+        lines: Sequence[str],
+        scope: str,
+        compiler: Compiler | None,
+        schema: ColorSchema,
+        checkpoint_interval: int = CHECKPOINT_INTERVAL,
+        line_independent: bool = False,
+    ):
+        """Initialize the rendered lines.
+
+        :param lines: The lines to tokenize and color
+        :param scope: The scope, aka the format of the lines
+        :param compiler: The grammar compiler for the scope, None for no color
+        :param schema: The color schema
+        :param checkpoint_interval: The number of lines between saved tokenizer states
+        :param line_independent: Indicates no rule of the grammar spans lines
+        """
+        self._logger = logging.getLogger(__name__)
+        self._lines = lines
+        self._scope = scope
+        self._compiler = compiler
+        self._schema = schema
+        self._interval = checkpoint_interval
+        self._line_independent = line_independent
+        self._states: list[State] = [compiler.root_state] if compiler else []
+        self._rendered: OrderedDict[int, list[SimpleLinePart]] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Count the lines.
+
+        :returns: The number of lines
+        """
+        return len(self._lines)
+
+    def __getitem__(self, index):
+        """Get a rendered line, or a list of rendered lines for a slice.
+
+        The lines surrounding a slice are rendered in advance, for scrolling.
+
+        :param index: The index or slice
+        :raises IndexError: If the index is out of range
+        :returns: The rendered line or lines
+        """
+        if isinstance(index, slice):
+            indices = range(*index.indices(len(self)))
+            if indices:
+                start = max(0, min(indices) - PREFETCH_LINES)
+                stop = min(len(self), max(indices) + PREFETCH_LINES + 1)
+                for block in range(start // self._interval, (stop - 1) // self._interval + 1):
+                    if block * self._interval not in self._rendered:
+                        self._render_block(block)
+            return [self._line(idx) for idx in indices]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            msg = "line index out of range"
+            raise IndexError(msg)
+        return self._line(index)
+
+    def _line(self, index: int) -> list[SimpleLinePart]:
+        """Get a rendered line, rendering its block if necessary.
+
+        :param index: The index of the line
+        :returns: The rendered line
+        """
+        if self._compiler is not None:
+            line = self._rendered.get(index)
+            if line is None:
+                self._render_block(index // self._interval)
+                line = self._rendered.get(index)
+            else:
+                self._rendered.move_to_end(index)
+            if line is not None:
+                return line
+        return [SimpleLinePart(column=0, chars=self._lines[index], color=None, style=None)]
+
+    def _tokenize(self, block: int) -> tuple[State, list[tuple[Regions, str]]] | None:
+        """Tokenize the lines of a block, starting from the state saved for the block.
+
+        If tokenizing fails, the document is rendered without color.
+
+        :param block: The block number
+        :returns: The tokenizer state after the block and each line with its regions, or None
+            if tokenizing failed
+        """
+        if self._compiler is None:
+            return None
+        state = self._compiler.root_state if self._line_independent else self._states[block]
+        start = block * self._interval
+        lines = []
+        for line_idx, line in enumerate(self._lines[start : start + self._interval], start):
+            line += "\n"
+            try:
+                state, regions = tokenize(self._compiler, state, line, line_idx == 0)
+            except Exception as exc:  # noqa: BLE001
+                log_tokenize_error(self._logger, exc, self._scope, line)
+                self._compiler = None
+                self._rendered.clear()
+                return None
+            lines.append((regions, line))
+        return state, lines
+
+    def _render_block(self, block: int) -> None:
+        """Tokenize and color the lines of a block.
+
+        The blocks preceding it are tokenized, but not colored, if their states have not
+        been saved.
+
+        :param block: The block number
+        """
+        while not self._line_independent and len(self._states) <= block:
+            tokenized = self._tokenize(len(self._states) - 1)
+            if tokenized is None:
+                return
+            self._states.append(tokenized[0])
+        tokenized = self._tokenize(block)
+        if tokenized is None:
+            return
+        state, lines = tokenized
+        if not self._line_independent and len(self._states) == block + 1:
+            self._states.append(state)
+        start = block * self._interval
+        for offset, line in enumerate(columns_and_colors(lines, self._schema)):
+            self._rendered[start + offset] = line
+        while len(self._rendered) > RENDERED_LINES_KEPT:
+            self._rendered.popitem(last=False)
+
+
+def log_tokenize_error(logger: logging.Logger, exc: Exception, scope: str, line: str) -> None:
+    """Log an unexpected error from the tokenization subsystem.
+
+    :param logger: The logger
+    :param exc: The error
+    :param scope: The scope, aka the format of the string
+    :param line: The line being tokenized
+    """
+    logger.critical(
+        (
+            "An unexpected error occurred within the tokenization"
+            " subsystem.  Please log an issue with the following:"
+        ),
+    )
+    logger.critical("  Err: '%s', Scope: '%s', Line follows....", str(exc), scope)
+    logger.critical("  '%s'", line)
+    logger.critical("  The current content will be rendered without color")
+
 
 def scope_to_list(scope: str | list) -> list:
     """Convert a token scope to a list if necessary.
@@ -305,6 +503,66 @@ def columns_and_colors(
     return results
 
 
+class AnsiLines(Sequence):
+    """Lines of ansi colored text, each converted to a curses line when first shown.
+
+    The lines are read from a list which is only appended to, for example the stdout of a
+    playbook run, so the conversion of each line is kept as more lines are appended.
+    """
+
+    def __init__(self, lines: list[str]):
+        """Initialize the ansi lines.
+
+        :param lines: The list of lines, which will be appended to
+        """
+        self._lines = lines
+        self._converted: dict[int, CursesLine] = {}
+        self._length = 0
+
+    def __len__(self) -> int:
+        """Count the lines.
+
+        :returns: The number of lines
+        """
+        return len(self._lines)
+
+    def __getitem__(self, index):
+        """Get a converted line, or the converted lines for a slice.
+
+        :param index: The index or slice
+        :returns: The converted line or lines
+        """
+        if len(self._lines) < self._length:
+            # The list was not only appended to, the conversions may no longer match
+            self._converted.clear()
+        self._length = len(self._lines)
+        if isinstance(index, slice):
+            return CursesLines(
+                tuple(self._line(idx) for idx in range(*index.indices(len(self._lines)))),
+            )
+        if index < 0:
+            index += len(self._lines)
+        return self._line(index)
+
+    def __str__(self) -> str:
+        """Join the lines.
+
+        :returns: The ansi colored text
+        """
+        return "\n".join(self._lines)
+
+    def _line(self, index: int) -> CursesLine:
+        """Get a converted line, converting it if necessary.
+
+        :param index: The index of the line
+        :returns: The converted line
+        """
+        line = self._converted.get(index)
+        if line is None:
+            line = self._converted[index] = ansi_to_curses(self._lines[index])
+        return line
+
+
 def ansi_to_curses(line: str) -> CursesLine:
     """Convert ansible color codes to curses colors.
 
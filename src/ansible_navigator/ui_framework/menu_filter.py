@@ -0,0 +1,130 @@
+"""Filter the entries of a menu with the menu filter regex.
+
+The text searched, for each column of each entry, is built once for the menu. The indices
+of the entries matching each of the most recently used filters are kept, and a filter
+without special characters is only searched for in the entries matching a filter it
+contains, for example the previous filter when the filter is extended.
+"""
+
+from __future__ import annotations
+
+import re
+
+from collections import OrderedDict
+from collections.abc import Mapping
+from collections.abc import Sequence
+from re import Pattern
+
+
+FILTERS_KEPT = 16
+"""The number of filters for which the matching indices are kept"""
+
+SPECIAL_CHARACTERS = frozenset(".^$*+?{}[]\\|()")
+"""The characters with a special meaning in a regex, outside of a character class"""
+
+
+def literal(regex: Pattern) -> str | None:
+    """Get the text a regex matches, if it has no special characters.
+
+    :param regex: The compiled regex
+    :returns: The text, or None if the regex has special characters or flags
+    """
+    if regex.flags & ~re.UNICODE or SPECIAL_CHARACTERS.intersection(regex.pattern):
+        return None
+    return regex.pattern
+
+
+class MenuFilter:
+    """Filter the entries of a menu, keeping the indices matching recent filters.
+
+    The entries are expected to be unchanged while filtered. If they are changed in
+    place, a new menu filter should be created.
+    """
+
+    def __init__(
+        self,
+        entries: Sequence[Mapping],
+        columns: Sequence[str],
+        filters_kept: int = FILTERS_KEPT,
+    ):
+        """Initialize the menu filter.
+
+        :param entries: The entries of the menu
+        :param columns: The keys of the entries searched
+        :param filters_kept: The number of filters for which the matching indices are kept
+        """
+        self._entries = entries
+        self._columns = tuple(columns)
+        self._filters_kept = filters_kept
+        self._matches: OrderedDict[Pattern, tuple[int, ...]] = OrderedDict()
+        self._texts: list[list[str]] = [
+            [str(entry.get(column)) for entry in entries] for column in self._columns
+        ]
+        self._count = len(entries)
+
+    def applies_to(self, entries: Sequence[Mapping], columns: Sequence[str]) -> bool:
+        """Check if the menu filter was built for the entries and columns.
+
+        :param entries: The entries of the menu
+        :param columns: The keys of the entries searched
+        :returns: True if the menu filter can be used for the entries
+        """
+        return (
+            entries is self._entries
+            and len(entries) == self._count
+            and tuple(columns) == self._columns
+        )
+
+    def indices(self, regex: Pattern) -> tuple[int, ...]:
+        """Get the indices of the entries with a column matching the regex.
+
+        :param regex: The compiled regex
+        :returns: The indices of the matching entries
+        """
+        try:
+            self._matches.move_to_end(regex)
+            return self._matches[regex]
+        except KeyError:
+            pass
+
+        text = literal(regex)
+        if text is None:
+            matching: set[int] = set()
+            for texts in self._texts:
+                matching.update(idx for idx, value in enumerate(texts) if regex.search(value))
+            result = tuple(sorted(matching))
+        else:
+            candidates = self._narrowest(text)
+            if candidates is None:
+                matching = set()
+                for texts in self._texts:
+                    matching.update(idx for idx, value in enumerate(texts) if text in value)
+                result = tuple(sorted(matching))
+            else:
+                result = tuple(
+                    idx
+                    for idx in candidates
+                    if any(text in texts[idx] for texts in self._texts)
+                )
+
+        self._matches[regex] = result
+        if len(self._matches) > self._filters_kept:
+            self._matches.popitem(last=False)
+        return result
+
+    def _narrowest(self, text: str) -> tuple[int, ...] | None:
+        """Find the fewest indices kept for a filter without special characters.
+
+        Any entry containing the text also contains the text of a filter it contains.
+
+        :param text: The text of the filter
+        :returns: The indices, or None if no filter contained in the text is kept
+        """
+        narrowest = None
+        for regex, matches in self._matches.items():
+            contained = literal(regex)
+            if contained is None or contained not in text:
+                continue
+            if narrowest is None or len(matches) < len(narrowest):
+                narrowest = matches
+        return narrowest
@@ -9,7 +9,6 @@ import re
 from collections.abc import Mapping
 from collections.abc import Sequence
 from curses import ascii as curses_ascii
-from functools import cache
 from math import ceil
 from math import floor
 from re import Match
@@ -26,6 +25,7 @@ from ansible_navigator.content_defs import ContentView
 from ansible_navigator.utils.functions import templar
 from ansible_navigator.utils.serialize import serialize
 
+from .colorize import AnsiLines
 from .colorize import Colorize
 from .colorize import rgb_to_ansi
 from .curses_defs import CursesLine
@@ -40,6 +40,7 @@ from .form import Form
 from .form_handler_text import FormHandlerText
 from .form_utils import warning_notification
 from .menu_builder import MenuBuilder
+from .menu_filter import MenuFilter
 from .ui_config import UIConfig
 from .ui_constants import Decoration
 
@@ -73,6 +74,40 @@ class Menu(NamedTuple):
     columns: list[str]
 
 
+class DecoratedLines(Sequence):
+    """Rendered lines, colored and decorated for curses as they are shown."""
+
+    def __init__(
+        self,
+        lines: Sequence[list[SimpleLinePart]],
+        decorate: Callable[[Sequence[list[SimpleLinePart]]], CursesLines],
+    ):
+        """Initialize the decorated lines.
+
+        :param lines: The rendered lines
+        :param decorate: The function coloring and decorating rendered lines
+        """
+        self._lines = lines
+        self._decorate = decorate
+
+    def __len__(self) -> int:
+        """Count the lines.
+
+        :returns: The number of lines
+        """
+        return len(self._lines)
+
+    def __getitem__(self, index):
+        """Get a decorated line, or the decorated lines for a slice.
+
+        :param index: The index or slice
+        :returns: The decorated line or lines
+        """
+        if isinstance(index, slice):
+            return self._decorate(self._lines[index])
+        return self._decorate([self._lines[index]])[0]
+
+
 class ContentFormatCallable(Protocol):
     """Protocol definition for the Ui.content_format callable."""
 
@@ -120,6 +155,7 @@ class Ui(NamedTuple):
     """select functions that can be called from an action."""
 
     clear: Callable
+    menu_changed: Callable
     menu_filter: Callable
     scroll: Callable
     show: ShowCallable
@@ -176,6 +212,7 @@ class UserInterface(CursesWindow):
         self._kegexes = kegexes
         self._logger = logging.getLogger(__name__)
         self._menu_filter: Pattern | None = None
+        self._menu_filter_index: MenuFilter | None = None
         self._menu_indices: tuple[int, ...] = tuple()
 
         self._progress_bar_width = progress_bar_width
@@ -226,6 +263,7 @@ class UserInterface(CursesWindow):
         if value != "":
             if value is None:
                 self._menu_filter = None
+                self._menu_filter_index = None
             else:
                 try:
                     self._menu_filter = re.compile(value)
@@ -235,6 +273,10 @@ class UserInterface(CursesWindow):
                     self._logger.exception(exc)
         return self._menu_filter
 
+    def menu_changed(self) -> None:
+        """Discard the text searched by the menu filter, the menu entries have changed."""
+        self._menu_filter_index = None
+
     def scroll(self, value: int | None = None) -> int:
         """Set or return the current scroll.
 
@@ -273,6 +315,7 @@ class UserInterface(CursesWindow):
         """
         res = Ui(
             clear=self.clear,
+            menu_changed=self.menu_changed,
             menu_filter=self.menu_filter,
             scroll=self.scroll,
             show=self.show,
@@ -546,13 +589,19 @@ class UserInterface(CursesWindow):
         self._show_form(warning_notification(msgs))
         return None, None
 
-    def _serialize_color(self, obj: Any) -> CursesLines:
+    def _serialize_color(self, obj: Any) -> Sequence[CursesLine]:
         """Serialize, if necessary and color an obj.
 
+        The lines are colored as they are shown, so only those on the screen are
+        tokenized and colored. A sequence of lines, such as those of a log file, is
+        colored without being joined into a string.
+
         :param obj: the object to color
         :returns: The generated lines
         """
         if self.content_format() is ContentFormat.ANSI:
+            if isinstance(obj, AnsiLines):
+                return obj
             return self._colorizer.render_ansi(doc=obj)
 
         content_view = ContentView.NORMAL if self._hide_keys else ContentView.FULL
@@ -570,11 +619,22 @@ class UserInterface(CursesWindow):
         if self._ui_config.color:
             scope = self.content_format().value.scope
 
-        rendered = self._colorizer.render(doc=string, scope=scope)
-        self._cache_init_colors(rendered)
-        return self._color_decorate_lines(rendered)
+        if isinstance(string, str):
+            rendered = self._colorizer.render_lazy(doc=string, scope=scope)
+        else:
+            rendered = self._colorizer.render_lines(lines=string, scope=scope)
+        return DecoratedLines(rendered, self._color_decorate_window)
+
+    def _color_decorate_window(self, lines: Sequence[list[SimpleLinePart]]) -> CursesLines:
+        """Initialize the colors of the lines about to be shown and color and decorate them.
+
+        :param lines: The lines to transform
+        :returns: All lines colored
+        """
+        self._cache_init_colors(lines)
+        return self._color_decorate_lines(lines)
 
-    def _cache_init_colors(self, lines: list):
+    def _cache_init_colors(self, lines: Sequence[list[SimpleLinePart]]):
         """Cache and init the unique colors for future use.
 
         Maintain a mapping of RGB colors
@@ -610,7 +670,7 @@ class UserInterface(CursesWindow):
                     )
                     curses.init_pair(curses_colors_idx, curses_colors_idx, -1)
 
-    def _color_decorate_lines(self, lines: list[list[SimpleLinePart]]) -> CursesLines:
+    def _color_decorate_lines(self, lines: Sequence[list[SimpleLinePart]]) -> CursesLines:
         """Color and decorate each of the lines.
 
         :param lines: The lines to transform
@@ -649,7 +709,7 @@ class UserInterface(CursesWindow):
             decoration=decoration,
         )
 
-    def _filter_and_serialize(self, obj: Any) -> tuple[CursesLines | None, CursesLines]:
+    def _filter_and_serialize(self, obj: Any) -> tuple[CursesLines | None, Sequence[CursesLine]]:
         """Filter an obj and serialize.
 
         :param obj: the obj to serialize
@@ -767,25 +827,21 @@ class UserInterface(CursesWindow):
                 content = Content(showing=filtered)
                 return Interaction(name=name, action=action, content=content, ui=self._ui)
 
-    def _obj_match_filter(self, obj: dict, columns: list) -> bool:
-        """Check columns in a dictionary against a regex.
-
-        :param obj: The dict to check
-        :param columns: The dicts keys to check
-        :returns: True if a match else False
-        """
-        return any(self._search_value(self.menu_filter(), obj.get(key)) for key in columns)
+    def _filter_menu(self, current: Sequence[Any], columns: list) -> tuple[int, ...]:
+        """Get the indices of the menu entries matching the menu filter.
 
-    @staticmethod
-    @cache
-    def _search_value(regex: Pattern, value: str) -> Match | None:
-        """Check a str against a regex.
+        The text searched is kept for the menu, until another menu is filtered or
+        the menu entries are changed.
 
-        :param regex: the compiled regex
-        :param value: the string to check
-        :returns: the match if made
+        :param current: The menu entries
+        :param columns: The keys from the dictionary to use as columns
+        :returns: The indices of the matching entries
         """
-        return regex.search(str(value))
+        menu_filter = self._menu_filter_index
+        if menu_filter is None or not menu_filter.applies_to(current, columns):
+            menu_filter = MenuFilter(entries=current, columns=columns)
+            self._menu_filter_index = menu_filter
+        return menu_filter.indices(self.menu_filter())
 
     def _get_heading_menu_items(
         self,
@@ -827,9 +883,7 @@ class UserInterface(CursesWindow):
             first_line_idx = max(0, last_line_idx - (self._screen_height - 3))
 
             if self.menu_filter():
-                self._menu_indices = tuple(
-                    idx for idx, mi in enumerate(current) if self._obj_match_filter(mi, columns)
-                )
+                self._menu_indices = self._filter_menu(current, columns)
                 line_numbers = tuple(range(last_line_idx - first_line_idx + 1))
                 self._scroll = min(len(self._menu_indices), self._scroll)
             else:
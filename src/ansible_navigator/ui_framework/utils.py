@@ -5,6 +5,7 @@ from __future__ import annotations
 import functools
 import re
 
+from collections.abc import MutableMapping
 from dataclasses import is_dataclass
 from math import floor
 from typing import Any
@@ -13,7 +14,7 @@ from ansible_navigator.content_defs import ContentBase
 
 
 def convert_percentage(
-    content: dict[str, Any] | ContentBase,
+    content: MutableMapping[str, Any] | ContentBase,
     columns: list[str],
     progress_bar_width: int,
 ) -> None:
@@ -27,7 +28,7 @@ def convert_percentage(
         value = content.get(column)
         if value and is_percent(str(value)):
             new_value = _string_to_progress(value, progress_bar_width)
-            if isinstance(content, dict):
+            if isinstance(content, MutableMapping):
                 content["_" + column] = value
                 content[column] = new_value
             elif is_dataclass(content):
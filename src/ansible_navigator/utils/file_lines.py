@@ -0,0 +1,125 @@
+"""Read the lines of a text file which is being appended to, for example a log file.
+
+The offset at which each line starts is indexed as the file is read. When refreshed,
+only the bytes appended since are read, and a line is read from the file when requested.
+"""
+
+from __future__ import annotations
+
+import os
+
+from array import array
+from collections.abc import Sequence
+from typing import IO
+
+
+READ_SIZE = 1024 * 1024
+"""The number of bytes read at once while indexing the file"""
+
+
+class FileLines(Sequence):
+    """The lines of a text file which is being appended to.
+
+    The last line is included once it has any characters, even if incomplete.
+    """
+
+    def __init__(self, path: str, encoding: str = "utf-8"):
+        """Initialize the file lines.
+
+        :param path: The path to the file
+        :param encoding: The encoding of the file
+        """
+        self._path = path
+        self._encoding = encoding
+        self._fh: IO[bytes] | None = None
+        self._identity: tuple[int, int] | None = None
+        # The offset at which each line starts, and one past the last newline
+        self._starts = array("q", [0])
+        self._end = 0
+
+    def refresh(self) -> bool:
+        """Index the lines appended to the file since last refreshed.
+
+        :returns: False if the file has been replaced or truncated since last refreshed,
+            in which case it should be read again from the start
+        """
+        try:
+            stat = os.stat(self._path)
+        except FileNotFoundError:
+            return self._identity is None
+        identity = (stat.st_dev, stat.st_ino)
+        if self._fh is None:
+            self._fh = open(self._path, mode="rb")  # noqa: SIM115
+            opened = os.fstat(self._fh.fileno())
+            self._identity = (opened.st_dev, opened.st_ino)
+        if identity != self._identity or stat.st_size < self._end:
+            return False
+        self._fh.seek(self._end)
+        while True:
+            data = self._fh.read(READ_SIZE)
+            if not data:
+                break
+            position = data.find(b"\n")
+            while position != -1:
+                self._starts.append(self._end + position + 1)
+                position = data.find(b"\n", position + 1)
+            self._end += len(data)
+        return True
+
+    def close(self) -> None:
+        """Close the file."""
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+    def __len__(self) -> int:
+        """Count the lines.
+
+        :returns: The number of lines
+        """
+        complete = len(self._starts) - 1
+        return complete + 1 if self._end > self._starts[-1] else complete
+
+    def __getitem__(self, index):
+        """Get a line, or a list of lines for a slice.
+
+        The lines of a slice are read from the file at once.
+
+        :param index: The index or slice
+        :raises IndexError: If the index is out of range
+        :returns: The line or lines
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if start >= stop:
+                return []
+            lines = self._read(start, stop)
+            return lines[::step] if step != 1 else lines
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            msg = "line index out of range"
+            raise IndexError(msg)
+        return self._read(index, index + 1)[0]
+
+    def __str__(self) -> str:
+        """Read the indexed lines.
+
+        :returns: The text of the lines
+        """
+        return "\n".join(self[:])
+
+    def _read(self, start: int, stop: int) -> list[str]:
+        """Read consecutive lines from the file.
+
+        :param start: The index of the first line
+        :param stop: The index after the last line
+        :returns: The lines, without line endings
+        """
+        if self._fh is None:
+            return [""] * (stop - start)
+        begin = self._starts[start]
+        end = self._starts[stop] - 1 if stop < len(self._starts) else self._end
+        self._fh.seek(begin)
+        text = self._fh.read(end - begin).decode(self._encoding, errors="replace")
+        return text.split("\n")
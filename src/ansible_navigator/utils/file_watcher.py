@@ -0,0 +1,268 @@
+"""Detect changes to files and directory trees.
+
+On Linux the kernel's inotify interface reports changes as they happen, so checking
+for a change costs a non-blocking read. Elsewhere, or if inotify is not available,
+the files are scanned for added, removed or modified files, at most once per interval.
+
+Hidden files and directories within a watched directory tree are ignored, so an
+editor's swap file does not register as a change. A hidden file watched directly is not.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import struct
+import sys
+import time
+
+from abc import ABC
+from abc import abstractmethod
+from collections.abc import Iterable
+from collections.abc import Iterator
+
+
+POLL_INTERVAL = 2.0
+"""The minimum number of seconds between scans of the files, when polling"""
+
+# inotify(7) event masks
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+
+WATCH_MASK = (
+    IN_MODIFY
+    | IN_ATTRIB
+    | IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_DELETE_SELF
+    | IN_MOVE_SELF
+    | IN_ONLYDIR
+)
+"""The events watched for in each directory"""
+
+_EVENT = struct.Struct("iIII")
+
+
+def _visible(name: str) -> bool:
+    """Determine if a file or directory is not hidden.
+
+    :param name: The name of the file or directory
+    :returns: An indication of the file or directory not being hidden
+    """
+    return not name.startswith(".")
+
+
+def _walk(path: str) -> Iterator[tuple[str, list[str], list[str]]]:
+    """Walk a directory tree, skipping hidden files and directories.
+
+    :param path: The top of the directory tree
+    :yields: The directory path, subdirectory names and file names
+    """
+    for dirpath, dirnames, filenames in os.walk(path):
+        dirnames[:] = [name for name in dirnames if _visible(name)]
+        yield dirpath, dirnames, [name for name in filenames if _visible(name)]
+
+
+class FileWatcher(ABC):
+    """Detect changes to files and directory trees."""
+
+    @abstractmethod
+    def changed(self) -> bool:
+        """Determine if the watched files have changed since last checked.
+
+        :returns: An indication of a change
+        """
+
+    def close(self) -> None:
+        """Stop watching the files."""
+
+
+class PollingWatcher(FileWatcher):
+    """Detect changes by scanning the files, at most once per interval."""
+
+    def __init__(self, paths: Iterable[str], interval: float = POLL_INTERVAL):
+        """Initialize the polling watcher.
+
+        :param paths: The files and directories to watch
+        :param interval: The minimum number of seconds between scans
+        """
+        self._paths = list(paths)
+        self._interval = interval
+        self._signature = self._scan()
+        self._scanned = time.monotonic()
+
+    def _scan(self) -> frozenset[tuple[str, int]]:
+        """Scan the watched files.
+
+        :returns: The path and modification time of each file
+        """
+        files: list[str] = []
+        for path in self._paths:
+            if os.path.isdir(path):
+                for dirpath, _dirnames, filenames in _walk(path):
+                    files.extend(os.path.join(dirpath, name) for name in filenames)
+            elif os.path.isfile(path):
+                files.append(path)
+        signature = set()
+        for file in files:
+            try:
+                signature.add((file, os.stat(file).st_mtime_ns))
+            except OSError:
+                continue
+        return frozenset(signature)
+
+    def changed(self) -> bool:
+        """Determine if the watched files have changed since last checked.
+
+        :returns: An indication of a change
+        """
+        if time.monotonic() - self._scanned < self._interval:
+            return False
+        signature = self._scan()
+        self._scanned = time.monotonic()
+        if signature == self._signature:
+            return False
+        self._signature = signature
+        return True
+
+
+class InotifyWatcher(FileWatcher):
+    """Detect changes using inotify.
+
+    Each directory in a watched tree is watched, as are directories created within it.
+    A watched file is detected by watching its parent directory for changes to its name.
+    """
+
+    def __init__(self, paths: Iterable[str]):
+        """Initialize the inotify watcher.
+
+        :param paths: The files and directories to watch
+        :raises OSError: If inotify is not available or a directory could not be watched
+        """
+        self._logger = logging.getLogger(__name__)
+        libc_name = ctypes.util.find_library("c") or "libc.so.6"
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        # The directory and the names of interest within it, None for all
+        self._watches: dict[int, tuple[str, set[str] | None]] = {}
+        try:
+            for path in paths:
+                if os.path.isdir(path):
+                    self._watch_tree(path)
+                elif os.path.isfile(path):
+                    directory, name = os.path.split(os.path.abspath(path))
+                    self._watch(directory, {name})
+        except OSError:
+            self.close()
+            raise
+
+    def _watch(self, directory: str, names: set[str] | None) -> None:
+        """Watch a directory.
+
+        :param directory: The directory
+        :param names: The names of the files of interest in the directory, None for all
+        :raises OSError: If the directory could not be watched
+        """
+        descriptor = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), WATCH_MASK)
+        if descriptor < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, f"{os.strerror(errno)}: {directory}")
+        existing = self._watches.get(descriptor)
+        if existing is not None and existing[1] is not None and names is not None:
+            names = existing[1] | names
+        elif existing is not None:
+            names = None
+        self._watches[descriptor] = (directory, names)
+
+    def _watch_tree(self, path: str) -> None:
+        """Watch each directory in a directory tree.
+
+        :param path: The top of the directory tree
+        """
+        for dirpath, _dirnames, _filenames in _walk(path):
+            self._watch(dirpath, None)
+
+    def _events(self) -> Iterator[tuple[int, int, str]]:
+        """Read the pending events.
+
+        :yields: The watch descriptor, event mask and name for each event
+        """
+        while True:
+            try:
+                buffer = os.read(self._fd, 65536)
+            except BlockingIOError:
+                return
+            offset = 0
+            while offset < len(buffer):
+                descriptor, mask, _cookie, length = _EVENT.unpack_from(buffer, offset)
+                offset += _EVENT.size
+                name = os.fsdecode(buffer[offset : offset + length].rstrip(b"\0"))
+                offset += length
+                yield descriptor, mask, name
+
+    def changed(self) -> bool:
+        """Determine if the watched files have changed since last checked.
+
+        :returns: An indication of a change
+        """
+        changed = False
+        for descriptor, mask, name in self._events():
+            if mask & IN_Q_OVERFLOW:
+                changed = True
+                continue
+            if mask & IN_IGNORED:
+                self._watches.pop(descriptor, None)
+                continue
+            directory, names = self._watches.get(descriptor, ("", set()))
+            if names is None and name and not _visible(name):
+                continue
+            if names is not None and name not in names:
+                continue
+            if names is None and mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                try:
+                    self._watch_tree(os.path.join(directory, name))
+                except OSError:
+                    self._logger.warning("Unable to watch %s", os.path.join(directory, name))
+            changed = True
+        return changed
+
+    def close(self) -> None:
+        """Stop watching the files."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def watch_paths(paths: Iterable[str], interval: float = POLL_INTERVAL) -> FileWatcher:
+    """Watch files and directory trees for changes.
+
+    :param paths: The files and directories to watch
+    :param interval: The minimum number of seconds between scans, if polling
+    :returns: A file watcher using inotify if available, otherwise polling
+    """
+    paths = list(paths)
+    if sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(paths)
+        except (AttributeError, OSError) as exc:
+            logging.getLogger(__name__).debug("Polling for changes, inotify failed: %s", exc)
+    return PollingWatcher(paths, interval=interval)
@@ -5,13 +5,31 @@ from __future__ import annotations
 import sqlite3
 
 from collections.abc import ItemsView
+from collections.abc import Iterable
 from collections.abc import Iterator
 from collections.abc import KeysView
+from collections.abc import Mapping
 from collections.abc import MutableMapping
 from collections.abc import ValuesView
+from contextlib import contextmanager
 from pathlib import Path
 
 
+BATCH_SIZE = 500
+"""The number of keys in each query for the bulk lookups, below the sqlite variable limit"""
+
+# The same statement text is used for each query so sqlite3's statement cache reuses the
+# prepared statement, the bulk lookups use one statement for each batch size
+SQL_CLEAR = "DELETE FROM kv"
+SQL_CONTAINS = "SELECT 1 FROM kv WHERE key = ?"
+SQL_CONTAINS_MANY = "SELECT key FROM kv WHERE key IN ({})"
+SQL_DELETE = "DELETE FROM kv WHERE key = ?"
+SQL_GET = "SELECT value FROM kv WHERE key = ?"
+SQL_GET_MANY = "SELECT key, value FROM kv WHERE key IN ({})"
+SQL_PRUNE = "DELETE FROM kv WHERE rowid NOT IN (SELECT rowid FROM kv ORDER BY rowid DESC LIMIT ?)"
+SQL_REPLACE = "REPLACE INTO kv (key, value) VALUES (?,?)"
+
+
 class KVSKeysView(KeysView[str]):
     """A glorified KeysView specific to, and returned by, methods in KeyValueStore."""
 
@@ -25,18 +43,45 @@ class KVSValuesView(ValuesView[str]):
 
 
 class KeyValueStore(MutableMapping[str, str]):
-    """An interface to use a sqlite database as a key-value store."""
+    """An interface to use a sqlite database as a key-value store.
+
+    By default the database uses write-ahead logging, so sessions reading the store are
+    not blocked by one writing to it. The write-ahead log is kept in files beside the
+    database, so a database shared as a single file, for example one mounted alone into a
+    container, should use the ``DELETE`` journal mode. Each write is committed on its own
+    unless made within ``transaction()``, the bulk methods should be used for many keys.
+    """
 
-    def __init__(self, filename: str | Path):
+    def __init__(self, filename: str | Path, journal_mode: str | None = "WAL"):
         """Initialize the key-value store.
 
         :param filename: The full path to the sqlite database file
+        :param journal_mode: The sqlite journal mode, None to keep that of the database
         """
         self._path = str(filename)
-        self.conn = sqlite3.connect(self._path)
+        self._journal_mode = journal_mode
+        self._transaction_depth = 0
+        self.conn = self._connect()
         cursor = self.conn.cursor()
         cursor.execute("CREATE TABLE IF NOT EXISTS kv (key text unique, value text)")
 
+    def _connect(self) -> sqlite3.Connection:
+        """Connect to the database, with transactions managed by the key-value store.
+
+        :returns: A connection to the database
+        """
+        conn = sqlite3.connect(self._path, isolation_level=None)
+        if self._journal_mode is not None:
+            # Not supported by all file systems, where the default journal mode remains.
+            # Leaving write-ahead logging fails while another connection is open, the
+            # database then keeps its journal mode until all connections are closed
+            try:
+                conn.execute(f"PRAGMA journal_mode={self._journal_mode}")
+            except sqlite3.OperationalError:
+                pass
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
     @property
     def path(self) -> str:
         """Provide the filename where the KVS is stored on disk.
@@ -49,15 +94,111 @@ class KeyValueStore(MutableMapping[str, str]):
         """Close the connection to the database."""
         self.conn.commit()
         self.conn.close()
+        self._transaction_depth = 0
 
     def open_(self) -> sqlite3.Connection:
         """Establish the connection to the database.
 
         :returns: A connection to the database
         """
-        self.conn = sqlite3.connect(self.path)
+        self.conn = self._connect()
+        self._transaction_depth = 0
         return self.conn
 
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Group writes into a single transaction.
+
+        The transaction is committed when the outermost block exits, or rolled back
+        if it raises. Nested blocks join the outermost transaction.
+
+        :yields: Once the transaction has begun
+        """
+        if self._transaction_depth:
+            self._transaction_depth += 1
+            try:
+                yield
+            finally:
+                self._transaction_depth -= 1
+            return
+
+        self.conn.execute("BEGIN IMMEDIATE")
+        self._transaction_depth = 1
+        try:
+            yield
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        else:
+            self.conn.execute("COMMIT")
+        finally:
+            self._transaction_depth = 0
+
+    def update_many(self, items: Mapping[str, str] | Iterable[tuple[str, str]]) -> None:
+        """Place many key-value combinations in the key-value store, in one transaction.
+
+        :param items: The key-value combinations to set
+        """
+        if isinstance(items, Mapping):
+            items = items.items()
+        with self.transaction():
+            self.conn.executemany(SQL_REPLACE, items)
+
+    def clear(self) -> None:
+        """Remove all key-value combinations from the key-value store.
+
+        The database file is kept, so it remains consistent with its write-ahead log
+        and any other session using it.
+        """
+        with self.transaction():
+            self.conn.execute(SQL_CLEAR)
+
+    def prune(self, keep: int) -> None:
+        """Remove all but the most recently written key-value combinations.
+
+        Setting a key replaces its row, so a key is as recent as its last write, reading a
+        key does not make it more recent.
+
+        :param keep: The number of key-value combinations to keep
+        """
+        with self.transaction():
+            self.conn.execute(SQL_PRUNE, (keep,))
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, str]:
+        """Return the values for many keys from the key-value store.
+
+        :param keys: The keys to find
+        :returns: The values of the keys found, keys not in the key-value store are omitted
+        """
+        found: dict[str, str] = {}
+        for batch in self._batches(keys):
+            sql = SQL_GET_MANY.format(",".join("?" * len(batch)))
+            found.update(self.conn.execute(sql, batch))
+        return found
+
+    def contains_many(self, keys: Iterable[str]) -> set[str]:
+        """Check which of many keys are in the key-value store.
+
+        :param keys: The keys to search for
+        :returns: The keys in the key-value store
+        """
+        found: set[str] = set()
+        for batch in self._batches(keys):
+            sql = SQL_CONTAINS_MANY.format(",".join("?" * len(batch)))
+            found.update(row[0] for row in self.conn.execute(sql, batch))
+        return found
+
+    @staticmethod
+    def _batches(keys: Iterable[str]) -> Iterator[list[str]]:
+        """Split keys into batches for the bulk lookups.
+
+        :param keys: The keys to split
+        :yields: Batches of at most ``BATCH_SIZE`` unique keys
+        """
+        unique = list(dict.fromkeys(keys))
+        for idx in range(0, len(unique), BATCH_SIZE):
+            yield unique[idx : idx + BATCH_SIZE]
+
     def __len__(self) -> int:
         """Count the number of keys in the key-value store.
 
@@ -129,7 +270,7 @@ class KeyValueStore(MutableMapping[str, str]):
         :returns: An indication of the provided key's existence in the key-value store
         """
         cursor = self.conn.cursor()
-        return cursor.execute("SELECT 1 FROM kv WHERE key = ?", (key,)).fetchone() is not None
+        return cursor.execute(SQL_CONTAINS, (key,)).fetchone() is not None
 
     def __getitem__(self, key: str) -> str:
         """Return a value from the key-value store given a key.
@@ -139,7 +280,7 @@ class KeyValueStore(MutableMapping[str, str]):
         :returns: The value for the key provided
         """
         cursor = self.conn.cursor()
-        item = cursor.execute("SELECT value FROM kv WHERE key = ?", (key,)).fetchone()
+        item = cursor.execute(SQL_GET, (key,)).fetchone()
         if item is None:
             raise KeyError(key)
         return item[0]
@@ -151,7 +292,7 @@ class KeyValueStore(MutableMapping[str, str]):
         :param value: The value of the combination to set
         """
         cursor = self.conn.cursor()
-        cursor.execute("REPLACE INTO kv (key, value) VALUES (?,?)", (key, value))
+        cursor.execute(SQL_REPLACE, (key, value))
 
     def __delitem__(self, key: str) -> None:
         """Delete a key-value combination in the key-value store.
@@ -159,10 +300,9 @@ class KeyValueStore(MutableMapping[str, str]):
         :param key: The key of the entry to delete
         :raises KeyError: When the provided key does not exist in the key-value store
         """
-        if key not in self:
-            raise KeyError(key)
         cursor = self.conn.cursor()
-        cursor.execute("DELETE FROM kv WHERE key = ?", (key,))
+        if cursor.execute(SQL_DELETE, (key,)).rowcount == 0:
+            raise KeyError(key)
 
     def __iter__(self) -> Iterator[str]:
         """Yield values extracted from the key-value store one by one.
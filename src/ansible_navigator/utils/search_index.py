@@ -0,0 +1,233 @@
+"""A full-text search index of the plugins, options and roles in the collection doc cache.
+
+The index is an SQLite FTS5 table stored alongside the key-value table in the
+collection doc cache. It is built when collections are cataloged, so it can be
+searched later without an execution environment. Like the key-value store, this
+module is used from within the execution environment and so only uses the standard
+library.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import NamedTuple
+
+
+if TYPE_CHECKING:
+    from .key_value_store import KeyValueStore
+
+
+SEARCH_INDEX_KEY = "search_index_v1"
+"""The key-value store key holding the digest of the content in the search index"""
+
+SEARCH_TABLE = "search"
+"""The name of the full-text search table in the collection doc cache"""
+
+SEARCH_LIMIT = 50
+"""The default maximum number of search results"""
+
+# The name of a plugin or role, or the name of an option, carries more weight than the
+# name of the option's plugin, which carries more than the descriptions. The bm25 rank
+# is negative, options are halved so plugins and roles are found before their options
+SQL_CREATE = (
+    f"CREATE VIRTUAL TABLE {SEARCH_TABLE} USING fts5("
+    "name, parent, description, kind UNINDEXED, collection UNINDEXED, checksum UNINDEXED,"
+    " tokenize = 'porter unicode61')"
+)
+SQL_DROP = f"DROP TABLE IF EXISTS {SEARCH_TABLE}"
+SQL_INSERT = f"INSERT INTO {SEARCH_TABLE} VALUES (?,?,?,?,?,?)"
+SQL_SEARCH = (
+    "SELECT name, parent, description, kind, collection, checksum"
+    f" FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH ?"
+    f" ORDER BY bm25({SEARCH_TABLE}, 10.0, 2.0, 1.0)"
+    " * CASE kind WHEN 'option' THEN 0.5 ELSE 1.0 END LIMIT ?"
+)
+
+
+class SearchResult(NamedTuple):
+    """One plugin, option or role found in the search index."""
+
+    name: str
+    """The full name of the plugin or role, or the name of the option"""
+    parent: str
+    """The full name of the plugin or role the option belongs to, empty otherwise"""
+    description: str
+    """The description"""
+    kind: str
+    """The plugin type, ``option`` or ``role``"""
+    collection: str
+    """The name of the collection"""
+    checksum: str
+    """The checksum of the plugin in the collection doc cache, empty for roles"""
+
+
+def _text(value: Any) -> str:
+    """Convert a description, which may be a list of paragraphs, to text.
+
+    :param value: The description
+    :returns: The description as text
+    """
+    if isinstance(value, list):
+        return " ".join(str(entry) for entry in value)
+    return "" if value is None else str(value)
+
+
+def _options(options: Any, parent: str = "") -> Iterator[tuple[str, str]]:
+    """Flatten the options, and any suboptions, of a plugin or role.
+
+    :param options: The options from the documentation or argument specification
+    :param parent: The dotted name of the option these are suboptions of
+    :yields: The dotted name and description of each option
+    """
+    if not isinstance(options, dict):
+        return
+    for name, spec in options.items():
+        path = f"{parent}.{name}" if parent else str(name)
+        spec = spec if isinstance(spec, dict) else {}
+        yield path, _text(spec.get("description"))
+        yield from _options(spec.get("suboptions") or spec.get("options"), path)
+
+
+def _plugin_rows(collection: dict, docs: dict[str, str]) -> Iterator[tuple[str, ...]]:
+    """Create the search index rows for the plugins and options of a collection.
+
+    :param collection: The cataloged collection
+    :param docs: The cached documentation for the plugins, keyed by checksum
+    :yields: One row for each plugin and each of its options
+    """
+    collection_name = collection["known_as"]
+    for checksum, details in collection["plugin_checksums"].items():
+        try:
+            doc = json.loads(docs[checksum])["plugin"]["doc"]
+            short_name = doc["name"] if "name" in doc else doc[details["type"]]
+        except (KeyError, TypeError, ValueError):
+            continue
+        full_name = f"{collection_name}.{short_name}"
+        description = " ".join(
+            (_text(doc.get("short_description")), _text(doc.get("description"))),
+        )
+        yield full_name, "", description, details["type"], collection_name, checksum
+        for option, option_description in _options(doc.get("options")):
+            yield option, full_name, option_description, "option", collection_name, checksum
+
+
+def _role_rows(collection: dict) -> Iterator[tuple[str, ...]]:
+    """Create the search index rows for the roles and role arguments of a collection.
+
+    :param collection: The cataloged collection
+    :yields: One row for each role and each of its arguments
+    """
+    collection_name = collection["known_as"]
+    for role in collection.get("roles", []):
+        try:
+            description = _text(role["info"]["galaxy_info"]["description"])
+        except (KeyError, TypeError):
+            description = ""
+        yield role["full_name"], "", description, "role", collection_name, ""
+        argument_specs = role.get("argument_specs")
+        if not isinstance(argument_specs, dict):
+            continue
+        for entry_point in argument_specs.values():
+            if not isinstance(entry_point, dict):
+                continue
+            for option, option_description in _options(entry_point.get("options")):
+                yield option, role["full_name"], option_description, "option", collection_name, ""
+
+
+def _digest(collections: dict) -> str:
+    """Create a digest of the cataloged content, to know when the index is out of date.
+
+    :param collections: The cataloged collections
+    :returns: The digest
+    """
+    content = [
+        (
+            collection["known_as"],
+            collection["path"],
+            sorted(collection["plugin_checksums"]),
+            [role.get("info") for role in collection.get("roles", [])],
+            [role.get("argument_specs") for role in collection.get("roles", [])],
+        )
+        for collection in collections.values()
+        if not collection.get("hidden_by")
+    ]
+    return hashlib.sha256(json.dumps(content, default=str).encode("utf-8")).hexdigest()
+
+
+def update_search_index(collection_cache: KeyValueStore, collections: dict) -> bool:
+    """Rebuild the search index if the cataloged content has changed.
+
+    Collections hidden by another with the same name are not indexed.
+
+    :param collection_cache: The collection doc cache
+    :param collections: The cataloged collections
+    :returns: An indication the index was rebuilt
+    """
+    digest = _digest(collections)
+    if collection_cache.get(SEARCH_INDEX_KEY) == digest and search_index_exists(collection_cache):
+        return False
+
+    visible = [
+        collection for collection in collections.values() if not collection.get("hidden_by")
+    ]
+    checksums = (checksum for collection in visible for checksum in collection["plugin_checksums"])
+    docs = collection_cache.get_many(checksums)
+    with collection_cache.transaction():
+        collection_cache.conn.execute(SQL_DROP)
+        collection_cache.conn.execute(SQL_CREATE)
+        for collection in visible:
+            collection_cache.conn.executemany(SQL_INSERT, _plugin_rows(collection, docs))
+            collection_cache.conn.executemany(SQL_INSERT, _role_rows(collection))
+        collection_cache[SEARCH_INDEX_KEY] = digest
+    return True
+
+
+def search_index_exists(collection_cache: KeyValueStore) -> bool:
+    """Determine if the collection doc cache has a search index.
+
+    :param collection_cache: The collection doc cache
+    :returns: An indication the search index exists
+    """
+    sql = "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?"
+    return collection_cache.conn.execute(sql, (SEARCH_TABLE,)).fetchone() is not None
+
+
+def build_query(terms: str) -> str:
+    """Build a full-text search query, matching all of the terms.
+
+    Each term is quoted, so characters with a meaning in the query syntax are
+    searched for as text, and the last term matches as a prefix.
+
+    :param terms: The search terms
+    :returns: The query
+    """
+    words = ['"{}"'.format(word.replace('"', '""')) for word in terms.split()]
+    if words:
+        words[-1] += "*"
+    return " ".join(words)
+
+
+def search(
+    collection_cache: KeyValueStore,
+    terms: str,
+    limit: int = SEARCH_LIMIT,
+) -> list[SearchResult]:
+    """Search the index, best matches first.
+
+    :param collection_cache: The collection doc cache
+    :param terms: The search terms
+    :param limit: The maximum number of results
+    :raises sqlite3.OperationalError: When the index does not exist or can not be read
+    :returns: The matching plugins, options and roles
+    """
+    query = build_query(terms)
+    if not query:
+        return []
+    rows = collection_cache.conn.execute(SQL_SEARCH, (query, limit))
+    return [SearchResult(*row) for row in rows]
+
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import bz2
+import gzip
 import json
 import logging
+import lzma
 import os
 import re
 import tempfile
 
+from collections.abc import Callable
 from dataclasses import is_dataclass
 from functools import partial
 from pathlib import Path
@@ -67,6 +71,36 @@ def serialize(
     raise ValueError(msg)
 
 
+COMPRESSION_OPENERS: dict[str, Callable[..., IO]] = {
+    ".bz2": bz2.open,
+    ".gz": gzip.open,
+    ".xz": lzma.open,
+}
+"""The functions used to open compressed files, by file extension"""
+
+
+def is_compressed(file: Path | str) -> bool:
+    """Determine if a file is compressed, based on the file extension.
+
+    :param file: The file path
+    :returns: True if the file extension is one of a compression format
+    """
+    return Path(file).suffix in COMPRESSION_OPENERS
+
+
+def open_file(file: Path | str, mode: str = "r") -> IO:
+    """Open a text file, compressing or decompressing it based on the file extension.
+
+    :param file: The file path
+    :param mode: The file mode, without the text or binary mode
+    :returns: The file handle
+    """
+    opener = COMPRESSION_OPENERS.get(Path(file).suffix)
+    if opener is None:
+        return open(file, mode=mode, encoding="utf-8")
+    return opener(file, mode=f"{mode}t", encoding="utf-8")
+
+
 def serialize_write_file(
     content: ContentType,
     content_view: ContentView,
@@ -76,6 +110,8 @@ def serialize_write_file(
 ):
     """Serialize and write content to a file.
 
+    The file is compressed if the file extension is one of a compression format.
+
     :param content: The content to serialize
     :param content_view: The content view
     :param file_mode: The file mode for the file
@@ -88,7 +124,7 @@ def serialize_write_file(
         content_view=content_view,
         serialization_format=serialization_format,
     )
-    with file.open(mode=file_mode, encoding="utf-8") as file_handle:
+    with open_file(file=file, mode=file_mode) as file_handle:
         if serialization_format == SerializationFormat.JSON:
             _json_dump(dumpable=dumpable, file_handle=file_handle)
             return
@@ -0,0 +1 @@
+"""Benchmarks, run directly with ``python -m tests.benchmarks.<module>``."""
@@ -0,0 +1,82 @@
+"""Benchmark the size and time to write and read compressed playbook artifacts.
+
+A synthetic playbook run, one play against many hosts with module results
+resembling those of a package install, is written as an artifact with
+each supported file extension and read back.
+
+Usage: ``python -m tests.benchmarks.bench_artifact_compression --events 100000``
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+
+from copy import deepcopy
+from pathlib import Path
+
+from ansible_navigator.actions._run_artifact import ARTIFACT_VERSION
+from ansible_navigator.actions._run_artifact import write_indexed_artifact
+from ansible_navigator.actions.run import Action as action
+from ansible_navigator.configuration_subsystem import NavigatorConfiguration
+from ansible_navigator.utils.serialize import open_file
+
+from .bench_run_events import synthetic_events
+
+
+EXTENSIONS = (".json", ".json.gz", ".json.bz2", ".json.xz")
+"""The artifact file extensions compared"""
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=100_000, help="number of events")
+    parser.add_argument("--hosts", type=int, default=500, help="number of hosts")
+    args = parser.parse_args()
+
+    run_action = action(args=deepcopy(NavigatorConfiguration))
+    for message in synthetic_events(hosts=args.hosts, events=args.events):
+        if "res" in message["event_data"]:
+            message["event_data"]["res"] = {
+                "changed": False,
+                "invocation": {"module_args": {"name": ["httpd"], "state": "present"}},
+                "msg": "Nothing to do",
+                "rc": 0,
+                "results": [],
+            }
+        run_action._handle_message(message)
+    content = {
+        "version": ARTIFACT_VERSION,
+        "plays": run_action._plays.value,
+        "stdout": [f"ok: [host-{number}]" for number in range(args.hosts)],
+        "status": "successful",
+        "status_color": 10,
+    }
+
+    print(f"{'extension':<12}{'size':>14}{'ratio':>8}{'write':>10}{'read':>10}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        baseline = 0
+        for extension in EXTENSIONS:
+            file = Path(tmp_dir) / f"artifact{extension}"
+            start = time.perf_counter()
+            write_indexed_artifact(content=content, file=file)
+            written = time.perf_counter() - start
+
+            start = time.perf_counter()
+            with open_file(file) as fh:
+                json.load(fh)
+            read = time.perf_counter() - start
+
+            size = file.stat().st_size
+            baseline = baseline or size
+            print(
+                f"{extension:<12}{size:>14,}{baseline / size:>7.1f}x"
+                f"{written:>9.2f}s{read:>9.2f}s",
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+"""Benchmark parsing the system and python packages of an execution environment.
+
+Output captured from a Fedora ``rpm -qai`` and a ``pip show`` of ansible-core is
+repeated for many packages, in both the text layout previously parsed line by line
+and the structured layout now produced by ``rpm --queryformat`` and the python
+distribution metadata. The time and peak memory used to parse each are reported.
+
+With ``--collect``, the time to collect the python packages of the local
+``/usr/bin/python3`` using ``pip`` and using the distribution metadata is also reported.
+
+Usage: ``python -m tests.benchmarks.bench_image_introspect --rpms 800 --pips 150``
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import time
+import tracemalloc
+
+from typing import Any
+from typing import Callable
+
+from ansible_navigator.data import image_introspect
+
+
+RPM_QI = """Name        : net-snmp{number}
+Epoch       : 1
+Version     : 5.9.1
+Release     : 4.fc34
+Architecture: x86_64
+Install Date: Tue 19 Oct 2021 09:52:47 AM PDT
+Group       : Unspecified
+Size        : 901010
+License     : BSD
+Signature   : RSA/SHA256, Fri 30 Jul 2021 05:06:50 AM PDT, Key ID 1161ae6945719a39
+Source RPM  : net-snmp-5.9.1-4.fc34.src.rpm
+Build Date  : Fri 30 Jul 2021 12:23:51 AM PDT
+Build Host  : buildvm-x86-03.iad2.fedoraproject.org
+Packager    : Fedora Project
+Vendor      : Fedora Project
+URL         : http://net-snmp.sourceforge.net/
+Bug URL     : https://bugz.fedoraproject.org/net-snmp
+Summary     : A collection of SNMP protocol tools and libraries
+Description :
+SNMP (Simple Network Management Protocol) is a protocol used for
+network management. The NET-SNMP project includes various SNMP tools:
+an extensible agent, an SNMP library, tools for requesting or setting
+information from SNMP agents, tools for generating and handling SNMP
+traps, a version of the netstat command which uses SNMP, and a Tk/Perl
+mib browser. This package contains the snmpd and snmptrapd daemons,
+documentation, etc.
+
+You will probably also want to install the net-snmp-utils package,
+which contains NET-SNMP utilities.
+"""
+
+PIP_SHOW = """Name: ansible-core{number}
+Version: 2.15.0
+Summary: Radically simple IT automation
+Home-page: https://ansible.com/
+Author: Ansible, Inc.
+Author-email: info@ansible.com
+License: GPLv3+
+Location: /usr/local/lib/python3.9/site-packages
+Requires: cryptography, importlib-resources, jinja2, packaging, PyYAML, resolvelib
+Required-by: ansible-runner, ansible-lint"""
+
+
+def rpm_outputs(count: int) -> tuple[str, str]:
+    """Create the output of the previous and current rpm commands.
+
+    :param count: The number of packages
+    :returns: The text and structured output
+    """
+    text = "".join(RPM_QI.format(number=number) for number in range(count))
+    records = []
+    for number in range(count):
+        package = image_introspect.CmdParser().splitter(
+            RPM_QI.format(number=number).splitlines(),
+            line_split=":",
+        )
+        package["description"] = "\n".join(RPM_QI.split("Description :\n")[1].splitlines())
+        values = (package.get(field, "") for field, _tag in image_introspect.RPM_FIELDS)
+        records.append(image_introspect.RPM_FIELD_SEPARATOR.join(values))
+    record_separator = image_introspect.RPM_RECORD_SEPARATOR
+    return text, record_separator.join(records) + record_separator
+
+
+def pip_outputs(count: int) -> tuple[str, str]:
+    """Create the output of the previous and current python package commands.
+
+    :param count: The number of packages
+    :returns: The text and structured output
+    """
+    text = "\n---\n".join(PIP_SHOW.format(number=number) for number in range(count))
+    lines = []
+    for number in range(count):
+        lines.append(
+            json.dumps(
+                {
+                    "name": f"ansible-core{number}",
+                    "version": "2.15.0",
+                    "summary": "Radically simple IT automation",
+                    "home-page": "https://ansible.com/",
+                    "author": "Ansible, Inc.",
+                    "author-email": "info@ansible.com",
+                    "license": "GPLv3+",
+                    "location": "/usr/local/lib/python3.9/site-packages",
+                    "requires": ["cryptography", "jinja2", "packaging", "PyYAML", "resolvelib"],
+                    "editable": False,
+                },
+            ),
+        )
+    return text, "\n".join(lines)
+
+
+def parse_rpm_text(command: image_introspect.Command) -> None:
+    """Parse the output of ``rpm -qai`` line by line, as previously done.
+
+    :param command: The result of running the command
+    """
+    packages = []
+    package: list[str] = []
+    for line in command.stdout.splitlines():
+        if re.match(r"^Name\s{2,}:", line) and package:
+            packages.append(package)
+            package = [line]
+        else:
+            package.append(line)
+    if package:
+        packages.append(package)
+    parser = image_introspect.CmdParser()
+    command.details = [parser.splitter(package, line_split=":") for package in packages]
+
+
+def measure(parse: Callable, stdout: str) -> tuple[float, int, Any]:
+    """Measure the time and peak memory used by a parser.
+
+    :param parse: The parser
+    :param stdout: The command output to parse
+    :returns: The elapsed time, the peak memory and the details parsed
+    """
+    command = image_introspect.Command(id_="benchmark", command="", parse=parse, stdout=stdout)
+    start = time.perf_counter()
+    parse(command)
+    elapsed = time.perf_counter() - start
+
+    command = image_introspect.Command(id_="benchmark", command="", parse=parse, stdout=stdout)
+    tracemalloc.start()
+    parse(command)
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, command.details
+
+
+def collect_metadata(command: image_introspect.Command) -> None:
+    """Collect the local python packages from the distribution metadata.
+
+    :param command: The command for which the details will be collected
+    """
+    metadata = image_introspect.PythonPackages().commands[0]
+    image_introspect.run_command(metadata)
+    metadata.parse(metadata)
+    command.details = metadata.details
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rpms", type=int, default=800, help="number of system packages")
+    parser.add_argument("--pips", type=int, default=150, help="number of python packages")
+    parser.add_argument("--collect", action="store_true", help="collect the local packages")
+    args = parser.parse_args()
+
+    rpm_text, rpm_structured = rpm_outputs(args.rpms)
+    pip_text, pip_structured = pip_outputs(args.pips)
+    python_packages = image_introspect.PythonPackages()
+    comparisons = (
+        ("rpm -qai", parse_rpm_text, rpm_text),
+        ("rpm --queryformat", image_introspect.SystemPackages().parse, rpm_structured),
+        ("pip show", python_packages.parse, pip_text),
+        ("importlib.metadata", python_packages.parse_metadata, pip_structured),
+    )
+    for name, parse, stdout in comparisons:
+        elapsed, peak, details = measure(parse, stdout)
+        print(
+            f"{name:<20} packages: {len(details):>5}, elapsed: {elapsed * 1000:8.2f}ms,"
+            f" peak memory: {peak / 1024:8.0f}KiB",
+        )
+
+    if args.collect:
+        collectors = (
+            ("pip freeze, pip show", python_packages._parse_pip),
+            ("importlib.metadata", collect_metadata),
+        )
+        for name, collect in collectors:
+            command = image_introspect.Command(id_="benchmark", command="", parse=collect)
+            start = time.perf_counter()
+            collect(command)
+            elapsed = time.perf_counter() - start
+            print(f"{name:<20} packages: {len(command.details):>5}, elapsed: {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
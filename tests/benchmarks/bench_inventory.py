@@ -0,0 +1,163 @@
+"""Benchmark browsing the groups and hosts of a large inventory.
+
+A synthetic ``ansible-inventory --list`` output is created, with each host in one of
+many groups and every group a child of ``all``. The time and peak memory used to index
+the inventory, and to build the menu for ``all``, a group and every host on each visit,
+are reported for the previous approach, copying the variables of each host into a menu
+entry on every visit, and for the inventory index.
+
+Usage: ``python -m tests.benchmarks.bench_inventory --hosts 50000 --groups 500``
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import tracemalloc
+
+from typing import Any
+from typing import Callable
+
+from ansible_navigator.actions._inventory_index import InventoryIndex
+
+
+def inventory(hosts: int, groups: int, variables: int) -> dict[str, Any]:
+    """Create the output of ``ansible-inventory --list``.
+
+    :param hosts: The number of hosts
+    :param groups: The number of groups
+    :param variables: The number of variables for each host
+    :returns: The inventory
+    """
+    names = [f"host{number:06d}" for number in range(hosts)]
+    result: dict[str, Any] = {
+        "_meta": {
+            "hostvars": {
+                name: {f"var{number}": f"{name}-{number}" for number in range(variables)}
+                for name in names
+            },
+        },
+        "all": {"children": [f"group{number}" for number in range(groups)]},
+    }
+    for number in range(groups):
+        result[f"group{number}"] = {"hosts": names[number::groups]}
+    return result
+
+
+class Previous:
+    """The previous approach, copying the host variables into the menu on every visit."""
+
+    def __init__(self, value: dict[str, Any]) -> None:
+        """Initialize the host variables, as the previous inventory setter did.
+
+        :param value: The inventory
+        """
+        self.inventory = value
+        self.host_vars = {
+            k: {**v, "inventory_hostname": k}
+            for k, v in value.get("_meta", {}).get("hostvars", {}).items()
+        }
+        for group in value:
+            for host in value[group].get("hosts", []):
+                if host in self.host_vars:
+                    continue
+                self.host_vars[host] = {"inventory_hostname": host}
+
+    def group_rows(self, group: str, taxonomy: str, columns: list[str]) -> list[Any]:
+        """Build the menu for a group.
+
+        :param group: The name of the group
+        :param taxonomy: The path of groups to this group
+        :param columns: The host variables shown as columns
+        :returns: The menu rows
+        """
+        rows = []
+        hosts = self.inventory[group].get("hosts", None)
+        for host in sorted(hosts or []):
+            row = dict(**self.host_vars[host])
+            row["__name"] = row["inventory_hostname"]
+            row["__taxonomy"] = taxonomy
+            row["__type"] = "host"
+            rows.append(row)
+        for child in sorted(self.inventory[group].get("children", [])):
+            row = {"__name": child, "__taxonomy": taxonomy, "__type": "group"}
+            if hosts:
+                row.update({c: "" for c in columns})
+            rows.append(row)
+        return rows
+
+    def host_rows(self) -> list[Any]:
+        """Build the menu of hosts.
+
+        :returns: The menu rows
+        """
+        rows = []
+        for host in self.host_vars.values():
+            host["__type"] = "host"
+            rows.append(dict(host))
+        return rows
+
+
+def browse(model: Previous | InventoryIndex, visits: int) -> int:
+    """Visit the menu for ``all``, a group and every host, as when browsing.
+
+    :param model: The indexed inventory
+    :param visits: The number of times each menu is visited
+    :returns: The number of rows shown
+    """
+    shown = 0
+    for _visit in range(visits):
+        shown += len(model.group_rows("all", "all", ["var0"]))
+        shown += len(model.group_rows("group0", "all▸group0", ["var0"]))
+        shown += len(model.host_rows())
+    return shown
+
+
+def measure(action: Callable[[Any], Any], setup: Callable[[], Any]) -> tuple[float, int, Any]:
+    """Measure the time and peak memory used.
+
+    :param action: The action to measure
+    :param setup: The function creating the argument for the action, not measured
+    :returns: The elapsed time, the peak memory and the result of the action
+    """
+    argument = setup()
+    start = time.perf_counter()
+    action(argument)
+    elapsed = time.perf_counter() - start
+
+    argument = setup()
+    tracemalloc.start()
+    result = action(argument)
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, result
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hosts", type=int, default=50000, help="number of hosts")
+    parser.add_argument("--groups", type=int, default=500, help="number of groups")
+    parser.add_argument("--variables", type=int, default=20, help="number of variables per host")
+    parser.add_argument("--visits", type=int, default=5, help="number of visits to each menu")
+    args = parser.parse_args()
+
+    value = inventory(args.hosts, args.groups, args.variables)
+    for name, model_type in (("previous", Previous), ("inventory index", InventoryIndex)):
+        elapsed, peak, _model = measure(model_type, lambda: value)
+        print(
+            f"{name:<16} index:  elapsed: {elapsed * 1000:9.2f}ms,"
+            f" peak memory: {peak / 1024:9.0f}KiB",
+        )
+        elapsed, peak, shown = measure(
+            lambda model: browse(model, args.visits),
+            lambda model_type=model_type: model_type(value),
+        )
+        print(
+            f"{name:<16} browse: elapsed: {elapsed * 1000:9.2f}ms,"
+            f" peak memory: {peak / 1024:9.0f}KiB, rows: {shown}",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Benchmark the run action's handling of runner events.
+
+A synthetic playbook run, one play against many hosts, is replayed through
+``Action._handle_message`` and the event rate reported.
+
+Usage: ``python -m tests.benchmarks.bench_run_events --events 1000000``
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from collections.abc import Iterator
+from copy import deepcopy
+from typing import Any
+
+from ansible_navigator.actions.run import Action as action
+from ansible_navigator.configuration_subsystem import NavigatorConfiguration
+
+
+def synthetic_events(hosts: int, events: int) -> Iterator[dict[str, Any]]:
+    """Generate runner messages for a single play run against many hosts.
+
+    Each task produces a task start event, followed by a start event for
+    every host and then a result event for every host.
+
+    :param hosts: The number of hosts in the play
+    :param events: The approximate number of events to generate
+    :yields: Runner messages
+    """
+    play_uuid = "play-0"
+    yield {
+        "event": "playbook_on_play_start",
+        "event_data": {"name": "benchmark", "uuid": play_uuid},
+    }
+    results = ("runner_on_ok", "runner_on_skipped", "runner_on_failed")
+    tasks = max(1, events // (2 * hosts + 1))
+    for task_number in range(tasks):
+        task_uuid = f"task-{task_number}"
+        yield {
+            "event": "playbook_on_task_start",
+            "event_data": {"task": f"task {task_number}", "task_uuid": task_uuid},
+        }
+        for event in ["runner_on_start"] + [results[task_number % len(results)]]:
+            for host_number in range(hosts):
+                yield {
+                    "event": event,
+                    "event_data": {
+                        "duration": 0.1,
+                        "host": f"host-{host_number}",
+                        "ignore_errors": False,
+                        "play_uuid": play_uuid,
+                        "res": {"changed": False},
+                        "task": f"task {task_number}",
+                        "task_action": "debug",
+                        "task_uuid": task_uuid,
+                    },
+                }
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=1_000_000, help="number of events")
+    parser.add_argument("--hosts", type=int, default=3_000, help="number of hosts")
+    args = parser.parse_args()
+
+    messages = list(synthetic_events(hosts=args.hosts, events=args.events))
+    run_action = action(args=deepcopy(NavigatorConfiguration))
+
+    start = time.perf_counter()
+    for message in messages:
+        run_action._handle_message(message)
+    elapsed = time.perf_counter() - start
+
+    tasks = sum(len(play["tasks"]) for play in run_action._plays.value)
+    print(f"events: {len(messages)}, tasks: {tasks}, hosts: {args.hosts}")
+    print(f"elapsed: {elapsed:.2f}s, {len(messages) / elapsed:,.0f} events/s")
+
+
+if __name__ == "__main__":
+    main()
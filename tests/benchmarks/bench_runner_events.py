@@ -0,0 +1,143 @@
+"""Benchmark handing ansible-runner events to the ``run`` action through the queue.
+
+Events resembling those of a playbook gathering facts and running a command with a
+large output are passed to the asynchronous runner command's event handler, while a
+consumer thread takes them from the queue. The events per second are reported for the
+previous handler, copying each event in full, and for the event projection.
+
+Usage: ``python -m tests.benchmarks.bench_runner_events --events 5000 --facts 400``
+"""
+
+from __future__ import annotations
+
+import argparse
+import threading
+import time
+import uuid
+
+from copy import deepcopy
+from queue import Queue
+from typing import Any
+from typing import Callable
+
+from ansible_navigator.runner import CommandAsync
+
+
+def events(count: int, facts: int, stdout_lines: int) -> list[dict[str, Any]]:
+    """Create runner events, alternating a fact gathering and command result.
+
+    :param count: The number of events
+    :param facts: The number of facts in each fact gathering result
+    :param stdout_lines: The number of lines of each command's output
+    :returns: The events
+    """
+    setup_result = {
+        "ansible_facts": {
+            f"ansible_fact_{number}": {"value": f"fact {number}", "list": list(range(10))}
+            for number in range(facts)
+        },
+        "changed": False,
+    }
+    output = "\n".join(f"output line {number}" for number in range(stdout_lines))
+    command_result = {
+        "changed": True,
+        "cmd": ["cat", "file"],
+        "stdout": output,
+        "stdout_lines": output.splitlines(),
+    }
+    result = []
+    for number in range(count):
+        task_uuid = str(uuid.uuid4())
+        result.append(
+            {
+                "uuid": str(uuid.uuid4()),
+                "counter": number,
+                "stdout": "ok: [localhost]",
+                "start_line": number,
+                "end_line": number + 1,
+                "runner_ident": "benchmark",
+                "event": "runner_on_ok",
+                "pid": 1234,
+                "created": "2023-01-01T00:00:00.000000",
+                "parent_uuid": task_uuid,
+                "event_data": {
+                    "playbook": "site.yml",
+                    "play": "benchmark",
+                    "play_uuid": "play",
+                    "task": "setup" if number % 2 else "command",
+                    "task_uuid": task_uuid,
+                    "task_action": "setup" if number % 2 else "command",
+                    "host": "localhost",
+                    "duration": 0.1,
+                    "res": setup_result if number % 2 else command_result,
+                },
+            },
+        )
+    return result
+
+
+def previous_handler(command: CommandAsync) -> Callable[[dict[str, Any]], bool]:
+    """Create the previous event handler, copying each event in full.
+
+    :param command: The asynchronous runner command
+    :returns: The event handler
+    """
+
+    def handler(event: dict[str, Any]) -> bool:
+        """Handle the event from ansible-runner.
+
+        :param event: The event from ansible-runner
+        :returns: The value of ``write_job_events``
+        """
+        command._logger.debug("ansible-runner event handle: %s", event)
+        command._queue.put(deepcopy(event))
+        return command._write_job_events
+
+    return handler
+
+
+def measure(handler_factory: Callable, runner_events: list[dict[str, Any]]) -> float:
+    """Measure the events per second handled and consumed from the queue.
+
+    :param handler_factory: The function creating the event handler for a command
+    :param runner_events: The events
+    :returns: The events per second
+    """
+    queue: Queue = Queue()
+    command = CommandAsync(executable_cmd="true", queue=queue, write_job_events=False)
+    handler = handler_factory(command)
+
+    def consume() -> None:
+        """Take each event from the queue."""
+        for _event in runner_events:
+            queue.get()
+
+    consumer = threading.Thread(target=consume)
+    start = time.perf_counter()
+    consumer.start()
+    for event in runner_events:
+        handler(event)
+    consumer.join()
+    return len(runner_events) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=5000, help="number of events")
+    parser.add_argument("--facts", type=int, default=400, help="number of facts gathered")
+    parser.add_argument("--lines", type=int, default=500, help="lines of command output")
+    args = parser.parse_args()
+
+    runner_events = events(args.events, args.facts, args.lines)
+    handlers = (
+        ("deepcopy", previous_handler),
+        ("projection", lambda command: command._event_handler),
+    )
+    for name, handler_factory in handlers:
+        rate = measure(handler_factory, runner_events)
+        print(f"{name:<12} events: {args.events:>7}, events/s: {rate:12.0f}")
+
+
+if __name__ == "__main__":
+    main()
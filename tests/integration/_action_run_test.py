@@ -174,6 +174,7 @@ class ActionRunTest:
 
         user_interface = Ui(
             clear=self.callable_pass,
+            menu_changed=self.callable_pass,
             menu_filter=self.callable_pass_one_arg,
             scroll=self.callable_pass_one_arg,
             # Ignored here because it doesn't make sens to mock up a full
@@ -0,0 +1,128 @@
+"""Test the collection content menu is built from the plugin summaries."""
+
+from __future__ import annotations
+
+import json
+
+from copy import deepcopy
+from pathlib import Path
+
+import pytest
+
+from ansible_navigator.actions.collections import SUMMARY_KEY_PREFIX
+from ansible_navigator.actions.collections import Action as action
+from ansible_navigator.configuration_subsystem import NavigatorConfiguration
+from ansible_navigator.steps import Step
+from ansible_navigator.utils.key_value_store import KeyValueStore
+
+
+def _doc(name: str) -> dict:
+    """Create the full documentation for a module.
+
+    :param name: The module name
+    :returns: The cached documentation
+    """
+    return {
+        "plugin": {
+            "doc": {
+                "module": name,
+                "short_description": f"The {name} module",
+                "version_added": "1.0.0",
+                "options": {"state": {"type": "str"}},
+            },
+            "examples": "- ns.col.{name}:",
+            "returndocs": {},
+            "metadata": None,
+        },
+    }
+
+
+@pytest.fixture(name="collections_action")
+def fixture_collections_action(tmp_path: Path) -> action:
+    """Provide a collections action with a cached collection.
+
+    The ``summarized`` module has a summary in the cache, the ``full`` module does not.
+
+    :param tmp_path: The temporary path fixture
+    :returns: The collections action
+    """
+    cache = KeyValueStore(tmp_path / "cache.db")
+    summary = _doc("summarized")
+    del summary["plugin"]["doc"]["options"]
+    cache.update_many(
+        {
+            "c1": json.dumps(_doc("summarized")),
+            f"{SUMMARY_KEY_PREFIX}c1": json.dumps({"plugin": {"doc": summary["plugin"]["doc"]}}),
+            "c2": json.dumps(_doc("full")),
+        },
+    )
+    cache.close()
+
+    collections_action = action(args=deepcopy(NavigatorConfiguration))
+    collections_action._collection_cache = cache
+    collections_action._collections = [
+        {
+            "collection_info": {},
+            "hidden_by": [],
+            "known_as": "ns.col",
+            "path": "/collections/ns/col",
+            "plugin_checksums": {
+                "c1": {"path": "plugins/modules/summarized.py", "type": "module"},
+                "c2": {"path": "plugins/modules/full.py", "type": "module"},
+            },
+            "roles": [],
+            "runtime": {},
+        },
+    ]
+    collections_action.steps.append(Step(name="all", step_type="menu", value=[], index=0))
+    return collections_action
+
+
+def test_menu_from_summaries(collections_action: action):
+    """Test the menu uses the summaries and the full doc is loaded when shown.
+
+    :param collections_action: The collections action
+    """
+    menu = collections_action._build_collection_content_menu()
+    summarized, full = sorted(menu.value, key=lambda plugin: plugin["__ns.col"], reverse=True)
+    assert summarized["__description"] == "The summarized module"
+    assert summarized["__added"] == "1.0.0"
+    assert "options" not in summarized["doc"]
+    assert summarized["__checksum"] == "c1"
+    assert "options" in full["doc"]
+    assert "__checksum" not in full
+
+    menu.index = menu.value.index(summarized)
+    collections_action.steps.append(menu)
+    content = collections_action._build_collection_content()
+    collections_action.steps.append(content)
+    content.show_func()
+    assert "options" in summarized["doc"]
+    assert summarized["examples"] == "- ns.col.{name}:"
+    assert "__checksum" not in summarized
+    assert summarized["__description"] == "The summarized module"
+
+
+def test_stdout_details_from_summaries(collections_action: action):
+    """Test the plugin details for mode stdout are read from the summaries.
+
+    :param collections_action: The collections action
+    """
+    collections_action._collection_cache.open_()
+    details = collections_action._get_collection_plugins_details(
+        collections_action._collections[0],
+    )
+    assert details == {
+        "module": [
+            {
+                "full_name": "ns.col.summarized",
+                "path": "/collections/ns/col/plugins/modules/summarized.py",
+                "short_description": "The summarized module",
+            },
+            {
+                "full_name": "ns.col.full",
+                "path": "/collections/ns/col/plugins/modules/full.py",
+                "short_description": "The full module",
+            },
+        ],
+    }
@@ -175,7 +175,7 @@ def test_artifact_path(
     monkeypatch.setattr(os, "makedirs", make_dirs)
     monkeypatch.setattr(action, "_get_status", get_status)
     mocked_write = mocker.patch(
-        "ansible_navigator.actions.run.serialize_write_file",
+        "ansible_navigator.actions.run.write_indexed_artifact",
         return_value=None,
     )
 
@@ -223,7 +223,7 @@ def test_artifact_contents(monkeypatch: pytest.MonkeyPatch, mocker: MockerFixtur
     monkeypatch.setattr(os, "makedirs", make_dirs)
     monkeypatch.setattr(action, "_get_status", get_status)
     mocked_write = mocker.patch(
-        "ansible_navigator.actions.run.serialize_write_file",
+        "ansible_navigator.actions.run.write_indexed_artifact",
         return_value=None,
     )
 
@@ -0,0 +1,337 @@
+"""Unit tests for the playbook artifact index used for replay."""
+
+from __future__ import annotations
+
+import json
+import os
+
+from copy import deepcopy
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from ansible_navigator.actions import _run_artifact
+from ansible_navigator.actions._run_artifact import IndexedArtifact
+from ansible_navigator.actions._run_artifact import index_path
+from ansible_navigator.actions._run_artifact import write_indexed_artifact
+from ansible_navigator.actions.run import Action as action
+from ansible_navigator.configuration_subsystem import NavigatorConfiguration
+from ansible_navigator.content_defs import ContentView
+from ansible_navigator.content_defs import SerializationFormat
+from ansible_navigator.utils.serialize import serialize_write_file
+from tests.defaults import FIXTURES_DIR
+
+
+ARTIFACT = Path(FIXTURES_DIR) / "integration" / "actions" / "replay" / "playbook-artifact.json"
+
+
+@pytest.fixture(name="content")
+def fixture_content() -> dict[str, Any]:
+    """Provide the content of a playbook artifact.
+
+    :returns: The artifact content
+    """
+    with ARTIFACT.open(encoding="utf-8") as fh:
+        content = json.load(fh)
+    content["stdout"].append("ünïcödé")
+    content["plays"].append({"name": "empty", "tasks": [], "uuid": "empty"})
+    return content
+
+
+@pytest.fixture(name="cache_path")
+def fixture_cache_path(tmp_path: Path) -> Path:
+    """Provide the cache path where the indexes are written.
+
+    :param tmp_path: The temporary path fixture
+    :returns: The cache path
+    """
+    return tmp_path / "cache"
+
+
+@pytest.fixture(name="indexed")
+def fixture_indexed(tmp_path: Path, content: dict[str, Any], cache_path: Path) -> Path:
+    """Provide an artifact written with an index.
+
+    :param tmp_path: The temporary path fixture
+    :param content: The artifact content
+    :param cache_path: The cache path where the indexes are written
+    :returns: The artifact path
+    """
+    artifact = tmp_path / "artifact.json"
+    write_indexed_artifact(content=content, file=artifact, cache_path=cache_path)
+    return artifact
+
+
+def test_artifact_unchanged(
+    tmp_path: Path,
+    content: dict[str, Any],
+    cache_path: Path,
+    indexed: Path,
+):
+    """Test the artifact written with an index is identical to the serialized one.
+
+    The index is written to the cache path, not alongside the artifact.
+
+    :param tmp_path: The temporary path fixture
+    :param content: The artifact content
+    :param cache_path: The cache path where the indexes are written
+    :param indexed: The artifact written with an index
+    """
+    serialized = tmp_path / "serialized.json"
+    serialize_write_file(
+        content=content,
+        content_view=ContentView.NORMAL,
+        file_mode="w",
+        file=serialized,
+        serialization_format=SerializationFormat.JSON,
+    )
+    assert indexed.read_bytes() == serialized.read_bytes()
+    assert index_path(str(indexed), cache_path).parent == cache_path / "artifact_index"
+    assert index_path(str(indexed), cache_path).exists()
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "artifact.json",
+        "cache",
+        "serialized.json",
+    ]
+
+
+def test_written_record_by_record(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    content: dict[str, Any],
+    cache_path: Path,
+):
+    """Test no task list and not the stdout are serialized as a whole.
+
+    :param monkeypatch: The monkeypatch fixture
+    :param tmp_path: The temporary path fixture
+    :param content: The artifact content
+    :param cache_path: The cache path where the indexes are written
+    """
+    serialized: list[Any] = []
+    dumps = json.dumps
+
+    def record(value: Any, **kwargs: Any) -> str:
+        """Record the values serialized.
+
+        :param value: The value to serialize
+        :param kwargs: The serialization parameters
+        :returns: The serialized value
+        """
+        serialized.append(value)
+        return dumps(value, **kwargs)
+
+    monkeypatch.setattr(_run_artifact.json, "dumps", record)
+    write_indexed_artifact(content=content, file=tmp_path / "artifact.json", cache_path=cache_path)
+    monkeypatch.undo()
+    whole = [content["stdout"], content["plays"]] + [play["tasks"] for play in content["plays"]]
+    assert not [value for value in serialized if any(value is list_ for list_ in whole)]
+    assert any(value is content["plays"][0]["tasks"][0] for value in serialized)
+
+
+def test_partial_artifact_not_written(content: dict[str, Any], cache_path: Path, indexed: Path):
+    """Test an artifact which can not be serialized does not replace the existing one.
+
+    :param content: The artifact content
+    :param cache_path: The cache path where the indexes are written
+    :param indexed: The artifact written with an index
+    """
+    written = indexed.read_bytes()
+    content["stdout"].append(object())
+    with pytest.raises(TypeError):
+        write_indexed_artifact(content=content, file=indexed, cache_path=cache_path)
+    assert indexed.read_bytes() == written
+    assert [path.name for path in indexed.parent.glob("*.json")] == ["artifact.json"]
+    assert IndexedArtifact.open(str(indexed), cache_path) is not None
+
+
+def test_indexes_pruned(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    content: dict[str, Any],
+    cache_path: Path,
+):
+    """Test only the most recently written indexes are kept.
+
+    :param monkeypatch: The monkeypatch fixture
+    :param tmp_path: The temporary path fixture
+    :param content: The artifact content
+    :param cache_path: The cache path where the indexes are written
+    """
+    monkeypatch.setattr(_run_artifact, "INDEXES_KEPT", 2)
+    artifacts = [tmp_path / f"artifact-{number}.json" for number in range(3)]
+    for number, artifact in enumerate(artifacts):
+        write_indexed_artifact(content=content, file=artifact, cache_path=cache_path)
+        index = index_path(str(artifact), cache_path)
+        os.utime(index, ns=(number, number))
+    assert [index_path(str(artifact), cache_path).exists() for artifact in artifacts] == [
+        False,
+        True,
+        True,
+    ]
+
+
+def test_indexed_artifact(content: dict[str, Any], cache_path: Path, indexed: Path):
+    """Test the plays, tasks and stdout are read from the artifact using the index.
+
+    :param content: The artifact content
+    :param cache_path: The cache path where the indexes are written
+    :param indexed: The artifact written with an index
+    """
+    artifact = IndexedArtifact.open(str(indexed), cache_path)
+    assert artifact is not None
+    summary = artifact.content()
+    assert summary["status"] == content["status"]
+    assert "stdout" not in summary
+    assert all("tasks" not in play for play in summary["plays"])
+    for play, expected in zip(summary["plays"], content["plays"]):
+        assert artifact.tasks(play) == expected["tasks"]
+    assert artifact.stdout() == content["stdout"]
+    assert artifact.plays() == content["plays"]
+
+
+def test_index_out_of_date(cache_path: Path, indexed: Path):
+    """Test the index is built again once the artifact has changed.
+
+    :param cache_path: The cache path where the indexes are written
+    :param indexed: The artifact written with an index
+    """
+    assert IndexedArtifact.open(str(indexed.with_name("missing.json")), cache_path) is None
+    stat = indexed.stat()
+    os.utime(indexed, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert IndexedArtifact.open(str(indexed), cache_path) is not None
+    with index_path(str(indexed), cache_path).open(encoding="utf-8") as fh:
+        assert json.load(fh)["artifact_mtime_ns"] == stat.st_mtime_ns + 1_000_000_000
+
+
+def test_index_built(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    content: dict[str, Any],
+    cache_path: Path,
+    indexed: Path,
+):
+    """Test the index built by scanning an artifact matches the one written with it.
+
+    The artifact is copied, as if from elsewhere, and is not loaded in full.
+
+    :param monkeypatch: The monkeypatch fixture
+    :param tmp_path: The temporary path fixture
+    :param content: The artifact content
+    :param cache_path: The cache path where the indexes are written
+    :param indexed: The artifact written with an index
+    """
+    with index_path(str(indexed), cache_path).open(encoding="utf-8") as fh:
+        written = json.load(fh)
+    copied = tmp_path / "copied.json"
+    copied.write_bytes(indexed.read_bytes())
+    monkeypatch.setattr(_run_artifact.json, "load", pytest.fail)
+
+    artifact = IndexedArtifact.open(str(copied), cache_path)
+    monkeypatch.undo()
+    assert artifact is not None
+    with index_path(str(copied), cache_path).open(encoding="utf-8") as fh:
+        built = json.load(fh)
+    for key in ("artifact_file", "artifact_mtime_ns"):
+        written.pop(key)
+        built.pop(key)
+    assert built == written
+    assert artifact.plays() == content["plays"]
+    assert artifact.stdout() == content["stdout"]
+
+
+@pytest.mark.parametrize(
+    "artifact",
+    (
+        "[]",
+        '{"version": "2.0.0", "plays": [], "status": "successful"}',
+        '{"version": "2.0.0", "plays": {}, "stdout": [], "status": "", "status_color": 0}',
+        '{"version": "2.0.0", "plays": [], "stdout": ["line',
+        '{"record": "header", "version": "2.0.0"}\n{"record": "status"}\n',
+        "",
+    ),
+    ids=("not-object", "missing-keys", "plays-not-list", "truncated", "journal", "empty"),
+)
+def test_index_not_built(tmp_path: Path, cache_path: Path, artifact: str):
+    """Test an index is not built for a file which is not a playbook artifact.
+
+    :param tmp_path: The temporary path fixture
+    :param cache_path: The cache path where the indexes are written
+    :param artifact: The content of the file
+    """
+    artifact_file = tmp_path / "artifact.json"
+    artifact_file.write_text(artifact, encoding="utf-8")
+    assert IndexedArtifact.open(str(artifact_file), cache_path) is None
+    assert not index_path(str(artifact_file), cache_path).exists()
+
+
+@pytest.mark.parametrize("index", (True, False), ids=("indexed", "not-indexed"))
+def test_replay(
+    monkeypatch: pytest.MonkeyPatch,
+    index: bool,
+    content: dict[str, Any],
+    cache_path: Path,
+    indexed: Path,
+):
+    """Test replay reads tasks and stdout when needed, building the index if missing.
+
+    :param monkeypatch: The monkeypatch fixture
+    :param index: Whether the artifact has an index
+    :param content: The artifact content
+    :param cache_path: The cache path where the indexes are written
+    :param indexed: The artifact written with an index
+    """
+    if not index:
+        index_path(str(indexed), cache_path).unlink()
+    monkeypatch.setattr(action, "mode", "interactive")
+    monkeypatch.setattr(action, "_update_args", lambda *_args, **_kwargs: True)
+    args = deepcopy(NavigatorConfiguration)
+    args.internals.cache_path = cache_path
+    args.entry("playbook_artifact_replay").value.current = str(indexed)
+    run_action = action(args=args)
+    run_action._interaction = SimpleNamespace(  # type: ignore[assignment]
+        action=SimpleNamespace(match=SimpleNamespace(groupdict=lambda: {"params_replay": None})),
+        ui=SimpleNamespace(update_status=lambda *_args: None),
+    )
+    assert run_action._init_replay()
+
+    assert index_path(str(indexed), cache_path).exists()
+    assert "tasks" not in run_action._plays.value[0]
+    assert run_action._stdout is None
+    assert run_action.stdout == content["stdout"]
+
+    run_action.steps.append(run_action._plays)
+    run_action._plays.index = 0
+    assert run_action._task_list_for_play().value == content["plays"][0]["tasks"]
+
+
+def test_compressed_replay(
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+    content: dict[str, Any],
+    cache_path: Path,
+):
+    """Test a compressed artifact is written without an index and replayed in full.
+
+    :param tmp_path: The temporary path fixture
+    :param capsys: The output capture fixture
+    :param content: The artifact content
+    :param cache_path: The cache path where the indexes are written
+    """
+    artifact = tmp_path / "artifact.json.gz"
+    index_path(str(artifact), cache_path).parent.mkdir(parents=True)
+    index_path(str(artifact), cache_path).write_text("{}", encoding="utf-8")
+    write_indexed_artifact(content=content, file=artifact, cache_path=cache_path)
+    assert not index_path(str(artifact), cache_path).exists()
+
+    args = deepcopy(NavigatorConfiguration)
+    args.internals.cache_path = cache_path
+    args.entry("playbook_artifact_replay").value.current = str(artifact)
+    args.entry("mode").value.current = "stdout"
+    args.entry("display_color").value.current = True
+    run_action = action(args=args)
+    assert run_action._init_replay()
+    assert run_action._artifact is None
+    assert capsys.readouterr().out.splitlines() == content["stdout"]
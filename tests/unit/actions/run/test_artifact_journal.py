@@ -0,0 +1,168 @@
+"""Unit tests for the streaming playbook artifact journal."""
+
+from __future__ import annotations
+
+import json
+
+from copy import deepcopy
+from pathlib import Path
+
+import pytest
+
+from ansible_navigator.actions._run_artifact import ArtifactJournal
+from ansible_navigator.actions._run_artifact import is_journal
+from ansible_navigator.actions._run_artifact import journal_path
+from ansible_navigator.actions._run_artifact import read_journal
+from ansible_navigator.actions.run import Action as action
+from ansible_navigator.configuration_subsystem import NavigatorConfiguration
+
+
+MESSAGES = [
+    {
+        "event": "playbook_on_play_start",
+        "event_data": {"name": "play", "uuid": "p1"},
+        "stdout": "PLAY [play] ***",
+    },
+    {
+        "event": "runner_on_start",
+        "event_data": {
+            "host": "h1",
+            "play_uuid": "p1",
+            "task": "task",
+            "task_action": "debug",
+            "task_uuid": "t1",
+        },
+    },
+    {
+        "event": "runner_on_ok",
+        "event_data": {
+            "duration": 1,
+            "host": "h1",
+            "ignore_errors": False,
+            "play_uuid": "p1",
+            "res": {"changed": True},
+            "task": "task",
+            "task_action": "debug",
+            "task_uuid": "t1",
+        },
+        "stdout": "changed: [h1]",
+    },
+]
+
+
+@pytest.mark.parametrize(
+    ("artifact", "expected"),
+    (
+        pytest.param("/tmp/site-artifact.json", "/tmp/site-artifact.jsonl", id="json"),
+        pytest.param("/tmp/site-artifact", "/tmp/site-artifact.jsonl", id="no-extension"),
+    ),
+)
+def test_journal_path(artifact: str, expected: str):
+    """Test the journal file path is derived from the artifact file path.
+
+    :param artifact: The artifact file path
+    :param expected: The expected journal file path
+    """
+    assert journal_path(artifact) == Path(expected)
+
+
+def test_journal_round_trip(tmp_path: Path):
+    """Test records written to the journal can be read back.
+
+    :param tmp_path: The temporary path fixture
+    """
+    path = tmp_path / "sub" / "artifact.jsonl"
+    journal = ArtifactJournal(path=path, settings_entries={"a": 1}, settings_sources={"a": "b"})
+    for message in MESSAGES:
+        journal.append(message)
+    journal.close(status="successful", status_color=10)
+
+    assert is_journal(str(path))
+    records = list(read_journal(str(path)))
+    assert [record["record"] for record in records] == ["header"] + ["message"] * 3 + ["status"]
+    assert records[0]["settings_entries"] == {"a": 1}
+    assert [record["message"] for record in records[1:-1]] == MESSAGES
+    assert records[-1]["status"] == "successful"
+
+    journal.remove()
+    assert not path.exists()
+
+
+def test_journal_truncated(tmp_path: Path):
+    """Test a partially written last record is ignored.
+
+    :param tmp_path: The temporary path fixture
+    """
+    path = tmp_path / "artifact.jsonl"
+    journal = ArtifactJournal(path=path, settings_entries={}, settings_sources={})
+    journal.append(MESSAGES[0])
+    journal.flush()
+    with path.open(mode="a", encoding="utf-8") as fh:
+        fh.write('{"record": "mess')
+    assert len(list(read_journal(str(path)))) == 2
+
+
+def test_not_journal(tmp_path: Path):
+    """Test an artifact is not mistaken for a journal.
+
+    :param tmp_path: The temporary path fixture
+    """
+    path = tmp_path / "artifact.json"
+    path.write_text(json.dumps({"version": "2.0.0"}, indent=4), encoding="utf-8")
+    assert not is_journal(str(path))
+
+
+def test_stream_and_compact(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Test a run streams messages to the journal and compacts it to the artifact.
+
+    :param tmp_path: The temporary path fixture
+    :param monkeypatch: The monkeypatch fixture
+    """
+    monkeypatch.setattr(action, "_get_status", lambda _self: ("successful", 10))
+    artifact = tmp_path / "artifact.json"
+    args = deepcopy(NavigatorConfiguration)
+    args.entry("playbook").value.current = str(tmp_path / "site.yml")
+    args.entry("playbook_artifact_save_as").value.current = str(artifact)
+    args.entry("playbook_artifact_enable").value.current = True
+    args.entry("playbook_artifact_stream").value.current = True
+    args.entry("time_zone").value.current = "UTC"
+
+    run_action = action(args=args)
+    run_action._start_journal()
+    journal = tmp_path / "artifact.jsonl"
+    for message in deepcopy(MESSAGES):
+        run_action._queue.put(message)
+    run_action._dequeue()
+
+    # The messages are on disk before the run completes
+    records = list(read_journal(str(journal)))
+    assert [record["message"] for record in records[1:]] == MESSAGES
+
+    run_action.write_artifact()
+    assert not journal.exists()
+    with artifact.open(encoding="utf-8") as fh:
+        data = json.load(fh)
+    assert data["version"] == "2.0.0"
+    assert data["stdout"] == ["PLAY [play] ***", "changed: [h1]"]
+    assert data["plays"][0]["tasks"][0]["__result"] == "Ok"
+
+
+def test_load_journal(tmp_path: Path):
+    """Test a journal is loaded to the same content as an artifact.
+
+    :param tmp_path: The temporary path fixture
+    """
+    path = tmp_path / "artifact.jsonl"
+    journal = ArtifactJournal(path=path, settings_entries={}, settings_sources={})
+    for message in MESSAGES:
+        journal.append(message)
+    journal.flush()
+
+    run_action = action(args=deepcopy(NavigatorConfiguration))
+    data = run_action._load_journal(str(path))
+    assert data["version"] == "2.0.0"
+    assert data["status"] == "incomplete"
+    assert data["stdout"] == ["PLAY [play] ***", "changed: [h1]"]
+    play = data["plays"][0]
+    assert play["__ok"] == 1
+    assert play["tasks"][0]["__changed"] is True
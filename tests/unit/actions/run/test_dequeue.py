@@ -0,0 +1,89 @@
+"""Unit tests for draining the runner queue in the run action."""
+
+from __future__ import annotations
+
+import logging
+import time
+
+from copy import deepcopy
+
+import pytest
+
+from ansible_navigator.actions import run
+from ansible_navigator.actions.run import Action as action
+from ansible_navigator.configuration_subsystem import NavigatorConfiguration
+
+
+@pytest.fixture(name="run_action")
+def fixture_run_action(monkeypatch: pytest.MonkeyPatch) -> action:
+    """Provide a run action that records the messages it handles.
+
+    :param monkeypatch: The monkeypatch fixture
+    :returns: The run action
+    """
+    run_action = action(args=deepcopy(NavigatorConfiguration))
+    run_action.handled = []  # type: ignore[attr-defined]
+    monkeypatch.setattr(run_action, "_handle_message", run_action.handled.append)
+    return run_action
+
+
+@pytest.mark.parametrize(
+    ("depth", "expected"),
+    (
+        pytest.param(10, 10, id="shallow-queue-emptied"),
+        pytest.param(2_000, run.DRAIN_MINIMUM_EVENTS, id="minimum-batch"),
+        pytest.param(10_000, 10_000 // run.DRAIN_DEPTH_DIVISOR, id="batch-grows-with-depth"),
+    ),
+)
+def test_dequeue_batch(
+    run_action: action,
+    monkeypatch: pytest.MonkeyPatch,
+    depth: int,
+    expected: int,
+):
+    """Test the number of events handled per drain is bounded by the queue depth.
+
+    :param run_action: The run action
+    :param monkeypatch: The monkeypatch fixture
+    :param depth: The number of events in the queue
+    :param expected: The number of events expected to be handled
+    """
+    monkeypatch.setattr(run, "DRAIN_TIME_BUDGET", 60)
+    for number in range(depth):
+        run_action._queue.put({"number": number})
+    run_action._dequeue()
+    assert len(run_action.handled) == expected
+    assert run_action._queue.qsize() == depth - expected
+    assert run_action._first_message_received
+
+
+def test_dequeue_time_budget(run_action: action, monkeypatch: pytest.MonkeyPatch):
+    """Test a drain stops once the time budget is spent.
+
+    :param run_action: The run action
+    :param monkeypatch: The monkeypatch fixture
+    """
+    monkeypatch.setattr(run, "DRAIN_TIME_BUDGET", -1)
+    for number in range(10):
+        run_action._queue.put({"number": number})
+    run_action._dequeue()
+    assert run_action.handled == [{"number": 0}]
+
+
+def test_dequeue_wait(run_action: action, caplog: pytest.LogCaptureFixture):
+    """Test waiting on an empty queue and the drain debug log.
+
+    :param run_action: The run action
+    :param caplog: The log capture fixture
+    """
+    caplog.set_level(logging.DEBUG)
+    start = time.monotonic()
+    run_action._dequeue(wait=0.05)
+    assert time.monotonic() - start >= 0.05
+    assert not run_action.handled
+
+    run_action._queue.put({"number": 0})
+    run_action._dequeue(wait=10)
+    assert run_action.handled == [{"number": 0}]
+    assert "Drained 1 events" in caplog.text
+    assert "queue depth was 1, now 0" in caplog.text
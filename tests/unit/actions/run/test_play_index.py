@@ -0,0 +1,144 @@
+"""Unit tests for the play index used by the run action."""
+
+from __future__ import annotations
+
+from copy import deepcopy
+from typing import Any
+
+from ansible_navigator.actions._run_events import PlayIndex
+from ansible_navigator.actions.run import Action as action
+from ansible_navigator.configuration_subsystem import NavigatorConfiguration
+
+
+def _play(play_uuid: str) -> dict[str, Any]:
+    """Create a play start event.
+
+    :param play_uuid: The play uuid
+    :returns: The play start message
+    """
+    return {
+        "event": "playbook_on_play_start",
+        "event_data": {"name": f"play {play_uuid}", "uuid": play_uuid},
+    }
+
+
+def _task(event: str, play_uuid: str, task_uuid: str, host: str) -> dict[str, Any]:
+    """Create a runner on event for a task.
+
+    :param event: The runner event
+    :param play_uuid: The parent play uuid
+    :param task_uuid: The task uuid
+    :param host: The host name
+    :returns: The runner message
+    """
+    return {
+        "event": event,
+        "event_data": {
+            "duration": 1,
+            "host": host,
+            "ignore_errors": False,
+            "play_uuid": play_uuid,
+            "res": {"changed": event == "runner_on_ok"},
+            "task": f"task {task_uuid}",
+            "task_action": "debug",
+            "task_uuid": task_uuid,
+        },
+    }
+
+
+def test_index_lookups():
+    """Test plays and tasks can be found in the index."""
+    task = {"task_uuid": "t1", "host": "h1", "__result": "Ok", "__changed": False}
+    play = {"uuid": "p1", "tasks": [task]}
+    index = PlayIndex([play])
+    assert index.play("p1") is play
+    assert index.play("p2") is None
+    assert index.task("p1", "t1", "h1") is play["tasks"][0]
+    assert index.task("p1", "t1", "h2") is None
+    assert index.task("p2", "t1", "h1") is None
+
+
+def test_index_first_task_kept():
+    """Test the first task added for a task uuid and host is the one found."""
+    play = {"uuid": "p1", "tasks": []}
+    first = {"task_uuid": "t1", "host": "h1", "__result": "Ok", "__changed": False}
+    second = {"task_uuid": "t1", "host": "h1", "__result": "Ok", "__changed": False}
+    index = PlayIndex()
+    index.add_play(play)
+    index.add_task(play, first)
+    index.add_task(play, second)
+    assert index.task("p1", "t1", "h1") is first
+
+
+def test_index_counters():
+    """Test the play counters follow the tasks as they are added and updated."""
+    tasks = [
+        {"task_uuid": "t1", "host": "h1", "__result": "Ok", "__changed": True},
+        {"task_uuid": "t1", "host": "h2", "__result": "In progress", "__changed": "unknown"},
+    ]
+    play = {"uuid": "p1", "tasks": tasks}
+    index = PlayIndex([play])
+    assert index.pop_updated() == [play]
+    assert index.pop_updated() == []
+    assert (play["__ok"], play["__in progress"], play["__changed"]) == (1, 1, 1)
+    assert play["__task_count"] == 2
+
+    index.update_task(play, tasks[1], {"__result": "Failed", "__changed": False})
+    index.update_task(play, tasks[0], {"__result": "Ok", "__changed": False})
+    assert index.pop_updated() == [play]
+    assert (play["__ok"], play["__failed"], play["__in progress"]) == (1, 1, 0)
+    assert play["__changed"] == 0
+    assert play["__task_count"] == 2
+
+
+def test_play_stats():
+    """Test the play progress is refreshed from the play counters."""
+    run_action = action(args=deepcopy(NavigatorConfiguration))
+    run_action._handle_message(_play("p1"))
+    run_action._play_stats()
+    assert run_action._plays.value[0]["__progress"] == "0%"
+
+    for host in ("h1", "h2", "h3", "h4"):
+        run_action._handle_message(_task("runner_on_start", "p1", "t1", host))
+    run_action._handle_message(_task("runner_on_ok", "p1", "t1", "h1"))
+    run_action._handle_message(_task("runner_on_skipped", "p1", "t1", "h2"))
+    run_action._play_stats()
+
+    play = run_action._plays.value[0]
+    assert (play["__ok"], play["__skipped"], play["__in progress"]) == (1, 1, 2)
+    assert play["__changed"] == 1
+    assert play["__task_count"] == 4
+    assert play["__progress"] == "50%"
+
+
+def test_handle_message_uses_index():
+    """Test runner events update the matching task of the matching play."""
+    run_action = action(args=deepcopy(NavigatorConfiguration))
+    messages = [_play("p1"), _play("p2")]
+    for play_uuid in ("p1", "p2"):
+        for host in ("h1", "h2"):
+            messages.append(_task("runner_on_start", play_uuid, "t1", host))
+    messages.append(_task("runner_on_ok", "p2", "t1", "h2"))
+    messages.append(_task("runner_on_failed", "p1", "t1", "h1"))
+
+    for message in messages:
+        run_action._handle_message(message)
+
+    play_1, play_2 = run_action._plays.value
+    assert [task["__result"] for task in play_1["tasks"]] == ["Failed", "In progress"]
+    assert [task["__result"] for task in play_2["tasks"]] == ["In progress", "Ok"]
+    assert [task["__number"] for task in play_2["tasks"]] == [0, 1]
+
+
+def test_handle_message_unknown_parent(caplog):
+    """Test events without a known play or task are discarded.
+
+    :param caplog: The log capture fixture
+    """
+    run_action = action(args=deepcopy(NavigatorConfiguration))
+    run_action._handle_message(_play("p1"))
+    run_action._handle_message(_task("runner_on_start", "p2", "t1", "h1"))
+    run_action._handle_message(_task("runner_on_ok", "p1", "t1", "h1"))
+    assert "Playbook event without parent play" in caplog.text
+    assert "Task event without parent task" in caplog.text
+    assert run_action._plays.value[0]["tasks"] == []
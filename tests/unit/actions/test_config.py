@@ -2,9 +2,16 @@
 
 import curses
 
+from copy import deepcopy
+from pathlib import Path
+
+import pytest
+
+from ansible_navigator.actions import config
 from ansible_navigator.actions.config import color_menu
 from ansible_navigator.actions.config import content_heading
 from ansible_navigator.actions.config import filter_content_keys
+from ansible_navigator.configuration_subsystem import NavigatorConfiguration
 from ansible_navigator.ui_framework.curses_defs import CursesLinePart
 
 
@@ -74,3 +81,72 @@ def test_filter_content_keys() -> None:
     obj = {"__key": "value", "key": "value"}
     ret = {"key": "value"}
     assert filter_content_keys(obj) == ret
+
+
+LIST_OUTPUT = """
+DEFAULT_TIMEOUT:
+  default: 10
+  description: This is the default timeout for connection plugins to use.
+  env:
+  - name: ANSIBLE_TIMEOUT
+  name: Connection timeout
+  type: integer
+"""
+DUMP_OUTPUT = "DEFAULT_TIMEOUT(env: ANSIBLE_TIMEOUT) = 30\n"
+
+
+class FakeAnsibleConfig:
+    """An ansible-config runner returning canned output."""
+
+    fetches: list[str] = []
+    runners: list["FakeAnsibleConfig"] = []
+
+    def __init__(self, **kwargs):
+        """Initialize the runner.
+
+        :param kwargs: The runner arguments
+        """
+        self.runners.append(self)
+
+    def fetch_ansible_config(self, action: str, **kwargs) -> tuple[str, str]:
+        """Return the canned output of an action.
+
+        :param action: The ansible-config action
+        :param kwargs: The arguments for the action
+        :returns: The output and errors
+        """
+        self.fetches.append(action)
+        return {"list": LIST_OUTPUT, "dump": DUMP_OUTPUT}[action], ""
+
+
+def test_config_cached(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Test the merged configuration is cached, until the environment changes.
+
+    :param tmp_path: The temporary path fixture
+    :param monkeypatch: The monkeypatch fixture
+    """
+    monkeypatch.setattr(config, "AnsibleConfig", FakeAnsibleConfig)
+    monkeypatch.setattr(config, "inspect_image_id", lambda **kwargs: "sha256:abc")
+    monkeypatch.setattr(FakeAnsibleConfig, "fetches", [])
+    monkeypatch.setattr(FakeAnsibleConfig, "runners", [])
+    monkeypatch.delenv("ANSIBLE_TIMEOUT", raising=False)
+    args = deepcopy(NavigatorConfiguration)
+    args.internals.cache_path = tmp_path
+    args.entry("mode").value.current = "interactive"
+    args.entry("execution_environment").value.current = True
+
+    configs = []
+    for _open in range(2):
+        config_action = config.Action(args=args)
+        config_action._run_runner()
+        configs.append(config_action._config)
+    assert sorted(FakeAnsibleConfig.fetches) == ["dump", "list"]
+    assert len(FakeAnsibleConfig.runners) == 2
+    assert configs[0] == configs[1]
+    assert configs[0][0]["current_value"] == 30
+    assert configs[0][0]["source"] == "env"
+    assert configs[0][0]["via"] == "ANSIBLE_TIMEOUT"
+
+    monkeypatch.setenv("ANSIBLE_TIMEOUT", "30")
+    config.Action(args=args)._run_runner()
+    assert len(FakeAnsibleConfig.fetches) == 4
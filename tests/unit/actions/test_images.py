@@ -0,0 +1,138 @@
+"""Unit tests for the images action."""
+
+from __future__ import annotations
+
+import json
+
+from copy import deepcopy
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from ansible_navigator import cli
+from ansible_navigator.actions.images import Action as action
+from ansible_navigator.configuration_subsystem import Constants
+from ansible_navigator.configuration_subsystem import NavigatorConfiguration
+
+
+INTROSPECTION = {"errors": [], "python_version": {"details": {"version": "3.11"}}}
+
+
+@pytest.fixture(name="images_action")
+def fixture_images_action(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> action:
+    """Provide an images action which records each introspection run.
+
+    :param tmp_path: The temporary path fixture
+    :param monkeypatch: The monkeypatch fixture
+    :returns: The images action
+    """
+    args = deepcopy(NavigatorConfiguration)
+    args.internals.cache_path = tmp_path
+    images_action = action(args=args)
+    images_action.runs = []  # type: ignore[attr-defined]
+
+    def run_runner(image_name: str) -> tuple[str, str, int]:
+        images_action.runs.append(image_name)  # type: ignore[attr-defined]
+        return json.dumps(INTROSPECTION), "", 0
+
+    monkeypatch.setattr(images_action, "_run_runner", run_runner)
+    return images_action
+
+
+def test_introspect_cached(images_action: action):
+    """Test an image is introspected once for each id, until the cache is cleared.
+
+    :param images_action: The images action
+    """
+    for _introspection in range(2):
+        parsed, error, return_code = images_action._introspect("ee:latest", "sha256:abc")
+        assert (parsed, error, return_code) == (INTROSPECTION, "", 0)
+    assert images_action.runs == ["ee:latest"]  # type: ignore[attr-defined]
+
+    images_action._introspect("ee:latest", None)
+    images_action._introspect("ee:latest", None)
+    assert len(images_action.runs) == 3  # type: ignore[attr-defined]
+
+    assert images_action._clear_cache() == 1
+    images_action._introspect("ee:latest", "sha256:abc")
+    assert len(images_action.runs) == 4  # type: ignore[attr-defined]
+
+
+def test_stdout_clear_cache(images_action: action):
+    """Test the number of introspections removed is returned in mode stdout.
+
+    :param images_action: The images action
+    """
+    images_action._introspect("ee:latest", "sha256:abc")
+    images_action._args.entry("images_clear_cache").value.current = True
+    images_action._args.entry("images_details").value.source = Constants.DEFAULT_CFG
+    result = images_action.run_stdout()
+    assert result.message == "Removed 1 cached image introspections."
+    assert result.return_code == 0
+
+
+def test_start_up_clear_cache(monkeypatch: pytest.MonkeyPatch, images_action: action):
+    """Test the cache is cleared once at start up in mode interactive.
+
+    :param monkeypatch: The monkeypatch fixture
+    :param images_action: The images action
+    """
+    monkeypatch.setattr(cli, "clear_screen", lambda: None)
+    monkeypatch.setattr(cli, "stop_sessions_on_signals", lambda: None)
+    monkeypatch.setattr(cli, "wrapper", lambda *_args: None)
+    images_action._introspect("ee:latest", "sha256:abc")
+    args = images_action._args
+    args.entry("mode").value.current = "interactive"
+    args.entry("images_clear_cache").value.current = True
+    cli.run(args=args, log_listener=None)  # type: ignore[arg-type]
+    assert images_action._clear_cache() == 0
+
+
+def test_interactive_clear_cache_requested(
+    monkeypatch: pytest.MonkeyPatch,
+    images_action: action,
+):
+    """Test the cache is cleared only for requests asking to clear it.
+
+    :param monkeypatch: The monkeypatch fixture
+    :param images_action: The images action
+    """
+    clear_cache = images_action._args.entry("images_clear_cache").value
+
+    def update_args(_self: action, params: list[str]) -> bool:
+        """Update the settings as for a request after the first, started with ``--icc``.
+
+        :param _self: The images action
+        :param params: The parameters of the request
+        :returns: True, the settings were updated
+        """
+        clear_cache.current = True
+        clear_cache.source = Constants.USER_CLI if "--icc" in params else Constants.PREVIOUS_CLI
+        return True
+
+    monkeypatch.setattr(action, "_prepare_to_run", lambda *_args: None)
+    monkeypatch.setattr(action, "_update_args", update_args)
+    monkeypatch.setattr(action, "_collect_image_list", lambda *_args: None)
+
+    def run(params: str | None) -> int:
+        """Request the images, returning the number of introspections run afterwards.
+
+        :param params: The parameters of the request
+        :returns: The number of introspections run
+        """
+        images_action._introspect("ee:latest", "sha256:abc")
+        match = SimpleNamespace(groupdict=lambda: {"params": params})
+        interaction = SimpleNamespace(
+            action=SimpleNamespace(match=match),
+            ui=SimpleNamespace(show_form=lambda *_args: None),
+        )
+        images_action._interaction = interaction  # type: ignore[assignment]
+        images_action.run(interaction=interaction, app=None)  # type: ignore[arg-type]
+        return len(images_action.runs)  # type: ignore[attr-defined]
+
+    assert run(None) == 1
+    assert run(None) == 1
+    assert run("--icc") == 1
+    assert run(None) == 2
+    assert run(None) == 2
@@ -0,0 +1,69 @@
+"""Unit tests for the inventory index."""
+
+from __future__ import annotations
+
+from ansible_navigator.actions._inventory_index import HostRow
+from ansible_navigator.actions._inventory_index import InventoryIndex
+from ansible_navigator.ui_framework.utils import convert_percentage
+
+
+INVENTORY = {
+    "_meta": {
+        "hostvars": {
+            "web02": {"ansible_host": "10.0.0.2", "load": "50%"},
+            "web01": {"ansible_host": "10.0.0.1"},
+        },
+    },
+    "all": {"children": ["web", "db", "ungrouped"]},
+    "db": {"hosts": ["db01"]},
+    "ungrouped": {},
+    "web": {"hosts": ["web02", "web01"], "children": ["db"]},
+}
+
+
+def test_index():
+    """Test the groups are indexed and hosts without variables are included."""
+    index = InventoryIndex(INVENTORY)
+    assert "web" in index
+    assert "_meta" not in index
+    assert index.hosts["web"] == ("web01", "web02")
+    assert index.children["all"] == ("db", "ungrouped", "web")
+    assert index.parents == {"db": ("all", "web"), "ungrouped": ("all",), "web": ("all",)}
+    assert index.host_vars["db01"] == {"inventory_hostname": "db01"}
+    assert index.host_vars["web01"] == {"ansible_host": "10.0.0.1", "inventory_hostname": "web01"}
+
+
+def test_group_rows():
+    """Test the rows of a group menu reference the host variables and are built once."""
+    index = InventoryIndex(INVENTORY)
+    rows = index.group_rows("web", "all▸web", ["ansible_host"])
+    assert rows is index.group_rows("web", "all▸web", ["ansible_host"])
+    assert [row["__name"] for row in rows] == ["web01", "web02", "db"]
+    assert isinstance(rows[0], HostRow)
+    assert rows[0].host_vars is index.host_vars["web01"]
+    assert dict(rows[0]) == {
+        "ansible_host": "10.0.0.1",
+        "inventory_hostname": "web01",
+        "__name": "web01",
+        "__taxonomy": "all▸web",
+        "__type": "host",
+    }
+    assert rows[2] == {
+        "__name": "db",
+        "__taxonomy": "all▸web",
+        "__type": "group",
+        "ansible_host": "",
+    }
+
+
+def test_host_row_set():
+    """Test values set on a host row leave the host variables unchanged."""
+    index = InventoryIndex(INVENTORY)
+    row = index.host_rows()[0]
+    assert row["__name"] == "web02"
+    convert_percentage(row, ["load"], 10)
+    assert row["_load"] == "50%"
+    assert row["load"] != "50%"
+    assert index.host_vars["web02"]["load"] == "50%"
+    assert "_load" not in index.host_rows()[1]
+    assert len(row) == len(list(row)) == 6
@@ -0,0 +1,100 @@
+"""Unit tests for the search action."""
+
+from __future__ import annotations
+
+import json
+
+from copy import deepcopy
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from ansible_navigator.actions.search import Action as action
+from ansible_navigator.actions.search import to_menu_entry
+from ansible_navigator.actions.search import to_stdout_entry
+from ansible_navigator.configuration_subsystem import NavigatorConfiguration
+from ansible_navigator.steps import Step
+from ansible_navigator.utils.key_value_store import KeyValueStore
+from ansible_navigator.utils.search_index import SearchResult
+
+
+OPTION = SearchResult(
+    name="backup",
+    parent="ns.col.copy",
+    description="Create a backup file",
+    kind="option",
+    collection="ns.col",
+    checksum="c1",
+)
+ROLE = SearchResult(
+    name="ns.col.server",
+    parent="",
+    description="Install a web server",
+    kind="role",
+    collection="ns.col",
+    checksum="",
+)
+
+
+def test_stdout_entry():
+    """Test empty values and the checksum are removed for mode stdout."""
+    assert to_stdout_entry(ROLE) == {
+        "name": "ns.col.server",
+        "description": "Install a web server",
+        "kind": "role",
+        "collection": "ns.col",
+    }
+
+
+def test_result_content(tmp_path: Path):
+    """Test the plugin documentation is shown for an option and the description for a role.
+
+    :param tmp_path: The temporary path fixture
+    """
+    cache = KeyValueStore(tmp_path / "cache.db")
+    cache["c1"] = json.dumps({"plugin": {"doc": {"module": "copy"}, "examples": ""}})
+    cache.close()
+
+    search_action = action(args=deepcopy(NavigatorConfiguration))
+    search_action._collection_cache = cache
+    menu = Step(
+        name="search_results",
+        step_type="menu",
+        value=[to_menu_entry(OPTION), to_menu_entry(ROLE)],
+        index=0,
+    )
+    search_action.steps.append(menu)
+
+    option_content = search_action._build_result_content().value[0]
+    assert option_content["doc"] == {"module": "copy"}
+    assert option_content["__of"] == "ns.col.copy"
+
+    menu.index = 1
+    role_content = search_action._build_result_content().value[0]
+    assert role_content["description"] == "Install a web server"
+    assert role_content["__kind"] == "role"
+
+
+def test_missing_doc_cache(monkeypatch: pytest.MonkeyPatch):
+    """Test a warning is shown rather than searching without the collection doc cache.
+
+    :param monkeypatch: The monkeypatch fixture
+    """
+    monkeypatch.setattr(action, "_prepare_to_run", lambda *_args: None)
+    monkeypatch.setattr(action, "_prepare_to_exit", lambda *_args: None)
+    monkeypatch.setattr(action, "_update_args", lambda *_args, **_kwargs: True)
+    monkeypatch.setattr(action, "_search", pytest.fail)
+    args = deepcopy(NavigatorConfiguration)
+    args.internals.collection_doc_cache = None
+    search_action = action(args=args)
+    forms: list = []
+    match = SimpleNamespace(groupdict=lambda: {"params": "copy"})
+    interaction = SimpleNamespace(
+        action=SimpleNamespace(match=match),
+        ui=SimpleNamespace(show_form=forms.append),
+    )
+    search_action._interaction = interaction  # type: ignore[assignment]
+    assert search_action.run(interaction=interaction, app=None) is None  # type: ignore[arg-type]
+    assert len(forms) == 1
+    assert "collection document cache" in str(forms[0].fields[0].information)
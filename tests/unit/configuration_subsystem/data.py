@@ -189,6 +189,13 @@ CLI_DATA_RUN = [
         },
     ),
 ]
+CLI_DATA_SEARCH = [
+    ("search copy", {"app": "search", "search_terms": ["copy"]}),
+    (
+        "search backup file -m stdout --fmt json",
+        {"app": "search", "format": "json", "mode": "stdout", "search_terms": ["backup", "file"]},
+    ),
+]
 
 
 def cli_data():
@@ -204,6 +211,7 @@ def cli_data():
         + CLI_DATA_INVENTORY_COLUMNS
         + CLI_DATA_REPLAY
         + CLI_DATA_RUN
+        + CLI_DATA_SEARCH
     )
     frozen = [(cmd, d2t(expected)) for cmd, expected in aggregated]
     return frozen
@@ -230,6 +238,7 @@ ENV_VAR_DATA = [
     ("exec_shell", "false", False),
     ("execution_environment", "false", False),
     ("execution_environment_image", "test_image:latest", "test_image:latest"),
+    ("execution_environment_session", "true", True),
     (
         "execution_environment_volume_mounts",
         "/tmp:/test1:Z;/tmp:/test2:z",
@@ -241,6 +250,7 @@ ENV_VAR_DATA = [
     ("help_doc", "false", False),
     ("help_inventory", "false", False),
     ("help_playbook", "false", False),
+    ("images_clear_cache", "false", False),
     ("images_details", "ansible_version,python_version", ["ansible_version", "python_version"]),
     ("inventory", "/tmp/test1.yaml,/tmp/test2.yml", ["/tmp/test1.yaml", "/tmp/test2.yml"]),
     ("inventory_column", "t1,t2,t3", ["t1", "t2", "t3"]),
@@ -256,10 +266,12 @@ ENV_VAR_DATA = [
     ("playbook_artifact_enable", "false", False),
     ("playbook_artifact_replay", "/tmp/load.json", "/tmp/load.json"),
     ("playbook_artifact_save_as", "/tmp/save.json", "/tmp/save.json"),
+    ("playbook_artifact_stream", "false", False),
     ("plugin_name", "shell", "shell"),
     ("plugin_type", "become", "become"),
     ("pull_arguments", "--tls-verify=false", ["--tls-verify=false"]),
     ("pull_policy", "never", "never"),
+    ("search_terms", "copy,backup", ["copy", "backup"]),
     ("set_environment_variable", "T1=A,T2=B,T3=C", {"T1": "A", "T2": "B", "T3": "C"}),
     ("settings_effective", "false", False),
     ("settings_sample", "false", False),
@@ -0,0 +1,126 @@
+"""Unit tests for image inspection."""
+
+from __future__ import annotations
+
+import json
+import sys
+
+from pathlib import Path
+
+import pytest
+
+from ansible_navigator.command_runner import Command
+from ansible_navigator.image_manager import inspect_all
+from ansible_navigator.image_manager import inspector
+
+
+ENGINE = """
+import json
+import sys
+
+IMAGES = {images!r}
+STRUCTURED = {structured!r}
+
+with open({log!r}, "a") as fh:
+    fh.write(" ".join(sys.argv[1:]) + "\\n")
+
+if sys.argv[1] == "images":
+    if "--format" in sys.argv:
+        if not STRUCTURED:
+            sys.exit(125)
+        for image_id, (repository, tag) in IMAGES.items():
+            print(json.dumps(
+                {{"repository": repository, "tag": tag, "image_id": image_id[:12],
+                "created": "2 weeks ago", "size": "1.2GB"}}
+            ))
+    else:
+        print("REPOSITORY      TAG         IMAGE ID      CREATED       SIZE")
+        for image_id, (repository, tag) in IMAGES.items():
+            print(f"{{repository}}  {{tag}}  {{image_id[:12]}}  2 weeks ago  1.2GB")
+elif sys.argv[1] == "inspect":
+    ids = sys.argv[2:]
+    # The flaky image can only be inspected on its own, the missing one never
+    found = [
+        {{"Id": f"sha256:{{image_id}}", "Config": {{"WorkingDir": "/runner"}}}}
+        for image_id in IMAGES
+        if image_id[:12] in ids
+        and not image_id.startswith("missing")
+        and not (image_id.startswith("flaky") and len(ids) > 1)
+    ]
+    print(json.dumps(found))
+    if len(found) != len(ids):
+        print("Error: no such object", file=sys.stderr)
+        sys.exit(1)
+"""
+
+IMAGES = {
+    "aaaaaaaaaaaa1111": ("quay.io/org/ee-one", "latest"),
+    "bbbbbbbbbbbb2222": ("quay.io/org/ee-two", "v1"),
+    "flakyyyyyyyy3333": ("localhost/flaky", "latest"),
+    "missingggggg4444": ("localhost/missing", "latest"),
+    "cccccccccccc5555": ("localhost/untagged", "<none>"),
+}
+
+
+def _engine(tmp_path: Path, structured: bool) -> tuple[str, Path]:
+    """Create a container engine which lists and inspects ``IMAGES``.
+
+    :param tmp_path: The temporary path fixture
+    :param structured: Whether the engine supports listing images with a template
+    :returns: The container engine command and the file logging its invocations
+    """
+    log = tmp_path / "engine.log"
+    script = tmp_path / "engine.py"
+    script.write_text(ENGINE.format(images=IMAGES, structured=structured, log=str(log)))
+    return f"{sys.executable} {script}", log
+
+
+@pytest.mark.parametrize("structured", (True, False), ids=("structured", "table"))
+def test_inspect_all(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, structured: bool):
+    """Test images are inspected in batches, with those missing inspected one at a time.
+
+    :param tmp_path: The temporary path fixture
+    :param monkeypatch: The monkeypatch fixture
+    :param structured: Whether the engine supports listing images with a template
+    """
+    monkeypatch.setattr(inspector, "INSPECT_BATCH_SIZE", 2)
+    engine, log = _engine(tmp_path, structured)
+
+    images, error = inspect_all(container_engine=engine)
+
+    assert not error
+    by_name = {image["repository"]: image for image in images}
+    assert list(by_name) == [
+        "quay.io/org/ee-one",
+        "quay.io/org/ee-two",
+        "localhost/flaky",
+        "localhost/missing",
+    ]
+    assert by_name["quay.io/org/ee-two"]["tag"] == "v1"
+    assert by_name["quay.io/org/ee-two"]["created"] == "2 weeks ago"
+    for name in ("quay.io/org/ee-one", "quay.io/org/ee-two", "localhost/flaky"):
+        inspection = by_name[name]["inspect"]
+        assert inspection["details"]["config"] == {"working_dir": "/runner"}
+        assert not inspection["errors"]
+    assert by_name["localhost/missing"]["inspect"]["details"] == {}
+    assert "no such object" in by_name["localhost/missing"]["inspect"]["errors"]
+
+    inspect_calls = [line for line in log.read_text().splitlines() if line.startswith("inspect")]
+    assert inspect_calls[:2] == [
+        "inspect aaaaaaaaaaaa bbbbbbbbbbbb",
+        "inspect flakyyyyyyyy missingggggg",
+    ]
+    assert sorted(inspect_calls[2:]) == ["inspect flakyyyyyyyy", "inspect missingggggg"]
+
+
+def test_parse_batch_partial():
+    """Test the images inspected are kept when the engine reports an error."""
+    command = Command(
+        identity="a b",
+        command="",
+        post_process=inspector.ImagesInspect.parse_batch,
+        stdout=json.dumps([{"Id": "a", "RepoTags": ["a:latest"]}]),
+        return_code=1,
+    )
+    command.post_process(command)
+    assert command.details == [{"id": "a", "repo_tags": ["a:latest"]}]
@@ -0,0 +1,29 @@
+"""Unit tests for the image introspection cache."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from ansible_navigator.image_manager import IntrospectionCache
+from ansible_navigator.image_manager.introspection_cache import SCRIPT_FILE_NAME
+
+
+def test_introspection_cache(tmp_path: Path):
+    """Test introspections are cached by image id and removed when cleared.
+
+    :param tmp_path: The temporary path fixture
+    """
+    (tmp_path / SCRIPT_FILE_NAME).write_text("version 1")
+    cache = IntrospectionCache(cache_path=tmp_path)
+    assert cache.get("sha256:abc") is None
+    cache.set("sha256:abc", {"python_version": {"details": {"version": "3.11"}}})
+    assert IntrospectionCache(cache_path=tmp_path).get("sha256:abc") == {
+        "python_version": {"details": {"version": "3.11"}},
+    }
+    assert cache.get("sha256:def") is None
+
+    (tmp_path / SCRIPT_FILE_NAME).write_text("version 2")
+    assert IntrospectionCache(cache_path=tmp_path).get("sha256:abc") is None
+
+    assert cache.clear() == 1
+    assert cache.get("sha256:abc") is None
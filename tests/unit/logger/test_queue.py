@@ -0,0 +1,135 @@
+"""Tests for writing the log in a background thread."""
+
+from __future__ import annotations
+
+import logging
+import signal
+
+from pathlib import Path
+
+import pytest
+
+from ansible_navigator import cli
+from ansible_navigator.logger import Formatter
+from ansible_navigator.logger import QueueHandler
+from ansible_navigator.logger import QueueListener
+
+
+def _logger(name: str, handler: QueueHandler) -> logging.Logger:
+    """Create a logger which only uses the queue handler.
+
+    :param name: The name of the logger
+    :param handler: The queue handler
+    :returns: The logger
+    """
+    test_logger = logging.getLogger(name)
+    test_logger.propagate = False
+    test_logger.setLevel(logging.DEBUG)
+    test_logger.handlers = [handler]
+    return test_logger
+
+
+def _target(log_file: Path) -> logging.FileHandler:
+    """Create the handler for the log file.
+
+    :param log_file: The path to the log file
+    :returns: The file handler
+    """
+    target = logging.FileHandler(log_file)
+    target.setFormatter(
+        Formatter(fmt="%(asctime)s %(levelname)s %(message)s", time_zone="Japan"),
+    )
+    return target
+
+
+def test_written_on_stop(tmp_path: Path):
+    """Test the records are written in order, with their message when logged.
+
+    :param tmp_path: A temporary file path
+    """
+    log_file = tmp_path / "ansible-navigator.log"
+    handler = QueueHandler()
+    listener = QueueListener(handler=handler, target=_target(log_file))
+    listener.start()
+    test_logger = _logger("test_written_on_stop", handler)
+    value = ["first"]
+    test_logger.debug("value: %s", value)
+    value.append("second")
+    for number in range(1000):
+        test_logger.info("record %s", number)
+    listener.stop()
+    test_logger.info("after stop")
+
+    lines = log_file.read_text().splitlines()
+    assert len(lines) == 1001
+    assert lines[0].endswith("+09:00 DEBUG value: ['first']")
+    assert lines[-1].endswith("INFO record 999")
+
+
+def test_dropped_summary(tmp_path: Path):
+    """Test records below warning are dropped when the queue is full, and summarized.
+
+    :param tmp_path: A temporary file path
+    """
+    log_file = tmp_path / "ansible-navigator.log"
+    handler = QueueHandler(maxsize=2)
+    test_logger = _logger("test_dropped_summary", handler)
+    for number in range(5):
+        test_logger.debug("record %s", number)
+    listener = QueueListener(handler=handler, target=_target(log_file))
+    listener.start()
+    test_logger.warning("not dropped")
+    listener.stop()
+
+    lines = log_file.read_text().splitlines()
+    assert "WARNING 3 log records were dropped" in lines[0]
+    assert [line.split(" ", 1)[1] for line in lines[1:]] == [
+        "DEBUG record 0",
+        "DEBUG record 1",
+        "WARNING not dropped",
+    ]
+
+
+def test_time_zone_resolved_once(monkeypatch: pytest.MonkeyPatch):
+    """Test the time zone is resolved when the formatter is created.
+
+    :param monkeypatch: The monkeypatch fixture
+    """
+    formatter = Formatter(time_zone="America/Los_Angeles")
+
+    def not_called(*_args, **_kwargs):
+        """Fail if the time zone is resolved again.
+
+        :param _args: Arguments
+        :param _kwargs: Keyword arguments
+        :raises AssertionError: Always
+        """
+        raise AssertionError
+
+    monkeypatch.setattr("zoneinfo.ZoneInfo", not_called)
+    record = logging.makeLogRecord({"created": 0})
+    assert formatter.formatTime(record) == "1969-12-31T16:00:00-08:00"
+
+
+def test_dirty_exit_written(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    """Test the waiting records are written before the process is terminated.
+
+    :param monkeypatch: The monkeypatch fixture
+    :param tmp_path: A temporary file path
+    """
+    log_file = tmp_path / "ansible-navigator.log"
+    handler = QueueHandler()
+    listener = QueueListener(handler=handler, target=_target(log_file))
+    listener.start()
+    navigator_logger = logging.getLogger("ansible_navigator")
+    monkeypatch.setattr(navigator_logger, "handlers", [handler])
+    killed: list[int] = []
+    monkeypatch.setattr("os.kill", lambda _pid, sig: killed.append(sig))
+    navigator_logger.warning("before the interrupt")
+
+    cli.dirty_exit(listener)
+
+    assert killed == [signal.SIGTERM]
+    lines = log_file.read_text().splitlines()
+    assert lines[0].endswith("WARNING before the interrupt")
+    assert lines[1].endswith("WARNING Dirty exit, killing the pid")
@@ -0,0 +1,52 @@
+"""Unit tests for the asynchronous runner command."""
+
+from __future__ import annotations
+
+from queue import Queue
+
+from ansible_navigator.runner import CommandAsync
+
+
+EVENT = {
+    "uuid": "a0c5a2f9-d8c7-4c9a-9b1e-3c2b0e0f7d11",
+    "counter": 7,
+    "stdout": "ok: [localhost]",
+    "start_line": 6,
+    "end_line": 7,
+    "runner_ident": "2c1f",
+    "event": "runner_on_ok",
+    "pid": 1234,
+    "created": "2023-01-01T00:00:00.000000",
+    "event_data": {"host": "localhost", "res": {"ansible_facts": {"fact": "value"}}},
+}
+
+
+def test_event_projection():
+    """Test the fields used by the run action are posted, with a copy of the event data."""
+    queue: Queue = Queue()
+    command = CommandAsync(executable_cmd="true", queue=queue, write_job_events=True)
+    assert command._event_handler(EVENT) is True
+    message = queue.get_nowait()
+    assert message == {
+        "event": "runner_on_ok",
+        "event_data": EVENT["event_data"],
+        "stdout": "ok: [localhost]",
+    }
+    message["event_data"]["__result"] = "Ok"
+    assert "__result" not in EVENT["event_data"]
+    assert message["event_data"]["res"] is EVENT["event_data"]["res"]
+
+
+def test_event_all_fields():
+    """Test every field is posted when no projection is configured."""
+    queue: Queue = Queue()
+    command = CommandAsync(
+        executable_cmd="true",
+        queue=queue,
+        write_job_events=False,
+        event_fields=None,
+    )
+    assert command._event_handler(EVENT) is False
+    assert queue.get_nowait() == EVENT
+    command._event_handler({"stdout": "", "event": "verbose"})
+    assert queue.get_nowait() == {"stdout": "", "event": "verbose"}
@@ -0,0 +1,210 @@
+"""Unit tests for running commands in a session container."""
+
+from __future__ import annotations
+
+import json
+import os
+import signal
+import socket
+import sys
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from ansible_navigator.runner import Command
+from ansible_navigator.runner import container_session
+from ansible_navigator.runner.container_session import PID_LABEL
+from ansible_navigator.runner.container_session import stop_sessions
+from ansible_navigator.runner.container_session import stop_sessions_on_signals
+
+
+ENGINE = """#!{python}
+import json
+import os
+import subprocess
+import sys
+
+with open({log!r}, "a") as fh:
+    fh.write(json.dumps(sys.argv[1:]) + "\\n")
+
+containers = {containers!r}
+if sys.argv[1] == "ps":
+    print("\\n".join(containers))
+if sys.argv[1] == "inspect":
+    for name in sys.argv[4:]:
+        print(containers[name])
+if sys.argv[1] == "run":
+    sys.exit({run_return_code})
+if sys.argv[1] == "exec":
+    args = sys.argv[2:]
+    while args[0].startswith("--"):
+        args = args[2:]
+    sys.exit(subprocess.run(args[1:], check=False).returncode)
+"""
+
+
+@pytest.fixture(autouse=True)
+def _stop_sessions() -> Iterator[None]:
+    """Stop the session containers started by a test.
+
+    :yields: Nothing
+    """
+    yield
+    stop_sessions()
+
+
+def _engine(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    run_return_code: int = 0,
+    containers: dict[str, str] | None = None,
+) -> Path:
+    """Create a container engine running each command executed in a container locally.
+
+    :param tmp_path: The temporary path fixture
+    :param monkeypatch: The monkeypatch fixture
+    :param run_return_code: The return code when starting a container
+    :param containers: The host and process id labels of existing session containers
+    :returns: The file logging the engine's invocations
+    """
+    log = tmp_path / "engine.log"
+    engine = tmp_path / "bin" / "podman"
+    engine.parent.mkdir()
+    engine.write_text(
+        ENGINE.format(
+            python=sys.executable,
+            log=str(log),
+            run_return_code=run_return_code,
+            containers=containers or {},
+        ),
+    )
+    engine.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{engine.parent}{os.pathsep}{os.environ['PATH']}")
+    return log
+
+
+def _command(cmdline: list[str]) -> Command:
+    """Create a command to run in an execution environment using the session container.
+
+    :param cmdline: The arguments for the shell
+    :returns: The command
+    """
+    return Command(
+        executable_cmd="sh",
+        cmdline=cmdline,
+        container_engine="podman",
+        container_session=True,
+        execution_environment=True,
+        execution_environment_image="ee:latest",
+        host_cwd=os.getcwd(),
+        navigator_mode="interactive",
+        set_environment_variable={"NAVIGATOR_TEST": "value"},
+    )
+
+
+def test_commands_share_container(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Test commands are run in one container, which is removed when the sessions are stopped.
+
+    :param tmp_path: The temporary path fixture
+    :param monkeypatch: The monkeypatch fixture
+    """
+    engine_log = _engine(tmp_path, monkeypatch)
+    first = _command(["-c", "echo $NAVIGATOR_TEST"])
+    assert first.run() == ("value\n", "", 0)
+    assert first.status == "successful"
+    second = _command(["-c", "echo failed >&2; exit 3"])
+    assert second.run() == ("failed\n", "", 3)
+    assert second.status == "failed"
+    stop_sessions()
+
+    calls = [json.loads(line) for line in engine_log.read_text().splitlines()]
+    assert [call[0] for call in calls] == ["ps", "run", "exec", "exec", "rm"]
+    name = calls[1][calls[1].index("--name") + 1]
+    assert "--detach" in calls[1]
+    assert f"{PID_LABEL}={os.getpid()}" in calls[1]
+    assert calls[1][-3:] == ["ee:latest", "sleep", "infinity"]
+    assert not [option for option in calls[1] if ":/runner/" in option]
+    assert calls[2][-4:] == [name, "sh", "-c", "echo $NAVIGATOR_TEST"]
+    assert "value" not in calls[2]
+    assert calls[4] == ["rm", "--force", name]
+
+
+def test_session_start_failure(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Test a command is run by runner when the session container fails to start.
+
+    :param tmp_path: The temporary path fixture
+    :param monkeypatch: The monkeypatch fixture
+    """
+    engine_log = _engine(tmp_path, monkeypatch, run_return_code=125)
+    runs: list[str] = []
+    monkeypatch.setattr(
+        "ansible_navigator.runner.command.run_command",
+        lambda **kwargs: runs.append(kwargs["executable_cmd"]) or ("", "", 0),
+    )
+    for _command_run in range(2):
+        assert _command(["-c", "true"]).run() == ("", "", 0)
+    assert runs == ["sh", "sh"]
+
+    calls = [json.loads(line) for line in engine_log.read_text().splitlines()]
+    assert [call[0] for call in calls] == ["ps", "run"]
+
+
+def test_stale_sessions_removed(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Test the session containers of an ansible-navigator no longer running are removed.
+
+    :param tmp_path: The temporary path fixture
+    :param monkeypatch: The monkeypatch fixture
+    """
+    host = socket.gethostname()
+    stale_pid = 2**22 + 1
+    containers = {
+        "stale": f"{host} {stale_pid}",
+        "running": f"{host} {os.getpid()}",
+        "other_host": f"{host}.other {stale_pid}",
+    }
+    engine_log = _engine(tmp_path, monkeypatch, containers=containers)
+    assert _command(["-c", "true"]).run() == ("", "", 0)
+
+    calls = [json.loads(line) for line in engine_log.read_text().splitlines()]
+    assert [call[0] for call in calls] == ["ps", "inspect", "rm", "run", "exec"]
+    assert calls[2] == ["rm", "--force", "stale"]
+
+
+def test_stopped_on_signal(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Test the session containers are removed when terminated by a signal.
+
+    :param tmp_path: The temporary path fixture
+    :param monkeypatch: The monkeypatch fixture
+    """
+    engine_log = _engine(tmp_path, monkeypatch)
+    assert _command(["-c", "true"]).run() == ("", "", 0)
+    previous = signal.getsignal(signal.SIGHUP)
+    stop_sessions_on_signals()
+    try:
+        handler = signal.getsignal(signal.SIGHUP)
+        assert callable(handler)
+        killed: list[int] = []
+        monkeypatch.setattr(os, "kill", lambda _pid, sig: killed.append(sig))
+        handler(signal.SIGHUP, None)
+    finally:
+        signal.signal(signal.SIGTERM, container_session._previous_handlers.pop(signal.SIGTERM))
+    assert killed == [signal.SIGHUP]
+    assert signal.getsignal(signal.SIGHUP) == previous
+
+    calls = [json.loads(line) for line in engine_log.read_text().splitlines()]
+    assert [call[0] for call in calls] == ["ps", "run", "exec", "rm"]
+
+
+def test_session_only_for_interactive():
+    """Test the session container is only used with an execution environment in interactive."""
+    assert _command([])._container_session
+    for mode, execution_environment in (("stdout", True), ("interactive", False)):
+        command = Command(
+            executable_cmd="true",
+            container_session=True,
+            execution_environment=execution_environment,
+            navigator_mode=mode,
+        )
+        assert not command._container_session
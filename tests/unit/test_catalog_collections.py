@@ -0,0 +1,340 @@
+"""Unit tests for the collection catalog script."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+
+from argparse import Namespace
+from pathlib import Path
+
+import pytest
+
+from ansible_navigator.data import catalog_collections
+from ansible_navigator.data.catalog_collections import INDEX_KEY_PREFIX
+from ansible_navigator.data.catalog_collections import SUMMARY_KEY_PREFIX
+from ansible_navigator.data.catalog_collections import CollectionCatalog
+from ansible_navigator.utils.key_value_store import KeyValueStore
+
+
+@pytest.fixture(name="collections_dir")
+def fixture_collections_dir(tmp_path: Path) -> Path:
+    """Provide a directory with an installed collection and a collection source.
+
+    The installed collection has a role without an argument spec or a README, which are
+    reported as errors.
+
+    :param tmp_path: The temporary path fixture
+    :returns: The parent directory of the ``ansible_collections`` directory
+    """
+    installed = tmp_path / "ansible_collections" / "company" / "installed"
+    (installed / "roles" / "role" / "meta").mkdir(parents=True)
+    (installed / "roles" / "role" / "meta" / "main.yml").write_text("galaxy_info: {}\n")
+    manifest = {
+        "collection_info": {"namespace": "company", "name": "installed", "version": "1.0.0"},
+        "file_manifest_file": {"name": "FILES.json"},
+    }
+    (installed / "MANIFEST.json").write_text(json.dumps(manifest))
+    (installed / "FILES.json").write_text(json.dumps({"files": []}))
+
+    source = tmp_path / "ansible_collections" / "company" / "source"
+    source.mkdir(parents=True)
+    (source / "galaxy.yml").write_text("namespace: company\nname: source\nversion: 1.0.0\n")
+    return tmp_path
+
+
+def _catalog(
+    monkeypatch: pytest.MonkeyPatch,
+    collections_dir: Path,
+    runtime: str = "local",
+) -> tuple[CollectionCatalog, dict, list, list[str]]:
+    """Catalog the collections using the index in the collections directory.
+
+    :param monkeypatch: The monkeypatch fixture
+    :param collections_dir: The parent directory of the ``ansible_collections`` directory
+    :param runtime: The identity of the ansible installation cataloging
+    :returns: The catalog, the collections, the errors and the collections cataloged
+    """
+    cataloged: list[str] = []
+    catalog_roles = CollectionCatalog._catalog_roles
+
+    def record(catalog: CollectionCatalog, collection: dict) -> None:
+        """Record the collections cataloged rather than loaded from the index.
+
+        :param catalog: The collection catalog
+        :param collection: Details describing the collection
+        """
+        cataloged.append(collection["known_as"])
+        catalog_roles(catalog, collection)
+
+    monkeypatch.setattr(CollectionCatalog, "_catalog_roles", record)
+    index = KeyValueStore(collections_dir / "collection_cache.db")
+    catalog = CollectionCatalog(directories=[collections_dir], index=index, runtime=runtime)
+    collections, errors = catalog.process_directories()
+    index.close()
+    return catalog, collections, errors, cataloged
+
+
+def test_index_unchanged(monkeypatch: pytest.MonkeyPatch, collections_dir: Path):
+    """Test collections with an unchanged fingerprint are loaded from the index.
+
+    The collection with only a ``galaxy.yml`` has no fingerprint and is always cataloged.
+
+    :param monkeypatch: The monkeypatch fixture
+    :param collections_dir: The parent directory of the ``ansible_collections`` directory
+    """
+    first, collections, errors, cataloged = _catalog(monkeypatch, collections_dir)
+    assert first.unchanged == 0
+    assert sorted(cataloged) == ["ansible.builtin", "company.installed", "company.source"]
+    role = collections_dir / "ansible_collections" / "company" / "installed" / "roles" / "role"
+    assert [error["path"] for error in errors] == [
+        str(role / "meta" / "argument_specs.yml"),
+        str(role / "README.md"),
+    ]
+
+    second, indexed, indexed_errors, cataloged = _catalog(monkeypatch, collections_dir)
+    assert second.unchanged == 2
+    assert cataloged == ["company.source"]
+    assert indexed_errors == errors
+    assert json.loads(json.dumps(indexed, default=str)) == json.loads(
+        json.dumps(collections, default=str),
+    )
+
+
+@pytest.mark.parametrize("file_name", ("MANIFEST.json", "FILES.json"))
+def test_index_changed(monkeypatch: pytest.MonkeyPatch, collections_dir: Path, file_name: str):
+    """Test a collection is cataloged again once its fingerprint changes.
+
+    :param monkeypatch: The monkeypatch fixture
+    :param collections_dir: The parent directory of the ``ansible_collections`` directory
+    :param file_name: The file of the installed collection changed
+    """
+    _catalog(monkeypatch, collections_dir)
+    changed = collections_dir / "ansible_collections" / "company" / "installed" / file_name
+    stat = changed.stat()
+    os.utime(changed, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    catalog, _collections, errors, cataloged = _catalog(monkeypatch, collections_dir)
+    assert catalog.unchanged == 1
+    assert sorted(cataloged) == ["company.installed", "company.source"]
+    assert len(errors) == 2
+
+
+def test_index_pruned(monkeypatch: pytest.MonkeyPatch, collections_dir: Path):
+    """Test the index entry of a collection no longer found is removed.
+
+    :param monkeypatch: The monkeypatch fixture
+    :param collections_dir: The parent directory of the ``ansible_collections`` directory
+    """
+    _catalog(monkeypatch, collections_dir)
+    installed = collections_dir / "ansible_collections" / "company" / "installed"
+    key = f"{INDEX_KEY_PREFIX}local:{installed}"
+    index = KeyValueStore(collections_dir / "collection_cache.db")
+    assert key in index
+    shutil.rmtree(installed)
+
+    _catalog(monkeypatch, collections_dir)
+    assert key not in index
+    assert len([entry for entry in index if entry.startswith(INDEX_KEY_PREFIX)]) == 1
+    index.close()
+
+
+def test_index_runtimes(monkeypatch: pytest.MonkeyPatch, collections_dir: Path):
+    """Test the index entries of each runtime are kept apart.
+
+    :param monkeypatch: The monkeypatch fixture
+    :param collections_dir: The parent directory of the ``ansible_collections`` directory
+    """
+    _catalog(monkeypatch, collections_dir, runtime="first")
+    installed = collections_dir / "ansible_collections" / "company" / "installed"
+    (installed / "MANIFEST.json").rename(installed.parent / "MANIFEST.json")
+    _catalog(monkeypatch, collections_dir, runtime="second")
+    (installed.parent / "MANIFEST.json").rename(installed / "MANIFEST.json")
+
+    catalog, _collections, _errors, cataloged = _catalog(
+        monkeypatch,
+        collections_dir,
+        runtime="first",
+    )
+    assert catalog.unchanged == 2
+    assert cataloged == ["company.source"]
+    index = KeyValueStore(collections_dir / "collection_cache.db")
+    assert f"{INDEX_KEY_PREFIX}first:{installed}" in index
+    assert f"{INDEX_KEY_PREFIX}second:{installed}" not in index
+    assert len([key for key in index if key.startswith(f"{INDEX_KEY_PREFIX}second:")]) == 1
+    index.close()
+
+
+MODULE = '''
+DOCUMENTATION = """
+module: {name}
+short_description: The {name} module
+description: Do nothing.
+options:
+  state:
+    description: The state.
+    type: str
+"""
+EXAMPLES = ""
+RETURN = ""
+'''
+
+
+def test_retrieve_docs(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    """Test the docs of each plugin, or the error, are written to the cache by the workers.
+
+    The plugins are split into chunks of one, across two worker processes.
+
+    :param monkeypatch: The monkeypatch fixture
+    :param tmp_path: The temporary path fixture
+    """
+    monkeypatch.setattr(catalog_collections, "PROCESSES", 2)
+    monkeypatch.setattr(catalog_collections, "CHUNK_SIZE_MAX", 1)
+    missing = []
+    for name in ("first", "second", "third"):
+        plugin_path = tmp_path / f"{name}.py"
+        plugin_path.write_text(MODULE.format(name=name))
+        missing.append(("company.installed", f"checksum_{name}", plugin_path, "module"))
+    broken = tmp_path / "broken.py"
+    broken.write_text('DOCUMENTATION = """\nmodule: [\n"""\n')
+    missing.append(("company.installed", "checksum_broken", broken, "module"))
+
+    cache = KeyValueStore(tmp_path / "collection_cache.db")
+    errors: list[dict[str, str]] = []
+    stats = {"cache_added_success": 0, "cache_added_errors": 0}
+    added = catalog_collections.retrieve_docs(cache, errors, missing, stats)
+
+    checksums = {entry[1] for entry in missing}
+    assert added == checksums
+    assert stats == {"cache_added_success": 3, "cache_added_errors": 1}
+    assert [error["path"] for error in errors] == [str(broken)]
+    assert "error" in json.loads(cache["checksum_broken"])
+    for name in ("first", "second", "third"):
+        doc = json.loads(cache[f"checksum_{name}"])["plugin"]["doc"]
+        assert doc["short_description"] == f"The {name} module"
+        summary = json.loads(cache[f"{SUMMARY_KEY_PREFIX}checksum_{name}"])
+        assert summary == {
+            "plugin": {"doc": {"module": name, "short_description": f"The {name} module"}},
+        }
+    assert len(cache) == 7
+    cache.close()
+
+
+def test_summarize():
+    """Test only the keys shown in the menu are summarized, as strings."""
+    doc = {
+        "callback": "tree",
+        "deprecated": {"removed_in": "3.0.0", "why": "Replaced"},
+        "description": ["Write the results to a directory."],
+        "options": {"directory": {"type": "path"}},
+        "short_description": ["Save the results", "to a directory"],
+        "version_added": 2.0,
+    }
+    assert catalog_collections.summarize(doc, "callback") == {
+        "plugin": {
+            "doc": {
+                "callback": "tree",
+                "deprecated": "{'removed_in': '3.0.0', 'why': 'Replaced'}",
+                "short_description": "['Save the results', 'to a directory']",
+                "version_added": "2.0",
+            },
+        },
+    }
+    assert catalog_collections.summarize(None, "module") == {"plugin": {"doc": None}}
+
+
+def test_identify_missing(tmp_path: Path):
+    """Test only the unique plugins not in the cache are missing.
+
+    :param tmp_path: The temporary path fixture
+    """
+    collections = {
+        "first": {
+            "known_as": "company.first",
+            "path": "first",
+            "plugin_checksums": {
+                "warm": {"path": "plugins/modules/warm.py", "type": "module"},
+                "cold": {"path": "plugins/modules/cold.py", "type": "module"},
+            },
+        },
+        "second": {
+            "known_as": "company.second",
+            "path": "second",
+            "plugin_checksums": {
+                "cold": {"path": "plugins/modules/cold.py", "type": "module"},
+                "other": {"path": "plugins/modules/other.py", "type": "module"},
+            },
+        },
+    }
+    cache = KeyValueStore(tmp_path / "collection_cache.db")
+    cache["warm"] = "{}"
+    handled, missing, plugin_count, cached = catalog_collections.identify_missing(
+        collections,
+        cache,
+    )
+    cache.close()
+    assert handled == {"warm", "cold", "other"}
+    assert missing == [
+        ("company.first", "cold", Path("first/plugins/modules/cold.py"), "module"),
+        ("company.second", "other", Path("second/plugins/modules/other.py"), "module"),
+    ]
+    assert plugin_count == 4
+    assert cached == {"warm"}
+
+
+def test_main_partially_cached(monkeypatch: pytest.MonkeyPatch, collections_dir: Path):
+    """Test plugins without docs, cached or retrieved, are removed from the collection.
+
+    :param monkeypatch: The monkeypatch fixture
+    :param collections_dir: The parent directory of the ``ansible_collections`` directory
+    """
+    modules = collections_dir / "ansible_collections" / "company" / "installed" / "plugins"
+    (modules / "modules").mkdir(parents=True)
+    checksums = {}
+    for name in ("warm", "cold", "lost"):
+        plugin_path = modules / "modules" / f"{name}.py"
+        plugin_path.write_text(MODULE.format(name=name))
+        checksums[name] = hashlib.sha256(plugin_path.read_bytes()).hexdigest()
+    cache_path = collections_dir / "collection_cache.db"
+    cache = KeyValueStore(cache_path)
+    cache[checksums["warm"]] = "{}"
+    cache.close()
+
+    retrieved: list[list] = []
+
+    def retrieve_docs(_cache: KeyValueStore, _errors: list, missing: list, _stats: dict):
+        """Retrieve the docs of all but the lost plugin.
+
+        :param _cache: The collection cache
+        :param _errors: Previous errors encountered
+        :param missing: Plugins missing from the collection cache
+        :param _stats: Statistics related to the collection cataloging process
+        :returns: The checksums of the plugins added to the cache
+        """
+        retrieved.append(missing)
+        return {checksums["cold"]}
+
+    monkeypatch.setattr(catalog_collections, "retrieve_docs", retrieve_docs)
+    monkeypatch.setattr(catalog_collections, "update_search_index", lambda *_args: False)
+    monkeypatch.setattr(CollectionCatalog, "add_pseudo_builtin", lambda _self: None)
+    monkeypatch.setattr(
+        catalog_collections,
+        "args",
+        Namespace(collection_cache_path=str(cache_path)),
+        raising=False,
+    )
+    monkeypatch.setattr(catalog_collections, "parent_directories", [collections_dir], raising=False)
+
+    result = catalog_collections.main()
+    assert sorted(entry[1] for entry in retrieved[0]) == sorted(
+        [checksums["cold"], checksums["lost"]],
+    )
+    plugins = result["collections"][str(modules.parent)]["plugin_checksums"]
+    assert plugins == {
+        checksums["warm"]: {"path": "plugins/modules/warm.py", "type": "module"},
+        checksums["cold"]: {"path": "plugins/modules/cold.py", "type": "module"},
+    }
+    assert result["stats"]["plugin_count"] == 3
+    assert result["stats"]["processed"] == 2
@@ -1,6 +1,7 @@
 # cspell:ignore buildvm
 """Unit tests for image introspection."""
 import importlib
+import json
 
 import pytest
 
@@ -9,26 +10,26 @@ from ansible_navigator.cli import cache_scripts
 from ansible_navigator.utils.functions import generate_cache_path
 
 
-RPM_OUTPUT = """Name        : net-snmp
-Epoch       : 1
-Version     : 5.9.1
-Release     : 4.fc34
-Architecture: x86_64
-Install Date: Tue 19 Oct 2021 09:52:47 AM PDT
-Group       : Unspecified
-Size        : 901010
-License     : BSD
-Signature   : RSA/SHA256, Fri 30 Jul 2021 05:06:50 AM PDT, Key ID 1161ae6945719a39
-Source RPM  : net-snmp-5.9.1-4.fc34.src.rpm
-Build Date  : Fri 30 Jul 2021 12:23:51 AM PDT
-Build Host  : buildvm-x86-03.iad2.fedoraproject.org
-Packager    : Fedora Project
-Vendor      : Fedora Project
-URL         : http://net-snmp.sourceforge.net/
-Bug URL     : https://bugz.fedoraproject.org/net-snmp
-Summary     : A collection of SNMP protocol tools and libraries
-Description :
-SNMP (Simple Network Management Protocol) is a protocol used for
+RPM_FIELDS = {
+    "name": "net-snmp",
+    "epoch": "1",
+    "version": "5.9.1",
+    "release": "4.fc34",
+    "architecture": "x86_64",
+    "install date": "Tue 19 Oct 2021 09:52:47 AM PDT",
+    "group": "Unspecified",
+    "size": "901010",
+    "license": "BSD",
+    "signature": "RSA/SHA256, Fri 30 Jul 2021 05:06:50 AM PDT, Key ID 1161ae6945719a39",
+    "source rpm": "net-snmp-5.9.1-4.fc34.src.rpm",
+    "build date": "Fri 30 Jul 2021 12:23:51 AM PDT",
+    "build host": "buildvm-x86-03.iad2.fedoraproject.org",
+    "packager": "Fedora Project",
+    "vendor": "Fedora Project",
+    "url": "http://net-snmp.sourceforge.net/",
+    "bug url": "",
+    "summary": "A collection of SNMP protocol tools and libraries",
+    "description": """SNMP (Simple Network Management Protocol) is a protocol used for
 network management. The NET-SNMP project includes various SNMP tools:
 an extensible agent, an SNMP library, tools for requesting or setting
 information from SNMP agents, tools for generating and handling SNMP
@@ -43,8 +44,9 @@ summary: summary_string
 version: version_string
 
 You will probably also want to install the net-snmp-utils package,
-which contains NET-SNMP utilities.
-"""
+which contains NET-SNMP utilities.""",
+}
+RPM_OUTPUT = "\x1f".join(RPM_FIELDS.values()) + "\x1e"
 
 
 @pytest.fixture(scope="module", name="imported_ii")
@@ -71,6 +73,8 @@ def test_system_packages_parse_one(imported_ii):
     imported_ii.SystemPackages().parse(command)
     assert len(command.details) == 1
     assert command.details[0]["name"] == "net-snmp"
+    assert command.details[0]["source rpm"] == "net-snmp-5.9.1-4.fc34.src.rpm"
+    assert "bug url" not in command.details[0]
     assert command.details[0]["version"] == "5.9.1"
     assert command.details[0]["summary"] == "A collection of SNMP protocol tools and libraries"
     assert command.details[0]["description"].startswith("SNMP")
@@ -97,3 +101,47 @@ def test_system_packages_parse_many(imported_ii):
         assert entry["description"].endswith("utilities.")
         assert "summary: summary_string" in entry["description"]
         assert "version: version_string" in entry["description"]
+
+
+def test_system_packages_command(imported_ii):
+    """Test the rpm query format has a tag for each field.
+
+    :param imported_ii: Image introspection
+    """
+    command = imported_ii.SystemPackages().commands[0].command
+    assert command.startswith("rpm -qa --queryformat '%{NAME}\x1f")
+    assert command.count("\x1f") == len(RPM_FIELDS) - 1
+    assert command.endswith("%{DESCRIPTION}\x1e'")
+
+
+def test_python_packages(imported_ii):
+    """Test the python packages are collected from the distribution metadata.
+
+    :param imported_ii: Image introspection
+    """
+    lines = [
+        {
+            "name": "ansible-core",
+            "version": "2.15.0",
+            "summary": "Radically simple IT automation",
+            "requires": ["PyYAML", "Jinja2", "Jinja2"],
+            "editable": False,
+        },
+        {"name": "PyYAML", "version": "6.0", "summary": "", "requires": [], "editable": False},
+        {"name": "pyyaml", "version": "5.4", "summary": "", "requires": [], "editable": False},
+        {"name": "Jinja2", "version": "3.1.2", "summary": "", "requires": [], "editable": False},
+        {"name": "pip", "version": "23.1", "summary": "", "requires": [], "editable": False},
+        {"name": "local", "version": "0.1", "summary": "", "requires": [], "editable": True},
+    ]
+    command = imported_ii.Command(
+        id="test",
+        parse=lambda x: x,
+        stdout="\n".join(json.dumps(line) for line in lines),
+    )
+    imported_ii.PythonPackages().parse_metadata(command)
+    packages = {package["name"]: package for package in command.details}
+    assert list(packages) == ["ansible-core", "PyYAML", "Jinja2"]
+    assert packages["ansible-core"]["requires"] == ["Jinja2", "PyYAML"]
+    assert packages["PyYAML"]["version"] == "6.0"
+    assert packages["PyYAML"]["required-by"] == ["ansible-core"]
+    assert packages["Jinja2"]["required-by"] == ["ansible-core"]
@@ -0,0 +1,59 @@
+"""Tests for the initialization of the application."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from ansible_navigator._version_doc_cache import __version_collection_doc_cache__ as VERSION_CDC
+from ansible_navigator.initialization import get_and_check_collection_doc_cache
+from ansible_navigator.utils.key_value_store import KeyValueStore
+
+
+def test_doc_cache_version_mismatch(tmp_path: Path):
+    """Test a doc cache with another version is cleared, while another session uses it.
+
+    :param tmp_path: The temporary path fixture
+    """
+    path = tmp_path / "collection_doc_cache.db"
+    other_session = KeyValueStore(path)
+    other_session.update_many({"version": "0.0.0", "plugin": "documentation"})
+
+    _messages, exit_messages, collection_cache = get_and_check_collection_doc_cache(
+        str(path),
+        tmp_path,
+    )
+
+    assert not exit_messages
+    assert collection_cache is not None
+    assert dict(other_session.items()) == {"version": VERSION_CDC}
+    other_session.close()
+    assert dict(KeyValueStore(path).items()) == {"version": VERSION_CDC}
+
+
+def test_doc_cache_mounted_file(tmp_path: Path):
+    """Test a doc cache outside the cache directory does not use write-ahead logging.
+
+    Such a doc cache is mounted alone into the execution environment, where a write-ahead
+    log would not be shared with the host. The collection catalog keeps the journal mode.
+
+    :param tmp_path: The temporary path fixture
+    """
+    path = tmp_path / "elsewhere" / "collection_doc_cache.db"
+    path.parent.mkdir()
+    KeyValueStore(path).close()
+
+    _messages, exit_messages, collection_cache = get_and_check_collection_doc_cache(
+        str(path),
+        tmp_path / "cache",
+    )
+
+    assert not exit_messages
+    assert collection_cache is not None
+    catalog = KeyValueStore(path, journal_mode=None)
+    assert catalog.conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+    catalog["plugin"] = "documentation"
+    catalog.close()
+    assert sorted(file.name for file in path.parent.iterdir()) == [path.name]
+    collection_cache.open_()
+    assert collection_cache["plugin"] == "documentation"
+    collection_cache.close()
@@ -9,7 +9,10 @@ from ansible_navigator.constants import GRAMMAR_DIR
 from ansible_navigator.constants import THEME_PATH
 from ansible_navigator.content_defs import ContentFormat
 from ansible_navigator.content_defs import ContentView
+from ansible_navigator.ui_framework import colorize
+from ansible_navigator.ui_framework.colorize import AnsiLines
 from ansible_navigator.ui_framework.colorize import Colorize
+from ansible_navigator.ui_framework.colorize import RenderedLines
 from ansible_navigator.ui_framework.curses_defs import SimpleLinePart
 from ansible_navigator.utils.serialize import SerializationFormat
 from ansible_navigator.utils.serialize import serialize
@@ -182,3 +185,138 @@ def test_styled_markdown():
     assert result == [
         [SimpleLinePart(chars="This is a header\n", column=0, color=(86, 156, 214), style="bold")],
     ]
+
+
+def _rendered_lines(doc: str, scope: str, line_independent: bool = False) -> RenderedLines:
+    """Create lazily rendered lines, with a tokenizer state saved every 3 lines.
+
+    :param doc: The string to render
+    :param scope: The scope, aka the format of the string
+    :param line_independent: Indicates each line can be tokenized on its own
+    :returns: The lazily rendered lines
+    """
+    colorizer = Colorize(grammar_dir=GRAMMAR_DIR, theme_path=THEME_PATH)
+    return RenderedLines(
+        lines=doc.splitlines(),
+        scope=scope,
+        compiler=colorizer._grammars.compiler_for_scope(scope),
+        schema=colorizer._schema,
+        checkpoint_interval=3,
+        line_independent=line_independent,
+    )
+
+
+def test_lazy_matches_render():
+    """Ensure lines rendered lazily, in any order, match those rendered in full."""
+    scope = ContentFormat.YAML_TXT.value.scope
+    rendered = _rendered_lines(doc=YAML_TXT, scope=scope)
+    assert len(rendered) == len(YAML_TXT_EXPECTED)
+    assert rendered[-1] == YAML_TXT_EXPECTED[-1]
+    assert rendered[2:5] == YAML_TXT_EXPECTED[2:5]
+    assert list(rendered) == YAML_TXT_EXPECTED
+    colorizer = Colorize(grammar_dir=GRAMMAR_DIR, theme_path=THEME_PATH)
+    assert list(colorizer.render_lazy(doc=YAML_TXT, scope=scope)) == YAML_TXT_EXPECTED
+
+
+def test_lazy_checkpoints(monkeypatch):
+    """Ensure each line is tokenized once when jumping to the end and back.
+
+    :param monkeypatch: The monkeypatch fixture
+    """
+    tokenized: list[str] = []
+    original = colorize.tokenize
+
+    def tokenize(compiler, state, line, first_line):
+        """Record the line tokenized.
+
+        :param compiler: The grammar compiler
+        :param state: The tokenizer state
+        :param line: The line to tokenize
+        :param first_line: Indicates the first line of the document
+        :returns: The tokenizer state and regions
+        """
+        tokenized.append(line)
+        return original(compiler, state, line, first_line)
+
+    monkeypatch.setattr(colorize, "PREFETCH_LINES", 0)
+    monkeypatch.setattr(colorize, "tokenize", tokenize)
+    doc = "\n".join(f"key{number}: value" for number in range(30))
+    rendered = _rendered_lines(doc=doc, scope="source.yaml")
+    assert "".join(part.chars for part in rendered[29]) == "key29: value\n"
+    assert len(tokenized) == 30
+    assert rendered[28:30]
+    assert len(tokenized) == 30
+    assert rendered[10]
+    assert len(tokenized) == 33
+
+
+def test_lazy_line_independent(monkeypatch):
+    """Ensure only the lines requested are tokenized when lines are independent.
+
+    :param monkeypatch: The monkeypatch fixture
+    """
+    tokenized: list[str] = []
+    original = colorize.tokenize
+
+    def tokenize(compiler, state, line, first_line):
+        """Record the line tokenized.
+
+        :param compiler: The grammar compiler
+        :param state: The tokenizer state
+        :param line: The line to tokenize
+        :param first_line: Indicates the first line of the document
+        :returns: The tokenizer state and regions
+        """
+        tokenized.append(line)
+        return original(compiler, state, line, first_line)
+
+    monkeypatch.setattr(colorize, "PREFETCH_LINES", 0)
+    monkeypatch.setattr(colorize, "tokenize", tokenize)
+    lines = [f"key_{number}: value {number}" for number in range(10)]
+    rendered = _rendered_lines(doc="\n".join(lines), scope="source.yaml", line_independent=True)
+    assert rendered[9:10] == _rendered_lines(doc=lines[9], scope="source.yaml")[0:1]
+    assert [line.rstrip("\n") for line in tokenized] == [lines[9], lines[9]]
+
+
+@patch("ansible_navigator.ui_framework.colorize.tokenize")
+def test_lazy_graceful_failure(mocked_func, caplog):
+    """Ensure a tokenization error renders the lines without color.
+
+    :param mocked_func: Mocked fixture
+    :param caplog: Capture log
+    """
+    mocked_func.side_effect = ValueError()
+    rendered = _rendered_lines(doc=YAML_TXT, scope="source.yaml")
+    assert rendered[4] == [
+        SimpleLinePart(chars="# this is a comment", column=0, color=None, style=None),
+    ]
+    assert "rendered without color" in caplog.text
+
+
+def test_ansi_lines(monkeypatch):
+    """Ensure each ansi line is converted once, as it is shown.
+
+    :param monkeypatch: The monkeypatch fixture
+    """
+    converted: list[str] = []
+    original = colorize.ansi_to_curses
+
+    def ansi_to_curses(line):
+        """Record the line converted.
+
+        :param line: The line to convert
+        :returns: The converted line
+        """
+        converted.append(line)
+        return original(line)
+
+    monkeypatch.setattr(colorize, "ansi_to_curses", ansi_to_curses)
+    stdout = ["\x1b[0;32mok: [localhost]\x1b[0m", "PLAY RECAP"]
+    lines = AnsiLines(stdout)
+    assert lines[0:2] == (original(stdout[0]), original(stdout[1]))
+    stdout.append("localhost : ok=1")
+    assert len(lines) == 3
+    assert lines[1:3][1] == original(stdout[2])
+    assert lines[-1] == original(stdout[2])
+    assert converted == stdout
+    assert str(lines) == "\n".join(stdout)
@@ -0,0 +1,102 @@
+"""Tests for filtering the entries of a menu."""
+
+from __future__ import annotations
+
+import re
+
+import pytest
+
+from ansible_navigator.ui_framework.menu_filter import MenuFilter
+from ansible_navigator.ui_framework.menu_filter import literal
+
+
+ENTRIES = [
+    {"__name": "web01", "__type": "host", "load": 10},
+    {"__name": "web02", "__type": "host", "load": None},
+    {"__name": "db01", "__type": "host", "load": 5},
+    {"__name": "web", "__type": "group"},
+]
+COLUMNS = ["__name", "load"]
+
+
+def _previous(regex: re.Pattern) -> tuple[int, ...]:
+    """Filter the entries as the user interface did before the menu filter.
+
+    :param regex: The compiled regex
+    :returns: The indices of the matching entries
+    """
+    return tuple(
+        idx
+        for idx, entry in enumerate(ENTRIES)
+        if any(regex.search(str(entry.get(key))) for key in COLUMNS)
+    )
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    ("web", "web0", "web01", "^web$", "0$", "None", "1", "host", "w.b|db", "(?i)WEB"),
+)
+def test_indices(pattern: str):
+    """Test the indices match those from searching each column of each entry.
+
+    :param pattern: The menu filter pattern
+    """
+    menu_filter = MenuFilter(entries=ENTRIES, columns=COLUMNS)
+    regex = re.compile(pattern)
+    assert menu_filter.indices(regex) == _previous(regex)
+
+
+def test_literal():
+    """Test only a regex without special characters or flags is used as text."""
+    assert literal(re.compile("web 01-a")) == "web 01-a"
+    assert literal(re.compile("web.")) is None
+    assert literal(re.compile("web", re.IGNORECASE)) is None
+
+
+def test_narrowed(monkeypatch: pytest.MonkeyPatch):
+    """Test an extended filter only searches the entries matching the previous filter.
+
+    :param monkeypatch: The monkeypatch fixture
+    """
+    menu_filter = MenuFilter(entries=ENTRIES, columns=COLUMNS)
+    assert menu_filter.indices(re.compile("web")) == (0, 1, 3)
+    searched: list[int] = []
+    narrowest = menu_filter._narrowest
+
+    def record(text: str) -> tuple[int, ...] | None:
+        """Record the indices searched.
+
+        :param text: The text of the filter
+        :returns: The narrowest indices
+        """
+        result = narrowest(text)
+        searched.extend(result or ())
+        return result
+
+    monkeypatch.setattr(menu_filter, "_narrowest", record)
+    assert menu_filter.indices(re.compile("web0")) == (0, 1)
+    assert searched == [0, 1, 3]
+    assert menu_filter.indices(re.compile("web02")) == (1,)
+    assert searched == [0, 1, 3, 0, 1]
+
+
+def test_filters_kept():
+    """Test the indices are kept for the most recently used filters."""
+    menu_filter = MenuFilter(entries=ENTRIES, columns=COLUMNS, filters_kept=2)
+    web = menu_filter.indices(re.compile("web"))
+    db = menu_filter.indices(re.compile("db"))
+    assert menu_filter.indices(re.compile("web")) is web
+    menu_filter.indices(re.compile("host"))
+    assert menu_filter.indices(re.compile("web")) is web
+    assert menu_filter.indices(re.compile("db")) is not db
+
+
+def test_applies_to():
+    """Test the menu filter is only used for the same, unchanged entries and columns."""
+    entries = list(ENTRIES)
+    menu_filter = MenuFilter(entries=entries, columns=COLUMNS)
+    assert menu_filter.applies_to(entries, list(COLUMNS))
+    assert not menu_filter.applies_to(list(entries), COLUMNS)
+    assert not menu_filter.applies_to(entries, ["__name"])
+    entries.append({"__name": "web03"})
+    assert not menu_filter.applies_to(entries, COLUMNS)
@@ -15,7 +15,7 @@ def empty_kvs(tmp_path: Path) -> Generator[KeyValueStore, None, None]:
     :param tmp_path: Path to a temporary directory
     :yields: The temporary KVS
     """
-    database_path = tmp_path / "basic_kvs_usage.db"
+    database_path = tmp_path / "empty_kvs_usage.db"
     yield KeyValueStore(database_path)
 
 
@@ -0,0 +1,91 @@
+"""Tests for reading the lines of a file being appended to."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from ansible_navigator.utils.file_lines import FileLines
+
+
+def test_append(tmp_path: Path):
+    """Test lines appended to the file are indexed when refreshed.
+
+    :param tmp_path: The temporary path fixture
+    """
+    log = tmp_path / "ansible-navigator.log"
+    log.write_text("first\nsecond\nthi")
+    lines = FileLines(str(log))
+    assert lines.refresh()
+    assert len(lines) == 3
+    assert lines[2] == "thi"
+    with log.open(mode="a", encoding="utf-8") as fh:
+        fh.write("rd\nfourth\n")
+    assert lines.refresh()
+    assert len(lines) == 4
+    assert lines[1:4] == ["second", "third", "fourth"]
+    assert lines[-1] == "fourth"
+    assert list(lines) == ["first", "second", "third", "fourth"]
+    assert str(lines) == "first\nsecond\nthird\nfourth"
+    lines.close()
+
+
+def test_empty_lines(tmp_path: Path):
+    """Test empty lines are kept and a file without lines is empty.
+
+    :param tmp_path: The temporary path fixture
+    """
+    log = tmp_path / "ansible-navigator.log"
+    log.write_text("")
+    lines = FileLines(str(log))
+    assert lines.refresh()
+    assert len(lines) == 0
+    assert lines[0:10] == []
+    log.write_text("\n\nlast\n")
+    assert lines.refresh()
+    assert lines[:] == ["", "", "last"]
+    lines.close()
+
+
+def test_truncated(tmp_path: Path):
+    """Test a truncated file is reported, to be read again from the start.
+
+    :param tmp_path: The temporary path fixture
+    """
+    log = tmp_path / "ansible-navigator.log"
+    log.write_text("first\nsecond\n")
+    lines = FileLines(str(log))
+    assert lines.refresh()
+    log.write_text("new\n")
+    assert not lines.refresh()
+    lines.close()
+
+
+def test_rotated(tmp_path: Path):
+    """Test a file replaced by another is reported, to be read again from the start.
+
+    :param tmp_path: The temporary path fixture
+    """
+    log = tmp_path / "ansible-navigator.log"
+    log.write_text("first\n")
+    lines = FileLines(str(log))
+    assert lines.refresh()
+    log.rename(tmp_path / "ansible-navigator.log.1")
+    assert not lines.refresh()
+    log.write_text("first after rotation\nsecond after rotation\n")
+    assert not lines.refresh()
+    lines.close()
+
+    lines = FileLines(str(log))
+    assert lines.refresh()
+    assert lines[:] == ["first after rotation", "second after rotation"]
+    lines.close()
+
+
+def test_missing(tmp_path: Path):
+    """Test a file which does not exist has no lines.
+
+    :param tmp_path: The temporary path fixture
+    """
+    lines = FileLines(str(tmp_path / "ansible-navigator.log"))
+    assert lines.refresh()
+    assert len(lines) == 0
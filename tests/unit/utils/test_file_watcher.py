@@ -0,0 +1,168 @@
+"""Tests for the file watchers."""
+
+from __future__ import annotations
+
+import os
+import sys
+
+from collections.abc import Callable
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from ansible_navigator.utils.file_watcher import FileWatcher
+from ansible_navigator.utils.file_watcher import InotifyWatcher
+from ansible_navigator.utils.file_watcher import PollingWatcher
+from ansible_navigator.utils.file_watcher import watch_paths
+
+
+WATCHERS = [pytest.param(lambda paths: PollingWatcher(paths, interval=0), id="polling")]
+if sys.platform.startswith("linux"):
+    WATCHERS.append(pytest.param(InotifyWatcher, id="inotify"))
+
+
+@pytest.fixture(name="inventories")
+def fixture_inventories(tmp_path: Path) -> tuple[Path, Path]:
+    """Create an inventory directory and an inventory file.
+
+    :param tmp_path: The temporary path fixture
+    :returns: The inventory directory and file
+    """
+    directory = tmp_path / "inventory"
+    (directory / "group_vars").mkdir(parents=True)
+    (directory / "hosts.yml").write_text("all: {}\n")
+    inventory_file = tmp_path / "hosts.ini"
+    inventory_file.write_text("host1\n")
+    (tmp_path / "other.ini").write_text("host2\n")
+    return directory, inventory_file
+
+
+@pytest.fixture(name="watcher", params=WATCHERS)
+def fixture_watcher(
+    request: pytest.FixtureRequest,
+    inventories: tuple[Path, Path],
+) -> Iterator[FileWatcher]:
+    """Watch the inventories with each watcher.
+
+    :param request: The pytest request object
+    :param inventories: The inventory directory and file
+    :yields: The file watcher
+    """
+    watcher = request.param([str(path) for path in inventories])
+    yield watcher
+    watcher.close()
+
+
+def _touch(path: Path) -> None:
+    """Modify a file and move its modification time forward.
+
+    :param path: The file to modify
+    """
+    path.write_text(path.read_text() + "\n" if path.exists() else "")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+def test_unchanged(watcher: FileWatcher):
+    """Test no change is detected when the files are unchanged.
+
+    :param watcher: The file watcher
+    """
+    assert not watcher.changed()
+
+
+def test_file_modified(watcher: FileWatcher, inventories: tuple[Path, Path]):
+    """Test a modified inventory file is detected once.
+
+    :param watcher: The file watcher
+    :param inventories: The inventory directory and file
+    """
+    _touch(inventories[1])
+    assert watcher.changed()
+    assert not watcher.changed()
+
+
+def test_other_file_ignored(watcher: FileWatcher, inventories: tuple[Path, Path]):
+    """Test a file beside the inventory file is not watched.
+
+    :param watcher: The file watcher
+    :param inventories: The inventory directory and file
+    """
+    _touch(inventories[1].parent / "other.ini")
+    assert not watcher.changed()
+
+
+def test_file_in_new_directory(watcher: FileWatcher, inventories: tuple[Path, Path]):
+    """Test a file created in a new subdirectory of the inventory directory is detected.
+
+    :param watcher: The file watcher
+    :param inventories: The inventory directory and file
+    """
+    host_vars = inventories[0] / "host_vars"
+    host_vars.mkdir()
+    # An empty directory is not an inventory change when polling
+    watcher.changed()
+    _touch(host_vars / "host1.yml")
+    assert watcher.changed()
+
+
+def test_hidden_file_ignored(watcher: FileWatcher, inventories: tuple[Path, Path]):
+    """Test a hidden file in the inventory directory is not considered a change.
+
+    :param watcher: The file watcher
+    :param inventories: The inventory directory and file
+    """
+    _touch(inventories[0] / "group_vars" / ".all.yml.swp")
+    assert not watcher.changed()
+
+
+@pytest.mark.parametrize("make_watcher", WATCHERS)
+def test_hidden_file_watched(make_watcher: Callable[[list[str]], FileWatcher], tmp_path: Path):
+    """Test a hidden inventory file, watched directly, is detected.
+
+    :param make_watcher: The file watcher constructor
+    :param tmp_path: The temporary path fixture
+    """
+    inventory_file = tmp_path / ".hosts.ini"
+    inventory_file.write_text("host1\n")
+    watcher = make_watcher([str(inventory_file)])
+    _touch(inventory_file)
+    assert watcher.changed()
+    watcher.close()
+
+
+def test_abstract():
+    """Test a file watcher must detect changes."""
+    with pytest.raises(TypeError):
+        FileWatcher()  # type: ignore[abstract]
+
+
+def test_polling_interval(inventories: tuple[Path, Path]):
+    """Test the files are not scanned again within the polling interval.
+
+    :param inventories: The inventory directory and file
+    """
+    watcher = PollingWatcher([str(path) for path in inventories], interval=3600)
+    _touch(inventories[1])
+    assert not watcher.changed()
+
+
+def test_watch_paths_fallback(monkeypatch: pytest.MonkeyPatch, inventories: tuple[Path, Path]):
+    """Test polling is used when inotify is not available.
+
+    :param monkeypatch: The monkeypatch fixture
+    :param inventories: The inventory directory and file
+    """
+
+    def unavailable(_paths: list[str]) -> InotifyWatcher:
+        """Raise the error for inotify being unavailable.
+
+        :param _paths: The files and directories to watch
+        :raises OSError: Always
+        """
+        raise OSError("inotify unavailable")
+
+    monkeypatch.setattr("ansible_navigator.utils.file_watcher.InotifyWatcher", unavailable)
+    watcher = watch_paths([str(path) for path in inventories])
+    assert isinstance(watcher, PollingWatcher)
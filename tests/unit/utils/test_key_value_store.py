@@ -2,6 +2,8 @@
 
 import types
 
+import pytest
+
 from ansible_navigator.utils.key_value_store import KeyValueStore
 
 
@@ -135,3 +137,102 @@ def test_kvs_repr(kvs: KeyValueStore, empty_kvs: KeyValueStore):
     )
 
     assert repr(empty_kvs) == "KeyValueStore()"
+
+
+def test_kvs_wal(kvs: KeyValueStore):
+    """Test KVS uses write-ahead logging and a second connection sees committed writes.
+
+    :param kvs: A key-value store populated with data
+    """
+    assert kvs.conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    reader = KeyValueStore(kvs.path)
+    kvs["kiwi"] = "brown"
+    assert reader["kiwi"] == "brown"
+
+
+def test_kvs_bulk(kvs: KeyValueStore):
+    """Test KVS update_many(), get_many() and contains_many().
+
+    :param kvs: A key-value store populated with data
+    """
+    kvs.update_many({"kiwi": "brown", "apple": "green"})
+    kvs.update_many(iter([("lime", "green")]))
+    keys = [f"missing_{number}" for number in range(1_000)] + ["apple", "kiwi", "lime", "kiwi"]
+    assert kvs.get_many(keys) == {"apple": "green", "kiwi": "brown", "lime": "green"}
+    assert kvs.contains_many(keys) == {"apple", "kiwi", "lime"}
+    assert kvs.contains_many([]) == set()
+
+
+def test_kvs_contains(kvs: KeyValueStore):
+    """Test KVS membership checks do not read the values.
+
+    :param kvs: A key-value store populated with data
+    """
+    statements: list[str] = []
+    kvs.conn.set_trace_callback(statements.append)
+    assert "apple" in kvs
+    assert "kiwi" not in kvs
+    assert kvs.contains_many(["apple", "kiwi"]) == {"apple"}
+    kvs.conn.set_trace_callback(None)
+    assert len(statements) == 3
+    assert not [statement for statement in statements if "value" in statement]
+
+
+def test_kvs_transaction(kvs: KeyValueStore):
+    """Test KVS transaction() commits or rolls back the writes made within it.
+
+    :param kvs: A key-value store populated with data
+    """
+    reader = KeyValueStore(kvs.path)
+    with kvs.transaction():
+        kvs["kiwi"] = "brown"
+        with kvs.transaction():
+            kvs.update_many({"lime": "green"})
+        assert "kiwi" not in reader
+    assert reader.get_many(["kiwi", "lime"]) == {"kiwi": "brown", "lime": "green"}
+
+    with pytest.raises(RuntimeError), kvs.transaction():
+        kvs["apple"] = "green"
+        del kvs["banana"]
+        raise RuntimeError
+    assert kvs["apple"] == "red"
+    assert "banana" in kvs
+
+
+def test_kvs_delitem(kvs: KeyValueStore):
+    """Test KVS __delitem__ removes a key and raises for a missing key.
+
+    :param kvs: A key-value store populated with data
+    """
+    del kvs["apple"]
+    assert "apple" not in kvs
+    with pytest.raises(KeyError):
+        del kvs["apple"]
+
+
+def test_kvs_clear(kvs: KeyValueStore):
+    """Test KVS clear() removes every key, also for a second connection.
+
+    :param kvs: A key-value store populated with data
+    """
+    reader = KeyValueStore(kvs.path)
+    assert len(reader) == 4
+    kvs.clear()
+    assert len(kvs) == 0
+    assert len(reader) == 0
+    kvs["kiwi"] = "brown"
+    assert reader["kiwi"] == "brown"
+
+
+def test_kvs_prune(kvs: KeyValueStore):
+    """Test KVS prune() keeps the most recently written keys, regardless of reads.
+
+    :param kvs: A key-value store populated with data
+    """
+    assert kvs["apple"] == "red"
+    kvs.prune(keep=2)
+    assert sorted(kvs) == ["banana", "strawberry"]
+    kvs["strawberry"] = "pink"
+    kvs["kiwi"] = "brown"
+    kvs.prune(keep=2)
+    assert sorted(kvs) == ["kiwi", "strawberry"]
@@ -0,0 +1,163 @@
+"""Tests for the full-text search index of the collection doc cache."""
+
+from __future__ import annotations
+
+import json
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from ansible_navigator.utils.key_value_store import KeyValueStore
+from ansible_navigator.utils.search_index import SEARCH_INDEX_KEY
+from ansible_navigator.utils.search_index import build_query
+from ansible_navigator.utils.search_index import search
+from ansible_navigator.utils.search_index import search_index_exists
+from ansible_navigator.utils.search_index import update_search_index
+
+
+def _doc(name: str, description: str, options: dict[str, Any]) -> str:
+    """Create the cached documentation for a module.
+
+    :param name: The module name
+    :param description: The short description
+    :param options: The module options
+    :returns: The cached documentation
+    """
+    doc = {"module": name, "short_description": description, "options": options}
+    return json.dumps({"plugin": {"doc": doc, "examples": "", "returndocs": {}}})
+
+
+def _collection(name: str, checksums: list[str], hidden_by: list[str]) -> dict[str, Any]:
+    """Create a cataloged collection.
+
+    :param name: The collection name
+    :param checksums: The checksums of the collection's modules
+    :param hidden_by: The paths of the collections hiding this one
+    :returns: The cataloged collection
+    """
+    return {
+        "known_as": name,
+        "path": f"/collections/{name.replace('.', '/')}",
+        "hidden_by": hidden_by,
+        "plugin_checksums": {
+            checksum: {"path": f"plugins/modules/{checksum}.py", "type": "module"}
+            for checksum in checksums
+        },
+        "roles": [],
+    }
+
+
+@pytest.fixture(name="cache")
+def fixture_cache(tmp_path: Path) -> KeyValueStore:
+    """Provide a collection doc cache with plugin documentation.
+
+    :param tmp_path: The temporary path fixture
+    :returns: The collection doc cache
+    """
+    cache = KeyValueStore(tmp_path / "cache.db")
+    cache.update_many(
+        {
+            "c1": _doc(
+                "copy",
+                "Copy files to remote locations",
+                {
+                    "backup": {"description": ["Create a backup file", "before copying."]},
+                    "dest": {"description": "Remote absolute path."},
+                },
+            ),
+            "c2": _doc(
+                "uri",
+                "Interacts with webservices",
+                {"headers": {"description": "Add HTTP headers.", "suboptions": {"accept": {}}}},
+            ),
+            "c3": "not json",
+        },
+    )
+    return cache
+
+
+@pytest.fixture(name="collections")
+def fixture_collections() -> dict[str, Any]:
+    """Provide the cataloged collections.
+
+    :returns: The cataloged collections, one hidden by another
+    """
+    web = _collection("ns.web", ["c2", "c3"], [])
+    web["roles"] = [
+        {
+            "full_name": "ns.web.server",
+            "info": {"galaxy_info": {"description": "Install a web server"}},
+            "argument_specs": {
+                "main": {"options": {"server_port": {"description": "The listening port"}}},
+            },
+        },
+    ]
+    return {
+        "/a/ns/files": _collection("ns.files", ["c1"], []),
+        "/b/ns/files": _collection("ns.files", ["c1"], ["/a/ns/files"]),
+        "/a/ns/web": web,
+    }
+
+
+def test_update_search_index(cache: KeyValueStore, collections: dict[str, Any]):
+    """Test the index is built, kept while unchanged and rebuilt when changed.
+
+    :param cache: The collection doc cache
+    :param collections: The cataloged collections
+    """
+    assert not search_index_exists(cache)
+    assert update_search_index(cache, collections)
+    assert search_index_exists(cache)
+    assert SEARCH_INDEX_KEY in cache
+    assert not update_search_index(cache, collections)
+
+    del collections["/a/ns/web"]
+    assert update_search_index(cache, collections)
+    assert search(cache, "web") == []
+
+
+def test_search(cache: KeyValueStore, collections: dict[str, Any]):
+    """Test plugins, options and roles are found, best matches first.
+
+    :param cache: The collection doc cache
+    :param collections: The cataloged collections
+    """
+    update_search_index(cache, collections)
+
+    results = search(cache, "copy")
+    assert [(result.name, result.kind) for result in results] == [
+        ("ns.files.copy", "module"),
+        ("backup", "option"),
+        ("dest", "option"),
+    ]
+    assert results[1].parent == "ns.files.copy"
+    assert results[1].description == "Create a backup file before copying."
+    assert results[1].checksum == "c1"
+
+    assert {result.name for result in search(cache, "head")} == {"headers", "headers.accept"}
+    web = search(cache, "web")
+    assert {result.name for result in web[:2]} == {"ns.web.uri", "ns.web.server"}
+    assert {result.kind for result in web[2:]} == {"option"}
+    assert [result.name for result in search(cache, "listening port")] == ["server_port"]
+    assert [result.kind for result in search(cache, "server")] == ["role", "option"]
+    assert len(search(cache, "copy", limit=1)) == 1
+    assert search(cache, "   ") == []
+
+
+@pytest.mark.parametrize(
+    ("terms", "expected"),
+    (
+        pytest.param("copy", '"copy"*', id="single"),
+        pytest.param("backup  file", '"backup" "file"*', id="many"),
+        pytest.param('a"b OR', '"a""b" "OR"*', id="syntax"),
+    ),
+)
+def test_build_query(terms: str, expected: str):
+    """Test the search terms are quoted and the last matches as a prefix.
+
+    :param terms: The search terms
+    :param expected: The expected query
+    """
+    assert build_query(terms) == expected
@@ -0,0 +1,46 @@
+"""Tests for writing and reading compressed files."""
+
+from __future__ import annotations
+
+import json
+
+from pathlib import Path
+
+import pytest
+
+from ansible_navigator.content_defs import ContentView
+from ansible_navigator.content_defs import SerializationFormat
+from ansible_navigator.utils.serialize import is_compressed
+from ansible_navigator.utils.serialize import open_file
+from ansible_navigator.utils.serialize import serialize_write_file
+
+
+@pytest.mark.parametrize(
+    ("name", "magic"),
+    (
+        pytest.param("file.json", b"{", id="none"),
+        pytest.param("file.json.bz2", b"BZh", id="bz2"),
+        pytest.param("file.json.gz", b"\x1f\x8b", id="gzip"),
+        pytest.param("file.json.xz", b"\xfd7zXZ", id="xz"),
+    ),
+)
+def test_compression_by_extension(tmp_path: Path, name: str, magic: bytes):
+    """Test a file is compressed based on its extension and read back transparently.
+
+    :param tmp_path: The temporary path fixture
+    :param name: The file name
+    :param magic: The expected first bytes of the file
+    """
+    file = tmp_path / name
+    content = {"res": ["ünïcödé"] * 100}
+    serialize_write_file(
+        content=content,
+        content_view=ContentView.NORMAL,
+        file_mode="w",
+        file=file,
+        serialization_format=SerializationFormat.JSON,
+    )
+    assert is_compressed(file) is (magic != b"{")
+    assert file.read_bytes().startswith(magic)
+    with open_file(file) as fh:
+        assert json.load(fh) == content